@@ -0,0 +1,96 @@
+"""
+Benchmark: distinct counts - exact nunique vs HyperLogLog sketches
+---------------------------------------------------------
+Counts distinct customer IDs per month the way the Sales Performance
+mart does, once with an exact groupby nunique and once with
+etl.sketches.grouped_sketches(), for several error bounds. Reports the
+time, the worst relative error across groups, the sketch size, and the
+cost of merging two sets of partial sketches (the incremental / chunked
+mart path, where exact counting has to keep every distinct key).
+
+Usage:
+    python -m benchmarks.bench_hll --rows 2000000 --groups 24
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from etl.sketches import (
+    grouped_sketches,
+    hll_precision,
+    merge_sketch_frames,
+    sketch_counts,
+)
+
+
+def make_rows(rows: int, groups: int, cardinality: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'month': rng.integers(0, groups, rows),
+        'customer_id': pd.Series(
+            rng.integers(0, cardinality, rows)
+        ).map('CUST{:07d}'.format).astype('category'),
+    })
+
+
+def time_call(func, *args, **kwargs) -> tuple:
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HyperLogLog benchmark")
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--groups", type=int, default=24)
+    parser.add_argument("--cardinality", type=int, default=500_000)
+    parser.add_argument("--errors", type=float, nargs="+", default=[0.05, 0.02, 0.01])
+    args = parser.parse_args()
+
+    df = make_rows(args.rows, args.groups, args.cardinality)
+    half = len(df) // 2
+
+    exact, exact_time = time_call(
+        lambda: df.groupby('month', observed=True)['customer_id'].nunique()
+    )
+    exact_partials, exact_merge_time = time_call(
+        lambda: pd.concat([
+            df.iloc[:half][['month', 'customer_id']].drop_duplicates(),
+            df.iloc[half:][['month', 'customer_id']].drop_duplicates(),
+        ]).drop_duplicates()
+    )
+
+    print(f"rows: {len(df):,}  groups: {args.groups}  "
+          f"distinct per group: ~{int(exact.mean()):,}")
+    print(f"exact nunique:          {exact_time * 1000:8.1f} ms")
+    print(f"exact partial merge:    {exact_merge_time * 1000:8.1f} ms  "
+          f"({len(exact_partials):,} distinct keys kept)")
+
+    for error in args.errors:
+        sketches, sketch_time = time_call(grouped_sketches, df, ['month'], 'customer_id', error)
+        counts = pd.Series(sketch_counts(sketches).to_numpy(), index=sketches['month'])
+        worst = ((counts - exact.reindex(counts.index)).abs() / exact.reindex(counts.index)).max()
+
+        left = grouped_sketches(df.iloc[:half], ['month'], 'customer_id', error)
+        right = grouped_sketches(df.iloc[half:], ['month'], 'customer_id', error)
+        merged, merge_time = time_call(merge_sketch_frames, left, right, ['month'])
+        if not (sketch_counts(merged).to_numpy()
+                == sketch_counts(sketches.set_index('month').loc[merged['month']].reset_index()).to_numpy()).all():
+            raise SystemExit("Merged sketches differ from the sketch of all rows")
+
+        precision = hll_precision(error)
+        print(f"hll error={error:<5} p={precision:<2} {sketch_time * 1000:8.1f} ms  "
+              f"max rel. error {worst:6.2%}  "
+              f"sketch {1 << precision:,} B/group  merge {merge_time * 1000:6.1f} ms  "
+              f"speedup {exact_time / sketch_time:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,16 +17,36 @@ GOOGLE_APPLICATION_CREDENTIALS = os.getenv(
 )
 BQ_DATASET = os.getenv("BQ_DATASET", "retail_dw")
 
+# Concurrent BigQuery load jobs per load stage
+BQ_LOAD_WORKERS = int(os.getenv("BQ_LOAD_WORKERS", 4))
+
+# BigQuery load path: "dataframe" (load_table_from_dataframe) or "parquet"
+# (serialize once to a local Parquet artifact, then load_table_from_file)
+BQ_LOAD_MODE = os.getenv("BQ_LOAD_MODE", "dataframe")
+
+# Time partitioning granularity of fact_sales / stg_retail_sales on the sale
+# date: "DAY" or "MONTH" (BigQuery allows 4,000 partitions per table, so use
+# MONTH for histories longer than ~10 years)
+BQ_PARTITION_TYPE = os.getenv("BQ_PARTITION_TYPE", "DAY")
+
 # Set credentials path for Google SDK
 os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = GOOGLE_APPLICATION_CREDENTIALS
 
 # ─── MySQL (Staging) ──────────────────────────────────────────────────
+# Bulk-load staging tables with LOAD DATA LOCAL INFILE (server must have
+# local_infile=ON); otherwise batched executemany INSERTs are used
+MYSQL_LOAD_DATA_INFILE = os.getenv("MYSQL_LOAD_DATA_INFILE", "false").lower() == "true"
+
 MYSQL_CONFIG = {
     "host": os.getenv("MYSQL_HOST", "localhost"),
     "port": int(os.getenv("MYSQL_PORT", 3306)),
     "user": os.getenv("MYSQL_USER", "root"),
     "password": os.getenv("MYSQL_PASSWORD", ""),
     "database": os.getenv("MYSQL_DATABASE", "retail_staging"),
+    "allow_local_infile": MYSQL_LOAD_DATA_INFILE,
+    # Process-wide connection pool shared by all staging operations
+    "pool_name": os.getenv("MYSQL_POOL_NAME", "retail_staging_pool"),
+    "pool_size": int(os.getenv("MYSQL_POOL_SIZE", 5)),
 }
 
 # ─── API Configuration ────────────────────────────────────────────────
@@ -34,11 +54,52 @@ FAKE_STORE_API_URL = os.getenv("FAKE_STORE_API_URL", "https://fakestoreapi.com")
 FAKE_STORE_PRODUCTS_ENDPOINT = f"{FAKE_STORE_API_URL}/products"
 FAKE_STORE_CATEGORIES_ENDPOINT = f"{FAKE_STORE_API_URL}/products/categories"
 
+# HTTP client: request timeout (seconds), concurrent requests, retries on
+# connection errors / 429 / 5xx with exponential backoff (base seconds)
+API_TIMEOUT = int(os.getenv("API_TIMEOUT", 30))
+API_MAX_WORKERS = int(os.getenv("API_MAX_WORKERS", 4))
+API_RETRIES = int(os.getenv("API_RETRIES", 3))
+API_BACKOFF_SEC = float(os.getenv("API_BACKOFF_SEC", 0.5))
+
 # ─── Data File Paths ──────────────────────────────────────────────────
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 RETAIL_SALES_CSV = os.path.join(
     BASE_DIR, os.getenv("RETAIL_SALES_CSV", "retail_sales_dataset.csv")
 )
+# Local working files (Parquet load artifacts, caches, state)
+ETL_ARTIFACT_DIR = os.path.join(
+    BASE_DIR, os.getenv("ETL_ARTIFACT_DIR", "artifacts")
+)
+
+# Parquet landing zone for raw extracts, partitioned as
+# landing/source=<source>/extract_date=<YYYY-MM-DD>/ (compression: zstd or snappy).
+# Only full extracts are landed; incremental runs skip the landing zone.
+ETL_LANDING_ZONE = os.getenv("ETL_LANDING_ZONE", "false").lower() == "true"
+LANDING_COMPRESSION = os.getenv("LANDING_COMPRESSION", "zstd")
+
+# On-disk HTTP response cache for API sources: responses younger than the
+# TTL are served without a request, older ones are revalidated with
+# If-None-Match / If-Modified-Since; least recently used entries are
+# evicted once the cache exceeds API_CACHE_MAX_MB
+API_CACHE_ENABLED = os.getenv("API_CACHE_ENABLED", "true").lower() == "true"
+API_CACHE_DIR = os.path.join(ETL_ARTIFACT_DIR, "http_cache")
+API_CACHE_TTL_SEC = int(os.getenv("API_CACHE_TTL_SEC", 3600))
+API_CACHE_MAX_MB = float(os.getenv("API_CACHE_MAX_MB", 50))
+
+# Client-side SCD Type 2 change detection: the last loaded row_hash per
+# natural key is kept as a Parquet snapshot, and only new / changed rows
+# are uploaded for the MERGE. Disable (or delete the snapshot) after
+# editing a dimension directly in BigQuery
+SCD_CHANGE_DETECTION = os.getenv("SCD_CHANGE_DETECTION", "true").lower() == "true"
+SCD_SNAPSHOT_DIR = os.path.join(ETL_ARTIFACT_DIR, "scd_snapshots")
+
+# Persistent surrogate key registry (one Parquet file per dimension mapping
+# natural keys to stable integer keys). Must be shared by every worker that
+# transforms data for the same dataset; delete it only together with a
+# full reload of the dimensions and fact_sales
+KEY_REGISTRY_DIR = os.getenv(
+    "KEY_REGISTRY_DIR", os.path.join(ETL_ARTIFACT_DIR, "keys")
+)
 
 # ─── BigQuery Table Names ─────────────────────────────────────────────
 # Staging tables
@@ -60,4 +121,36 @@ MART_CATEGORY_ANALYSIS = f"{GCP_PROJECT_ID}.{BQ_DATASET}.mart_category_analysis"
 
 # ─── ETL Configuration ────────────────────────────────────────────────
 ETL_BATCH_SIZE = 500
+# Rows per DataFrame chunk when streaming the retail sales CSV
+ETL_CHUNK_SIZE = int(os.getenv("ETL_CHUNK_SIZE", 100_000))
 ETL_LOG_LEVEL = os.getenv("ETL_LOG_LEVEL", "INFO")
+
+# Distinct counts in the data marts (unique customers / transactions):
+# "exact" (distinct keys kept in the mart partials) or "hll" (mergeable
+# HyperLogLog sketches with relative standard error HLL_ERROR)
+MART_DISTINCT_COUNTS = os.getenv("MART_DISTINCT_COUNTS", "exact")
+HLL_ERROR = float(os.getenv("HLL_ERROR", 0.01))
+
+# ─── Date Dimension ───────────────────────────────────────────────────
+# First month of the fiscal year; fiscal years are named after the
+# calendar year they end in (default October: FY2024 = Oct 2023 - Sep 2024)
+FISCAL_YEAR_START_MONTH = int(os.getenv("FISCAL_YEAR_START_MONTH", 10))
+# "gregorian" (fiscal periods follow calendar months) or a retail
+# week-based calendar: "445", "454" or "544"
+FISCAL_CALENDAR = os.getenv("FISCAL_CALENDAR", "gregorian")
+# Retail calendars: weekday the fiscal week/year ends on (0=Mon .. 6=Sun);
+# the fiscal year ends on the last such weekday of the month before
+# FISCAL_YEAR_START_MONTH
+FISCAL_WEEK_END_DAY = int(os.getenv("FISCAL_WEEK_END_DAY", 5))
+# Optional holiday calendar CSV with columns: date, holiday_name
+DIM_DATE_HOLIDAYS_FILE = os.getenv("DIM_DATE_HOLIDAYS_FILE", "")
+# Extra calendar years generated past the latest sales date
+DIM_DATE_FUTURE_YEARS = int(os.getenv("DIM_DATE_FUTURE_YEARS", 0))
+
+# ─── Dashboard ────────────────────────────────────────────────────────
+# Where the Sales Analytics page runs its filtered aggregate queries:
+# "sqlite" (in-memory copy of the local CSV) or "bigquery" (stg_retail_sales)
+DASHBOARD_QUERY_BACKEND = os.getenv("DASHBOARD_QUERY_BACKEND", "sqlite")
+# Row cap of Storage Read API table reads in the dashboard table browser
+# (0 = read whole tables)
+BQ_READ_MAX_ROWS = int(os.getenv("BQ_READ_MAX_ROWS", 10_000))
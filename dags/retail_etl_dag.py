@@ -16,6 +16,8 @@
   5. transform_data        – Build star-schema tables & data marts
   6. validate_transform    – Assert row counts & null rates post-transform
   7. load_to_bigquery      – Load all tables to BigQuery
+     (stages hand data over as Parquet artifacts keyed by run_id;
+      XCom only carries artifact paths and stats)
   8. validate_load         – Confirm BigQuery row counts match expectations
   9. pipeline_summary      – Push run metadata to XCom / log summary
  10. notify_success/fail   – Slack / email callback stubs
@@ -44,7 +46,6 @@ from airflow import DAG
 from airflow.models import Variable
 from airflow.operators.python import PythonOperator, BranchPythonOperator
 from airflow.operators.empty import EmptyOperator
-from airflow.operators.bash import BashOperator
 from airflow.utils.dates import days_ago
 from airflow.utils.trigger_rule import TriggerRule
 from airflow.exceptions import AirflowSkipException, AirflowFailException
@@ -78,6 +79,19 @@ DEFAULT_ARGS: dict[str, Any] = {
     "sla": timedelta(minutes=90),
 }
 
+# Tables produced by transform_all() and handed to load_all() as artifacts
+TRANSFORM_TABLES = (
+    "stg_retail_sales",
+    "stg_api_products",
+    "dim_date",
+    "dim_customer",
+    "dim_product",
+    "dim_product_category",
+    "fact_sales",
+    "mart_sales_performance",
+    "mart_category_analysis",
+)
+
 # ============================================================================
 # HELPER: Push / Pull serialisable stats through XCom
 # ============================================================================
@@ -186,10 +200,12 @@ def task_health_check(**context) -> None:
 # ----------------------------------------------------------------------------
 
 def task_extract_retail_sales(**context) -> None:
-    """Extract retail sales CSV and push summary stats to XCom."""
+    """Extract retail sales CSV, persist it as a run artifact and push stats + path to XCom."""
     from etl.extract import extract_retail_sales
+    from etl.artifacts import save_artifacts
 
     df = extract_retail_sales()
+    paths = save_artifacts(context["run_id"], "extract", {"retail_sales": df})
     stats = {
         "rows": len(df),
         "columns": list(df.columns),
@@ -203,15 +219,18 @@ def task_extract_retail_sales(**context) -> None:
     }
     _push_stats(context, "retail_sales_stats", stats)
     _push_stats(context, "retail_sales_rows", len(df))
+    _push_stats(context, "retail_sales_path", paths["retail_sales"])
     log.info("[EXTRACT] Retail sales: %d rows", len(df))
 
 
 def task_extract_api_products(**context) -> None:
-    """Extract product catalog from Fake Store API."""
+    """Extract product catalog from Fake Store API and persist it as a run artifact."""
     from etl.extract import extract_api_products
+    from etl.artifacts import save_artifacts
 
     try:
         df = extract_api_products()
+        paths = save_artifacts(context["run_id"], "extract", {"api_products": df})
         stats = {
             "rows": len(df),
             "categories": (
@@ -222,6 +241,7 @@ def task_extract_api_products(**context) -> None:
         }
         _push_stats(context, "api_products_stats", stats)
         _push_stats(context, "api_products_rows", len(df))
+        _push_stats(context, "api_products_path", paths["api_products"])
         log.info("[EXTRACT] API products: %d rows", len(df))
     except Exception as exc:
         log.warning("[EXTRACT] API products failed (%s) – skipping", exc)
@@ -230,12 +250,15 @@ def task_extract_api_products(**context) -> None:
 
 
 def task_extract_api_categories(**context) -> None:
-    """Extract product categories from Fake Store API."""
+    """Extract product categories from Fake Store API and persist them as a run artifact."""
     from etl.extract import extract_api_categories
+    from etl.artifacts import save_artifacts
 
     try:
         categories = extract_api_categories()
+        paths = save_artifacts(context["run_id"], "extract", {"api_categories": categories})
         _push_stats(context, "api_categories", categories)
+        _push_stats(context, "api_categories_path", paths["api_categories"])
         _push_stats(context, "api_categories_count", len(categories))
         log.info("[EXTRACT] API categories: %s", categories)
     except Exception as exc:
@@ -281,26 +304,47 @@ def task_validate_extract(**context) -> None:
 # 5. Transform
 # ----------------------------------------------------------------------------
 
+def _pull_artifact_paths(context, sources: dict[str, tuple[str, str]]) -> dict[str, str]:
+    """Pull artifact paths from XCom; fail if an upstream artifact is missing."""
+    paths = {}
+    for name, (task_id, key) in sources.items():
+        path = _pull_stats(context, task_id, key)
+        if not path or not Path(path).exists():
+            raise AirflowFailException(
+                f"Missing '{name}' artifact from task '{task_id}' (path: {path})"
+            )
+        paths[name] = path
+    return paths
+
+
 def task_transform_data(**context) -> None:
     """
-    Run the full transform suite and push table row-count map to XCom.
-    Uses the full extract_all() + transform_all() chain so transforms
-    always work on fresh in-memory data within the same Airflow task.
+    Run the full transform suite on the extract artifacts of this run,
+    persist every output table as a Parquet artifact and push the
+    artifact paths plus the table row-count map to XCom.
     """
-    from etl.extract import extract_all
+    from etl.artifacts import load_artifacts, save_artifacts
     from etl.transform import transform_all
 
     log.info("[TRANSFORM] Starting full transform pipeline ...")
     t0 = time.time()
 
-    extracted = extract_all()
-    transformed = transform_all(extracted)
+    extracted = load_artifacts(_pull_artifact_paths(context, {
+        "retail_sales": ("extract_retail_sales", "retail_sales_path"),
+        "api_products": ("extract_api_products", "api_products_path"),
+        "api_categories": ("extract_api_categories", "api_categories_path"),
+    }))
+    transformed = transform_all(extracted, run_id=context["run_id"])
+    paths = save_artifacts(context["run_id"], "transform", transformed)
 
     row_counts = {
         k: len(v) for k, v in transformed.items() if hasattr(v, "__len__")
     }
     duration = round(time.time() - t0, 2)
 
+    _push_stats(context, "transform_artifacts", paths)
+    for name in TRANSFORM_TABLES:
+        _push_stats(context, f"{name}_path", paths.get(name))
     _push_stats(context, "transform_row_counts", row_counts)
     _push_stats(context, "transform_duration_sec", duration)
     log.info(
@@ -362,20 +406,21 @@ def task_validate_transform(**context) -> None:
 
 def task_load_to_bigquery(**context) -> None:
     """
-    Re-run extract + transform in-memory (stateless workers),
-    then call load_all() to push everything to BigQuery.
-    Pushes load stats to XCom.
+    Load the transform artifacts of this run and call load_all() to
+    push everything to BigQuery. Pushes load stats to XCom.
     """
-    from etl.extract import extract_all
-    from etl.transform import transform_all
+    from etl.artifacts import load_artifacts
     from etl.load import load_all
+    from etl.transform import commit_mart_partials
 
     log.info("[LOAD] Starting BigQuery load ...")
     t0 = time.time()
 
-    extracted = extract_all()
-    transformed = transform_all(extracted)
+    transformed = load_artifacts(_pull_artifact_paths(context, {
+        name: ("transform_data", f"{name}_path") for name in TRANSFORM_TABLES
+    }))
     load_stats = load_all(transformed)
+    commit_mart_partials(context["run_id"])
 
     duration = round(time.time() - t0, 2)
     _push_stats(context, "load_stats", load_stats)
@@ -393,14 +438,14 @@ def task_load_to_bigquery(**context) -> None:
 
 def task_validate_load(**context) -> None:
     """
-    Query BigQuery to confirm row counts match what was loaded.
+    Confirm BigQuery row counts (table metadata) and that every fact row
+    resolved its surrogate keys (Storage Read API, key filter pushed down).
     Raises on any table with 0 rows.
     """
     try:
-        from google.cloud import bigquery
-        from config.settings import GCP_PROJECT_ID, BQ_DATASET
+        from etl.bq_reader import read_table, table_row_counts
+        from etl.transform import FACT_KEY_COLUMNS
 
-        client = bigquery.Client(project=GCP_PROJECT_ID)
         tables_to_check = [
             "stg_retail_sales",
             "dim_date",
@@ -412,19 +457,24 @@ def task_validate_load(**context) -> None:
             "mart_category_analysis",
         ]
 
-        bq_counts: dict[str, int] = {}
-        for table in tables_to_check:
-            query = f"""
-                SELECT COUNT(*) AS row_count
-                FROM `{GCP_PROJECT_ID}.{BQ_DATASET}.{table}`
-            """
-            result = client.query(query).result()
-            for row in result:
-                bq_counts[table] = row.row_count
+        bq_counts: dict[str, int] = table_row_counts(tables_to_check)
 
         _push_stats(context, "bq_row_counts", bq_counts)
         log.info("[VALIDATE-LOAD] BigQuery row counts:\n%s", json.dumps(bq_counts, indent=2))
 
+        unresolved = read_table(
+            "fact_sales",
+            columns=["sales_key"],
+            row_restriction=" OR ".join(f"{c} IS NULL" for c in FACT_KEY_COLUMNS),
+            max_rows=None,
+        )
+        _push_stats(context, "bq_unresolved_fact_keys", len(unresolved))
+        if len(unresolved):
+            log.warning(
+                "[VALIDATE-LOAD] %d fact_sales rows have unresolved surrogate keys",
+                len(unresolved),
+            )
+
         empty_tables = [t for t, c in bq_counts.items() if c == 0]
         if empty_tables:
             raise AirflowFailException(
@@ -432,7 +482,7 @@ def task_validate_load(**context) -> None:
             )
 
     except ImportError:
-        log.warning("[VALIDATE-LOAD] google-cloud-bigquery not installed; skipping BQ validation")
+        log.warning("[VALIDATE-LOAD] google-cloud-bigquery(-storage) not installed; skipping BQ validation")
     except Exception as exc:
         log.warning("[VALIDATE-LOAD] BigQuery validation skipped: %s", exc)
 
@@ -487,6 +537,38 @@ def task_pipeline_summary(**context) -> None:
     _push_stats(context, "summary", summary)
 
 
+def task_cleanup_old_logs(**context) -> None:
+    """
+    Remove JSON run-reports older than 30 days and run artifact
+    directories older than 7 days.
+    """
+    import shutil
+
+    from etl.artifacts import RUNS_DIR
+
+    now = time.time()
+    logs_dir = Path(PROJECT_ROOT) / "logs" / "airflow_runs"
+    reports = [
+        path for path in logs_dir.glob("*.json")
+        if now - path.stat().st_mtime > 30 * 86400
+    ] if logs_dir.is_dir() else []
+    for path in reports:
+        path.unlink(missing_ok=True)
+
+    runs_dir = Path(RUNS_DIR)
+    runs = [
+        path for path in runs_dir.iterdir()
+        if path.is_dir() and now - path.stat().st_mtime > 7 * 86400
+    ] if runs_dir.is_dir() else []
+    for path in runs:
+        shutil.rmtree(path, ignore_errors=True)
+
+    log.info(
+        "[CLEANUP] Removed %d run reports and %d run artifact directories",
+        len(reports), len(runs),
+    )
+
+
 # ----------------------------------------------------------------------------
 # 10. Notification callbacks
 # ----------------------------------------------------------------------------
@@ -634,14 +716,14 @@ with DAG(
     )
 
     # ── Convenience: log-cleanup bash task (weekly) ──────────────────────────
-    cleanup_old_logs = BashOperator(
+    cleanup_old_logs = PythonOperator(
         task_id="cleanup_old_logs",
-        bash_command=(
-            f"find {PROJECT_ROOT}/logs/airflow_runs -name '*.json' "
-            f"-mtime +30 -delete || true"
-        ),
+        python_callable=task_cleanup_old_logs,
         trigger_rule=TriggerRule.ALL_DONE,
-        doc_md="Remove JSON run-reports older than 30 days.",
+        doc_md=(
+            "Remove JSON run-reports older than 30 days and run "
+            "artifacts older than 7 days."
+        ),
     )
 
     # =========================================================================
@@ -0,0 +1,180 @@
+"""
+API CLIENT Module
+---------------------------------------------------------
+Shared HTTP client for the REST sources (Fake Store API).
+
+All requests go through one process-wide keep-alive session whose
+connection pool is sized for API_MAX_WORKERS, so concurrent fetches
+reuse TCP/TLS connections instead of opening one per call. Transient
+failures (connection errors, 429 and 5xx responses) are retried with
+exponential backoff, honouring Retry-After when the server sends it.
+GET responses are cached on disk and revalidated conditionally (see
+etl/http_cache.py).
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.settings import (
+    API_TIMEOUT,
+    API_MAX_WORKERS,
+    API_RETRIES,
+    API_BACKOFF_SEC,
+    API_CACHE_ENABLED,
+)
+from etl import http_cache
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+# =====================================================================
+# Session
+# =====================================================================
+
+def build_session(
+    max_workers: int = API_MAX_WORKERS,
+    retries: int = API_RETRIES,
+    backoff: float = API_BACKOFF_SEC
+) -> requests.Session:
+    """
+    Create a keep-alive session with retry/backoff on transient errors.
+
+    Args:
+        max_workers: Connections kept per host (matches fetch concurrency)
+        retries: Retries per request after the first attempt
+        backoff: Backoff base in seconds (sleep = backoff * 2 ** (retry - 1))
+
+    Returns:
+        requests.Session mounted for http:// and https://
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=max_workers,
+        pool_maxsize=max_workers,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({'Accept': 'application/json'})
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_session()
+    return _session
+
+
+# =====================================================================
+# Fetching
+# =====================================================================
+
+def fetch_json(
+    url: str,
+    session: Optional[requests.Session] = None,
+    timeout: int = API_TIMEOUT,
+    use_cache: bool = API_CACHE_ENABLED
+) -> Any:
+    """
+    GET a URL and decode its JSON body.
+
+    With ``use_cache`` the on-disk HTTP cache is consulted first: a fresh
+    entry is returned without a request, a stale one is revalidated with
+    a conditional GET and reused on 304 Not Modified. An entry evicted in
+    the meantime is a cache miss and the URL is fetched again. Cached
+    payloads are shared between callers and must not be mutated.
+
+    Raises:
+        requests.exceptions.RequestException once retries are exhausted
+    """
+    session = session or get_session()
+
+    entry = http_cache.get_entry(url) if use_cache else None
+    if entry and http_cache.is_fresh(entry):
+        try:
+            return http_cache.cached_payload(entry)
+        except FileNotFoundError:
+            entry = None
+
+    response = session.get(
+        url, headers=http_cache.conditional_headers(entry), timeout=timeout
+    )
+    if entry and response.status_code == 304:
+        try:
+            return http_cache.cached_payload(http_cache.revalidate(entry))
+        except FileNotFoundError:
+            logger.info(f"[CACHE] Entry evicted during revalidation: {url}")
+            response = session.get(url, timeout=timeout)
+
+    response.raise_for_status()
+    if use_cache:
+        http_cache.store(url, response)
+    return response.json()
+
+
+def fetch_many(
+    urls: dict,
+    max_workers: int = API_MAX_WORKERS,
+    session: Optional[requests.Session] = None
+) -> dict:
+    """
+    Fetch several JSON endpoints concurrently.
+
+    At most ``max_workers`` requests are in flight at once, so total
+    latency is roughly that of the slowest request rather than the sum.
+
+    Args:
+        urls: dict of name -> URL
+        max_workers: Maximum concurrent requests
+        session: Session to use (defaults to the shared session)
+
+    Returns:
+        dict of name -> decoded JSON, in the order of ``urls``
+
+    Raises:
+        The first request error, after every request has finished
+    """
+    session = session or get_session()
+    workers = max(1, min(max_workers, len(urls)))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            name: executor.submit(fetch_json, url, session)
+            for name, url in urls.items()
+        }
+
+    results = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"[ERROR] API request '{name}' failed: {e}")
+            raise
+    return results
@@ -0,0 +1,72 @@
+"""
+ARTIFACTS Module
+---------------------------------------------------------
+Local artifact store for handing intermediate results between
+separately executed pipeline stages (e.g. Airflow tasks).
+
+Each run gets its own directory under ETL_ARTIFACT_DIR/runs/<run_id>.
+DataFrames are written as Parquet and other JSON-serialisable values
+(such as the API category list) as JSON, so a stage only needs the
+returned path map - small enough for XCom - to pick up where the
+previous stage left off.
+"""
+
+import json
+import logging
+import os
+import re
+
+import pandas as pd
+
+from config.settings import ETL_ARTIFACT_DIR
+
+logger = logging.getLogger(__name__)
+
+RUNS_DIR = os.path.join(ETL_ARTIFACT_DIR, 'runs')
+
+
+def run_artifact_dir(run_id: str) -> str:
+    """Directory holding the artifacts of one run (run_id made path-safe)."""
+    return os.path.join(RUNS_DIR, re.sub(r'[^A-Za-z0-9_.-]', '_', run_id))
+
+
+def save_artifacts(run_id: str, stage: str, data: dict) -> dict:
+    """
+    Persist a stage's outputs for a run.
+
+    Args:
+        run_id: Pipeline / DAG run identifier
+        stage: Stage name, used as a sub-directory (e.g. 'extract')
+        data: dict of name -> DataFrame or JSON-serialisable value
+
+    Returns:
+        dict of name -> artifact path
+    """
+    stage_dir = os.path.join(run_artifact_dir(run_id), stage)
+    os.makedirs(stage_dir, exist_ok=True)
+
+    paths = {}
+    for name, value in data.items():
+        if isinstance(value, pd.DataFrame):
+            path = os.path.join(stage_dir, f"{name}.parquet")
+            value.to_parquet(path, index=False)
+        else:
+            path = os.path.join(stage_dir, f"{name}.json")
+            with open(path, 'w', encoding='utf-8') as fh:
+                json.dump(value, fh, default=str)
+        paths[name] = path
+
+    logger.info(f"[ARTIFACT] Saved {len(paths)} {stage} artifacts to {stage_dir}")
+    return paths
+
+
+def load_artifacts(paths: dict) -> dict:
+    """Load artifacts written by save_artifacts() back into memory."""
+    data = {}
+    for name, path in paths.items():
+        if path.endswith('.parquet'):
+            data[name] = pd.read_parquet(path)
+        else:
+            with open(path, 'r', encoding='utf-8') as fh:
+                data[name] = json.load(fh)
+    return data
@@ -0,0 +1,172 @@
+"""
+BIGQUERY READER Module
+---------------------------------------------------------
+Shared BigQuery clients and Storage Read API table reads.
+
+Readers (dashboard, load validation) go through one process-wide
+bigquery.Client and one BigQueryReadClient instead of creating a client
+per call. Table contents are read with the BigQuery Storage Read API as
+Arrow record batches: only the selected columns are sent, rows are
+filtered server-side by a row restriction, and reads can stop at an
+optional row cap instead of pulling the whole table through a SELECT *
+query job. google-cloud-bigquery and google-cloud-bigquery-storage are
+imported lazily, so importing this module never requires them.
+Row counts come from table metadata, without running a query.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+
+try:
+    from google.cloud import bigquery
+    BQ_AVAILABLE = True
+except ImportError:
+    BQ_AVAILABLE = False
+
+try:
+    from google.cloud import bigquery_storage
+    BQ_STORAGE_AVAILABLE = True
+except ImportError:
+    BQ_STORAGE_AVAILABLE = False
+
+from config.settings import BQ_DATASET, GCP_PROJECT_ID
+
+logger = logging.getLogger(__name__)
+
+_bq_client = None
+_read_client = None
+_clients_lock = threading.Lock()
+
+
+def _require_bigquery():
+    if not BQ_AVAILABLE:
+        raise ImportError(
+            "google-cloud-bigquery is not installed. "
+            "Install with: pip install google-cloud-bigquery"
+        )
+
+
+def _require_bq_storage():
+    if not BQ_STORAGE_AVAILABLE:
+        raise ImportError(
+            "google-cloud-bigquery-storage is not installed. "
+            "Install with: pip install google-cloud-bigquery-storage"
+        )
+
+
+# =====================================================================
+# Shared clients
+# =====================================================================
+
+def get_shared_bq_client() -> "bigquery.Client":
+    """Return the process-wide BigQuery client, creating it on first use."""
+    global _bq_client
+    _require_bigquery()
+    with _clients_lock:
+        if _bq_client is None:
+            _bq_client = bigquery.Client(project=GCP_PROJECT_ID)
+    return _bq_client
+
+
+def get_bq_read_client():
+    """Return the process-wide Storage Read API client (BigQueryReadClient)."""
+    global _read_client
+    _require_bq_storage()
+    with _clients_lock:
+        if _read_client is None:
+            _read_client = bigquery_storage.BigQueryReadClient()
+    return _read_client
+
+
+# =====================================================================
+# Reads
+# =====================================================================
+
+def table_path(table_name: str) -> str:
+    """Storage Read API path of a table in the warehouse dataset."""
+    return f"projects/{GCP_PROJECT_ID}/datasets/{BQ_DATASET}/tables/{table_name}"
+
+
+def read_table(
+    table_name: str,
+    columns: Optional[list] = None,
+    row_restriction: Optional[str] = None,
+    max_rows: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Read a warehouse table with the Storage Read API (Arrow format).
+
+    Args:
+        table_name: Table in BQ_DATASET, e.g. 'fact_sales'
+        columns: Columns to read (None for all)
+        row_restriction: SQL boolean filter applied server-side,
+            e.g. "sale_date >= '2023-06-01'" (None for all rows)
+        max_rows: Stop after this many rows (None or 0 for the whole
+            table, the default). A capped read uses a single stream;
+            which rows come first is not defined, and hitting the cap is
+            logged as a warning.
+
+    Returns:
+        pd.DataFrame with the selected columns
+    """
+    read_client = get_bq_read_client()
+    types = bigquery_storage.types
+    requested_session = types.ReadSession(
+        table=table_path(table_name),
+        data_format=types.DataFormat.ARROW,
+        read_options=types.ReadSession.TableReadOptions(
+            selected_fields=list(columns or []),
+            row_restriction=row_restriction or "",
+        ),
+    )
+    session = read_client.create_read_session(
+        parent=f"projects/{GCP_PROJECT_ID}",
+        read_session=requested_session,
+        max_stream_count=1 if max_rows else 0,
+    )
+
+    batches = []
+    n_rows = 0
+    for stream in session.streams:
+        reader = read_client.read_rows(stream.name)
+        for page in reader.rows(session).pages:
+            batch = page.to_arrow()
+            batches.append(batch)
+            n_rows += batch.num_rows
+            if max_rows and n_rows >= max_rows:
+                break
+        if max_rows and n_rows >= max_rows:
+            break
+
+    if batches:
+        table = pa.Table.from_batches(batches)
+    else:
+        schema = pa.ipc.read_schema(
+            pa.py_buffer(session.arrow_schema.serialized_schema)
+        )
+        table = schema.empty_table()
+    if max_rows and table.num_rows >= max_rows:
+        table = table.slice(0, max_rows)
+        logger.warning(
+            f"[READ] {table_name}: read capped at {max_rows} rows "
+            f"(arbitrary subset of the table)"
+        )
+
+    logger.info(
+        f"[READ] {table_name}: {table.num_rows} rows x {table.num_columns} columns "
+        f"({len(session.streams)} streams)"
+    )
+    return table.to_pandas()
+
+
+def table_row_counts(table_names: list) -> dict:
+    """Row count of every table, from table metadata (no query job)."""
+    client = get_shared_bq_client()
+    return {
+        name: client.get_table(f"{GCP_PROJECT_ID}.{BQ_DATASET}.{name}").num_rows
+        for name in table_names
+    }
@@ -0,0 +1,218 @@
+"""
+CUBE Module
+---------------------------------------------------------
+Pre-aggregated sales cube for the dashboard.
+
+The retail sales rows are aggregated once into cells keyed by
+CUBE_DIMENSIONS (month, day of week, product category, gender, age
+group). Every cell holds additive measures (sums, row counts, min/max),
+so any chart or KPI tile grouped by or filtered on those dimensions is
+answered by re-aggregating the few thousand cells instead of scanning
+the raw rows again. Averages are derived from sums and counts at slice
+time.
+
+Distinct customers are not additive across cells. They are kept next
+to the cells as distinct (cell, customer) pairs, which are never more
+than the raw rows. Per-cell HyperLogLog sketches (etl.sketches) are not
+used here: a sketch is as large as thousands of pairs, and most cells
+hold only a handful of customers.
+
+Transactions are counted per cell and summed: a transaction is one
+row of the retail dataset and falls into exactly one cell.
+
+Rows with a missing date, category, gender or age, or an age outside
+AGE_GROUP_BINS, are kept under an explicit UNKNOWN_MEMBER of that
+dimension rather than dropped, so cube totals equal raw totals.
+
+Usage:
+    cube = build_sales_cube(df_sales_raw)
+    slice_cube(cube, by=['month'], filters={'gender': ['Female']})
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from etl.transform import AGE_GROUP_BINS, AGE_GROUP_LABELS
+
+logger = logging.getLogger(__name__)
+
+CUBE_DIMENSIONS = ['month', 'day_of_week', 'product_category', 'gender', 'age_group']
+
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Dimension member of rows whose dimension value is missing or out of range
+UNKNOWN_MEMBER = 'Unknown'
+
+# Measure -> (raw column, aggregation); re-aggregated with the same function
+CUBE_MEASURES = {
+    'revenue': ('Total Amount', 'sum'),
+    'quantity': ('Quantity', 'sum'),
+    'price_sum': ('Price per Unit', 'sum'),
+    'age_sum': ('Age', 'sum'),
+    'orders': ('Total Amount', 'size'),
+    'transactions': ('Transaction ID', 'nunique'),
+    'max_order': ('Total Amount', 'max'),
+    'min_age': ('Age', 'min'),
+    'max_age': ('Age', 'max'),
+}
+
+_REAGGREGATE = {'size': 'sum', 'nunique': 'sum'}
+
+# Derived measure -> (numerator, denominator) measures
+DERIVED_MEASURES = {
+    'avg_order_value': ('revenue', 'orders'),
+    'avg_price': ('price_sum', 'orders'),
+    'avg_quantity': ('quantity', 'orders'),
+    'avg_age': ('age_sum', 'orders'),
+}
+
+
+# =====================================================================
+# BUILD
+# =====================================================================
+
+def _with_unknown(values: pd.Series) -> pd.Series:
+    """Categorical ``values`` with missing ones as UNKNOWN_MEMBER."""
+    values = values.astype('category')
+    if values.isna().any():
+        values = values.cat.add_categories([UNKNOWN_MEMBER]).fillna(UNKNOWN_MEMBER)
+    return values
+
+
+def cube_dimensions(df_raw: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cube dimension columns of raw retail sales rows (missing or
+    out-of-range values as UNKNOWN_MEMBER).
+    """
+    dates = pd.to_datetime(df_raw['Date'], errors='coerce')
+    day_codes = dates.dt.dayofweek.fillna(len(DAY_NAMES)).astype('int64')
+    return pd.DataFrame({
+        'month': dates.dt.strftime('%Y-%m').fillna(UNKNOWN_MEMBER),
+        'day_of_week': pd.Categorical.from_codes(
+            day_codes, categories=DAY_NAMES + [UNKNOWN_MEMBER], ordered=True,
+        ),
+        'product_category': _with_unknown(df_raw['Product Category']),
+        'gender': _with_unknown(df_raw['Gender']),
+        'age_group': _with_unknown(pd.cut(
+            df_raw['Age'], bins=AGE_GROUP_BINS, labels=AGE_GROUP_LABELS
+        )),
+    }, index=df_raw.index)
+
+
+def build_sales_cube(df_raw: pd.DataFrame) -> dict:
+    """
+    Aggregate raw retail sales rows (CSV column names) into a cube.
+
+    Args:
+        df_raw: Retail sales rows as returned by read_retail_sales_csv()
+
+    Returns:
+        dict with 'cells' (one row per non-empty cell: CUBE_DIMENSIONS
+        plus the CUBE_MEASURES columns) and 'customers' (distinct
+        (cell, customer_id) pairs)
+    """
+    rows = cube_dimensions(df_raw)
+    measure_columns = {column for column, _ in CUBE_MEASURES.values()}
+    rows = rows.join(df_raw[sorted(measure_columns)])
+    rows['customer_id'] = df_raw['Customer ID']
+
+    cells = rows.groupby(CUBE_DIMENSIONS, observed=True, as_index=False).agg(
+        **CUBE_MEASURES
+    )
+    customers = rows[CUBE_DIMENSIONS + ['customer_id']].dropna(
+        subset=['customer_id']
+    ).drop_duplicates(ignore_index=True)
+
+    logger.info(
+        f"[CUBE] {len(df_raw)} rows -> {len(cells)} cells, "
+        f"{len(customers)} (cell, customer) pairs"
+    )
+    return {'cells': cells, 'customers': customers}
+
+
+# =====================================================================
+# SLICE
+# =====================================================================
+
+def _filter(frame: pd.DataFrame, filters: Optional[dict]) -> pd.DataFrame:
+    """Rows of a cube frame whose dimensions are in the filter values."""
+    if not filters:
+        return frame
+    mask = np.ones(len(frame), dtype=bool)
+    for dimension, values in filters.items():
+        mask &= frame[dimension].isin(list(values)).to_numpy()
+    return frame[mask]
+
+
+def _count_customers(customers: pd.DataFrame, by: list) -> pd.DataFrame:
+    """Distinct customers per ``by`` group of a (filtered) customers frame."""
+    if not by:
+        return pd.DataFrame({'unique_customers': [customers['customer_id'].nunique()]})
+    return customers.groupby(
+        by, observed=True
+    )['customer_id'].nunique().rename('unique_customers').reset_index()
+
+
+def derive_measures(result: pd.DataFrame) -> pd.DataFrame:
+    """Add the DERIVED_MEASURES whose inputs are columns of ``result``."""
+    for name, (numerator, denominator) in DERIVED_MEASURES.items():
+        if numerator in result.columns and denominator in result.columns:
+            counts = result[denominator]
+            result[name] = result[numerator] / counts.where(counts > 0)
+    return result
+
+
+def slice_cube(
+    cube: dict,
+    by: Optional[list] = None,
+    filters: Optional[dict] = None
+) -> pd.DataFrame:
+    """
+    Roll the cube up to the ``by`` dimensions.
+
+    Args:
+        cube: Cube from build_sales_cube()
+        by: Dimensions to group by (None or [] for grand totals)
+        filters: dict of dimension -> allowed values
+
+    Returns:
+        pd.DataFrame with the ``by`` columns (sorted), the CUBE_MEASURES
+        columns and avg_order_value, avg_price, avg_quantity, avg_age and
+        unique_customers. Grand totals are a single row.
+    """
+    by = list(by or [])
+    cells = _filter(cube['cells'], filters)
+    aggregations = {
+        name: _REAGGREGATE.get(func, func)
+        for name, (_, func) in CUBE_MEASURES.items()
+    }
+
+    if by:
+        result = cells.groupby(by, observed=True, as_index=False).agg(aggregations)
+    else:
+        result = pd.DataFrame({
+            name: [cells[name].agg(func)] for name, func in aggregations.items()
+        })
+
+    result = derive_measures(result)
+    customers = _count_customers(_filter(cube['customers'], filters), by)
+    if by:
+        result = result.merge(customers, on=by, how='left')
+    else:
+        result['unique_customers'] = customers['unique_customers'].iloc[0]
+    result['unique_customers'] = result['unique_customers'].fillna(0).astype('int64')
+    return result
+
+
+def cube_members(cube: dict, dimension: str) -> list:
+    """
+    Sorted members of a dimension present in the cube (UNKNOWN_MEMBER
+    last, when present).
+    """
+    values = cube['cells'][dimension]
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.remove_unused_categories().cat.categories.tolist()
+    return sorted(values.unique())
@@ -0,0 +1,330 @@
+"""
+DATE DIMENSION Module
+---------------------------------------------------------
+Vectorized calendar generator behind dim_date.
+
+Every attribute is derived with NumPy arithmetic on datetime64[D] /
+year / month arrays - no per-row Python calls - so decades of history
+plus a planning horizon build in milliseconds.
+
+Fiscal attributes support two calendar styles:
+  gregorian  fiscal periods follow calendar months, starting in
+             fiscal_year_start_month
+  445 / 454 / 544
+             retail week-based calendar: 52/53-week fiscal years ending
+             on the last ``week_end_day`` of the month before
+             fiscal_year_start_month, split into 12 periods of 4/4/5
+             (or 4/5/4, 5/4/4) weeks; a 53rd week joins period 12
+
+Fiscal years are named after the calendar year they end in.
+
+Generated calendars are cached as Parquet under ETL_ARTIFACT_DIR/dim_date,
+keyed by (start year, end year, fiscal config, holidays), so steady-state
+runs read the calendar instead of rebuilding it.
+"""
+
+import hashlib
+import logging
+import os
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from config.settings import (
+    BASE_DIR,
+    ETL_ARTIFACT_DIR,
+    FISCAL_YEAR_START_MONTH,
+    FISCAL_CALENDAR,
+    FISCAL_WEEK_END_DAY,
+    DIM_DATE_HOLIDAYS_FILE,
+)
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_CACHE_DIR = os.path.join(ETL_ARTIFACT_DIR, 'dim_date')
+
+FISCAL_CALENDARS = ('gregorian', '445', '454', '544')
+
+MONTH_NAMES = np.array([
+    'January', 'February', 'March', 'April', 'May', 'June', 'July',
+    'August', 'September', 'October', 'November', 'December',
+])
+DAY_NAMES = np.array([
+    'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday',
+    'Saturday', 'Sunday',
+])
+
+
+# =====================================================================
+# Array helpers
+# =====================================================================
+
+def _years(days: np.ndarray) -> np.ndarray:
+    return days.astype('datetime64[Y]').astype(np.int64) + 1970
+
+
+def _months(days: np.ndarray) -> np.ndarray:
+    return days.astype('datetime64[M]').astype(np.int64) % 12 + 1
+
+
+def _weekdays(days: np.ndarray) -> np.ndarray:
+    # 1970-01-01 was a Thursday; Monday = 0
+    return (days.astype(np.int64) + 3) % 7
+
+
+def _month_start(years: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """datetime64[D] of the first day of each (year, month)."""
+    return (
+        ((years - 1970) * 12 + (months - 1)).astype('datetime64[M]')
+        .astype('datetime64[D]')
+    )
+
+
+def _iso_weeks(days: np.ndarray, weekdays: np.ndarray) -> np.ndarray:
+    # The ISO week belongs to the year of its Thursday
+    thursdays = days + (3 - weekdays)
+    jan_first = thursdays.astype('datetime64[Y]').astype('datetime64[D]')
+    return (thursdays - jan_first).astype(np.int64) // 7 + 1
+
+
+# =====================================================================
+# Fiscal calendars
+# =====================================================================
+
+def _gregorian_fiscal(
+    days: np.ndarray,
+    years: np.ndarray,
+    months: np.ndarray,
+    start_month: int
+) -> dict:
+    """Fiscal periods aligned to calendar months."""
+    fiscal_year = years + (months >= start_month) if start_month > 1 else years
+    fiscal_month = (months - start_month) % 12 + 1
+    fiscal_start = _month_start(
+        fiscal_year - (1 if start_month > 1 else 0),
+        np.full_like(months, start_month),
+    )
+    return {
+        'fiscal_year': fiscal_year,
+        'fiscal_quarter': (fiscal_month - 1) // 3 + 1,
+        'fiscal_month': fiscal_month,
+        'fiscal_week': (days - fiscal_start).astype(np.int64) // 7 + 1,
+    }
+
+
+def _retail_fiscal(
+    days: np.ndarray,
+    years: np.ndarray,
+    start_month: int,
+    pattern: str,
+    week_end_day: int
+) -> dict:
+    """Week-based 4-4-5 style retail calendar."""
+    # Fiscal year ends for every candidate label around the range
+    labels = np.arange(years.min() - 1, years.max() + 2)
+    end_months = np.full_like(labels, 12 if start_month == 1 else start_month - 1)
+    last_days = _month_start(labels + (end_months == 12), end_months % 12 + 1) - 1
+    year_ends = last_days - (_weekdays(last_days) - week_end_day) % 7
+
+    # First year end on/after each day gives its fiscal year
+    idx = np.searchsorted(year_ends, days)
+    day_of_year = (days - year_ends[idx - 1]).astype(np.int64) - 1
+    fiscal_week = day_of_year // 7 + 1
+
+    period_ends = np.cumsum([int(weeks) for weeks in pattern] * 4)
+    fiscal_month = np.minimum(np.searchsorted(period_ends, fiscal_week) + 1, 12)
+    return {
+        'fiscal_year': labels[idx],
+        'fiscal_quarter': (fiscal_month - 1) // 3 + 1,
+        'fiscal_month': fiscal_month,
+        'fiscal_week': fiscal_week,
+    }
+
+
+# =====================================================================
+# Holidays
+# =====================================================================
+
+def load_holidays(path: str = DIM_DATE_HOLIDAYS_FILE) -> Optional[pd.DataFrame]:
+    """
+    Load the holiday calendar CSV (columns: date, holiday_name).
+
+    Relative paths are resolved against the project root. Returns None
+    when no holiday file is configured.
+    """
+    if not path:
+        return None
+    if not os.path.isabs(path):
+        path = os.path.join(BASE_DIR, path)
+    holidays = pd.read_csv(path)
+    holidays['date'] = pd.to_datetime(holidays['date'])
+    logger.info(f"[DIM] Loaded {len(holidays)} holidays from {path}")
+    return holidays
+
+
+def _holiday_names(
+    days: np.ndarray,
+    holidays: Optional[Union[pd.DataFrame, dict]]
+) -> np.ndarray:
+    names = np.full(len(days), None, dtype=object)
+    if holidays is None or len(holidays) == 0:
+        return names
+    if isinstance(holidays, dict):
+        holidays = pd.DataFrame({
+            'date': list(holidays.keys()),
+            'holiday_name': list(holidays.values()),
+        })
+
+    holiday_days = pd.to_datetime(holidays['date']).values.astype('datetime64[D]')
+    positions = pd.Index(days).get_indexer(holiday_days)
+    found = positions >= 0
+    names[positions[found]] = holidays['holiday_name'].to_numpy()[found]
+    return names
+
+
+# =====================================================================
+# Calendar generator
+# =====================================================================
+
+def build_calendar(
+    start_date,
+    end_date,
+    fiscal_year_start_month: int = FISCAL_YEAR_START_MONTH,
+    fiscal_calendar: str = FISCAL_CALENDAR,
+    week_end_day: int = FISCAL_WEEK_END_DAY,
+    holidays: Optional[Union[pd.DataFrame, dict]] = None
+) -> pd.DataFrame:
+    """
+    Generate one dim_date row per day between start_date and end_date.
+
+    Args:
+        start_date: First day (inclusive)
+        end_date: Last day (inclusive)
+        fiscal_year_start_month: First month of the fiscal year (1-12)
+        fiscal_calendar: 'gregorian', '445', '454' or '544'
+        week_end_day: Retail calendars: weekday weeks end on (0=Mon .. 6=Sun)
+        holidays: DataFrame (date, holiday_name) or dict of date -> name
+
+    Returns:
+        pd.DataFrame with the dim_date columns
+    """
+    if fiscal_calendar not in FISCAL_CALENDARS:
+        raise ValueError(
+            f"Unknown fiscal calendar '{fiscal_calendar}' "
+            f"(expected one of {FISCAL_CALENDARS})"
+        )
+    if not 1 <= fiscal_year_start_month <= 12:
+        raise ValueError(f"Invalid fiscal year start month: {fiscal_year_start_month}")
+
+    days = np.arange(
+        np.datetime64(pd.Timestamp(start_date).date(), 'D'),
+        np.datetime64(pd.Timestamp(end_date).date(), 'D') + 1,
+    )
+    years = _years(days)
+    months = _months(days)
+    day_of_month = (days - days.astype('datetime64[M]')).astype(np.int64) + 1
+    weekdays = _weekdays(days)
+
+    if fiscal_calendar == 'gregorian':
+        fiscal = _gregorian_fiscal(days, years, months, fiscal_year_start_month)
+    else:
+        fiscal = _retail_fiscal(
+            days, years, fiscal_year_start_month, fiscal_calendar, week_end_day
+        )
+    holiday_names = _holiday_names(days, holidays)
+
+    return pd.DataFrame({
+        'full_date': days.astype('datetime64[ns]'),
+        'date_key': years * 10000 + months * 100 + day_of_month,
+        'year': years,
+        'quarter': (months - 1) // 3 + 1,
+        'month': months,
+        'month_name': MONTH_NAMES[months - 1],
+        'week_of_year': _iso_weeks(days, weekdays),
+        'day_of_month': day_of_month,
+        'day_of_week': weekdays,
+        'day_name': DAY_NAMES[weekdays],
+        'is_weekend': weekdays >= 5,
+        'fiscal_year': fiscal['fiscal_year'],
+        'fiscal_quarter': fiscal['fiscal_quarter'],
+        'fiscal_month': fiscal['fiscal_month'],
+        'fiscal_week': fiscal['fiscal_week'],
+        'is_holiday': pd.notna(holiday_names),
+        'holiday_name': holiday_names,
+    })
+
+
+# =====================================================================
+# Calendar cache
+# =====================================================================
+
+def _holidays_digest(holidays: Optional[Union[pd.DataFrame, dict]]) -> str:
+    if holidays is None or len(holidays) == 0:
+        return 'none'
+    if isinstance(holidays, dict):
+        pairs = holidays.items()
+    else:
+        pairs = zip(holidays['date'], holidays['holiday_name'])
+    text = '|'.join(sorted(f"{pd.Timestamp(d).date()}={name}" for d, name in pairs))
+    return hashlib.md5(text.encode()).hexdigest()[:8]
+
+
+def calendar_key(
+    start_year: int,
+    end_year: int,
+    fiscal_year_start_month: int = FISCAL_YEAR_START_MONTH,
+    fiscal_calendar: str = FISCAL_CALENDAR,
+    week_end_day: int = FISCAL_WEEK_END_DAY,
+    holidays: Optional[Union[pd.DataFrame, dict]] = None
+) -> str:
+    """Cache key identifying a generated calendar."""
+    return (
+        f"{start_year}_{end_year}_fy{fiscal_year_start_month}_"
+        f"{fiscal_calendar}_we{week_end_day}_h{_holidays_digest(holidays)}"
+    )
+
+
+def calendar_fingerprint(dim_date: pd.DataFrame) -> str:
+    """
+    Content fingerprint of a dim_date frame (lowercase hex, usable as a
+    BigQuery label value) for skip-if-unchanged reloads.
+    """
+    row_hashes = pd.util.hash_pandas_object(dim_date, index=False)
+    return hashlib.md5(row_hashes.to_numpy().tobytes()).hexdigest()
+
+
+def build_calendar_cached(
+    start_year: int,
+    end_year: int,
+    fiscal_year_start_month: int = FISCAL_YEAR_START_MONTH,
+    fiscal_calendar: str = FISCAL_CALENDAR,
+    week_end_day: int = FISCAL_WEEK_END_DAY,
+    holidays: Optional[Union[pd.DataFrame, dict]] = None,
+    cache_dir: str = CALENDAR_CACHE_DIR
+) -> pd.DataFrame:
+    """
+    Return the calendar for full years start_year..end_year, reading it
+    from the Parquet cache when an identical calendar was built before.
+    """
+    key = calendar_key(
+        start_year, end_year, fiscal_year_start_month,
+        fiscal_calendar, week_end_day, holidays
+    )
+    path = os.path.join(cache_dir, f"dim_date_{key}.parquet")
+
+    if os.path.exists(path):
+        logger.info(f"[DIM] Date dimension read from cache: {path}")
+        return pd.read_parquet(path)
+
+    dim_date = build_calendar(
+        pd.Timestamp(year=start_year, month=1, day=1),
+        pd.Timestamp(year=end_year, month=12, day=31),
+        fiscal_year_start_month, fiscal_calendar, week_end_day, holidays,
+    )
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    dim_date.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    logger.info(f"[DIM] Date dimension cached to {path}")
+    return dim_date
@@ -7,23 +7,156 @@ Extracts data from two sources:
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import requests
 import logging
 from datetime import datetime
+from typing import Iterable, Iterator, Optional, Tuple
 
 from config.settings import (
+    BQ_PARTITION_TYPE,
     RETAIL_SALES_CSV,
+    ETL_CHUNK_SIZE,
+    ETL_LANDING_ZONE,
     FAKE_STORE_PRODUCTS_ENDPOINT,
     FAKE_STORE_CATEGORIES_ENDPOINT,
 )
+from etl.api_client import fetch_json, fetch_many
+from etl.landing import LANDING_SOURCES, write_landing
+from etl.state import get_watermark
 
 logger = logging.getLogger(__name__)
 
+# State-store key for the retail sales watermark
+RETAIL_SALES_SOURCE = 'retail_sales'
+
+# Declared source schema of the retail sales CSV. Types are fixed up
+# front (no sniffing) and Date is parsed once, at read time.
+RETAIL_SALES_SCHEMA = {
+    'Transaction ID': pa.int64(),
+    'Date': pa.timestamp('us'),
+    'Customer ID': pa.string(),
+    'Gender': pa.string(),
+    'Age': pa.int64(),
+    'Product Category': pa.string(),
+    'Quantity': pa.int64(),
+    'Price per Unit': pa.float64(),
+    'Total Amount': pa.float64(),
+}
+RETAIL_SALES_DATE_FORMAT = '%Y-%m-%d'
+
+# Columns read as text and coerced by the lenient parse, so a malformed
+# value becomes null instead of failing the read. Transaction ID stays
+# strict: rows are tracked by it (watermark, sales_key registry).
+RETAIL_SALES_LENIENT_COLUMNS = [
+    'Date', 'Age', 'Quantity', 'Price per Unit', 'Total Amount',
+]
+
 
 # =====================================================================
 # Source 1: Kaggle Retail Sales CSV
 # =====================================================================
 
+def _csv_convert_options(lenient: bool = False) -> pa_csv.ConvertOptions:
+    """
+    Arrow CSV conversion options for RETAIL_SALES_SCHEMA (with
+    RETAIL_SALES_LENIENT_COLUMNS as text if ``lenient``).
+    """
+    column_types = dict(RETAIL_SALES_SCHEMA)
+    if lenient:
+        column_types.update(
+            {col: pa.string() for col in RETAIL_SALES_LENIENT_COLUMNS}
+        )
+    return pa_csv.ConvertOptions(
+        column_types=column_types,
+        timestamp_parsers=[RETAIL_SALES_DATE_FORMAT],
+        strings_can_be_null=True,
+    )
+
+
+def _parse_lenient(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Lenient parse of RETAIL_SALES_LENIENT_COLUMNS: dates not in
+    RETAIL_SALES_DATE_FORMAT become NaT and non-numeric values NaN.
+    """
+    df['Date'] = pd.to_datetime(
+        df['Date'], format=RETAIL_SALES_DATE_FORMAT, errors='coerce'
+    )
+    for col in RETAIL_SALES_LENIENT_COLUMNS[1:]:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+        if pa.types.is_floating(RETAIL_SALES_SCHEMA[col]):
+            df[col] = df[col].astype('float64')
+    return df
+
+
+def read_retail_sales_csv(path: str = RETAIL_SALES_CSV) -> pd.DataFrame:
+    """
+    Read the whole retail sales CSV with the multi-threaded Arrow CSV
+    reader and the declared RETAIL_SALES_SCHEMA.
+    
+    If a Date value does not match RETAIL_SALES_DATE_FORMAT, or an Age,
+    Quantity, Price per Unit or Total Amount value is not a number, the
+    file is re-read with those columns as text and parsed leniently, so
+    invalid values become NaT / NaN (and are dropped or flagged in
+    cleaning) instead of failing the run.
+    """
+    read_options = pa_csv.ReadOptions(use_threads=True)
+    try:
+        table = pa_csv.read_csv(
+            path, read_options=read_options,
+            convert_options=_csv_convert_options(),
+        )
+        return table.to_pandas()
+    except pa.ArrowInvalid as e:
+        logger.warning(
+            f"[WARN] Strict CSV parse failed ({e}); "
+            f"re-reading with lenient date and number parsing"
+        )
+        table = pa_csv.read_csv(
+            path, read_options=read_options,
+            convert_options=_csv_convert_options(lenient=True),
+        )
+        return _parse_lenient(table.to_pandas())
+
+
+def iter_retail_sales_csv(
+    chunksize: int,
+    path: str = RETAIL_SALES_CSV
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream the retail sales CSV as DataFrames of ``chunksize`` rows with
+    the declared RETAIL_SALES_SCHEMA. RETAIL_SALES_LENIENT_COLUMNS are
+    parsed per chunk with the lenient parser, since a streaming read
+    cannot be restarted.
+    """
+    reader = pa_csv.open_csv(
+        path, convert_options=_csv_convert_options(lenient=True)
+    )
+    pending = []
+    pending_rows = 0
+    offset = 0
+    
+    def to_frame(table: pa.Table) -> pd.DataFrame:
+        df = _parse_lenient(table.to_pandas())
+        df.index = pd.RangeIndex(offset, offset + len(df))
+        return df
+    
+    for batch in reader:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        while pending_rows >= chunksize:
+            table = pa.Table.from_batches(pending)
+            yield to_frame(table.slice(0, chunksize))
+            offset += chunksize
+            rest = table.slice(chunksize)
+            pending = rest.to_batches()
+            pending_rows = rest.num_rows
+    
+    if pending_rows:
+        yield to_frame(pa.Table.from_batches(pending))
+
+
 def extract_retail_sales() -> pd.DataFrame:
     """
     Extract retail sales data from the local CSV dataset.
@@ -36,7 +169,7 @@ def extract_retail_sales() -> pd.DataFrame:
     logger.info(f"[CSV] Extracting retail sales data from: {RETAIL_SALES_CSV}")
     
     try:
-        df = pd.read_csv(RETAIL_SALES_CSV)
+        df = read_retail_sales_csv(RETAIL_SALES_CSV)
         df['_extracted_at'] = datetime.utcnow()
         df['_source'] = 'kaggle_retail_sales'
         
@@ -55,42 +188,225 @@ def extract_retail_sales() -> pd.DataFrame:
         raise
 
 
+def extract_retail_sales_chunks(
+    chunksize: Optional[int] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream retail sales data from the local CSV dataset in bounded chunks.
+    
+    Only one chunk is held in memory at a time, so peak memory depends on
+    the chunk size rather than the size of the export.
+    
+    Args:
+        chunksize: Rows per chunk (defaults to ETL_CHUNK_SIZE)
+        
+    Yields:
+        pd.DataFrame chunks with the same columns as extract_retail_sales()
+    """
+    chunksize = chunksize or ETL_CHUNK_SIZE
+    logger.info(
+        f"[CSV] Streaming retail sales data from: {RETAIL_SALES_CSV} "
+        f"({chunksize} rows per chunk)"
+    )
+    
+    total_rows = 0
+    chunk_count = 0
+    try:
+        for chunk in iter_retail_sales_csv(chunksize, RETAIL_SALES_CSV):
+            chunk['_extracted_at'] = datetime.utcnow()
+            chunk['_source'] = 'kaggle_retail_sales'
+            total_rows += len(chunk)
+            chunk_count += 1
+            yield chunk
+                
+    except FileNotFoundError:
+        logger.error(f"[ERROR] CSV file not found: {RETAIL_SALES_CSV}")
+        raise
+    
+    logger.info(
+        f"[OK] Streamed {total_rows} retail sales records "
+        f"in {chunk_count} chunks"
+    )
+
+
+def extract_retail_sales_incremental(
+    watermark: Optional[dict] = None
+) -> pd.DataFrame:
+    """
+    Extract only retail sales rows newer than the given watermark.
+    
+    The CSV is streamed in chunks and filtered on Transaction ID, so only
+    the delta is held in memory.
+    
+    Args:
+        watermark: Previous high-water mark (see retail_sales_watermark());
+            None extracts everything
+        
+    Returns:
+        pd.DataFrame with the same columns as extract_retail_sales()
+    """
+    last_id = watermark['transaction_id'] if watermark else None
+    logger.info(
+        f"[CSV] Incremental extract of retail sales after "
+        f"Transaction ID {last_id}"
+    )
+    
+    chunks = []
+    for chunk in extract_retail_sales_chunks():
+        if last_id is not None:
+            chunk = chunk[chunk['Transaction ID'] > last_id]
+        if not chunk.empty:
+            chunks.append(chunk)
+    
+    if not chunks:
+        logger.info("[OK] No new retail sales records since last run")
+        return pd.DataFrame()
+    
+    df = pd.concat(chunks, ignore_index=True)
+    logger.info(f"[OK] Extracted {len(df)} new retail sales records")
+    logger.info(f"   Date range: {df['Date'].min()} to {df['Date'].max()}")
+    return df
+
+
+# BigQuery time partitioning granularity -> pandas period of one partition
+PARTITION_PERIODS = {
+    'DAY': 'D',
+    'MONTH': 'M',
+}
+
+
+def extract_retail_sales_for_dates(
+    dates: Iterable,
+    partition_type: str = BQ_PARTITION_TYPE
+) -> pd.DataFrame:
+    """
+    Extract every retail sales row in the sale-date partitions of ``dates``.
+    
+    Used to rebuild whole sale-date partitions: unlike the watermark
+    delta, the result holds all source rows of those partitions,
+    including rows loaded by earlier runs. With MONTH partitioning a date
+    selects its whole month, since the month partition is rewritten as
+    a unit.
+    
+    Args:
+        dates: Sale dates (anything pd.Timestamp accepts)
+        partition_type: Partitioning of the target tables ('DAY' or 'MONTH')
+        
+    Returns:
+        pd.DataFrame with the same columns as extract_retail_sales()
+    """
+    if partition_type not in PARTITION_PERIODS:
+        raise ValueError(
+            f"Cannot rebuild {partition_type} partitions; "
+            f"supported: {sorted(PARTITION_PERIODS)}"
+        )
+    period = PARTITION_PERIODS[partition_type]
+    partitions = pd.PeriodIndex(
+        sorted({pd.Timestamp(d).to_period(period) for d in dates})
+    )
+    logger.info(
+        f"[CSV] Extracting all retail sales of {len(partitions)} "
+        f"{partition_type.lower()} partitions: {[str(p) for p in partitions]}"
+    )
+    
+    chunks = []
+    for chunk in extract_retail_sales_chunks():
+        chunk = chunk[
+            pd.to_datetime(chunk['Date']).dt.to_period(period).isin(partitions)
+        ]
+        if not chunk.empty:
+            chunks.append(chunk)
+    
+    if not chunks:
+        logger.info("[OK] No retail sales records on those dates")
+        return pd.DataFrame()
+    
+    df = pd.concat(chunks, ignore_index=True)
+    logger.info(f"[OK] Extracted {len(df)} retail sales records")
+    return df
+
+
+def retail_sales_watermark(
+    df: pd.DataFrame,
+    previous: Optional[dict] = None
+) -> Optional[dict]:
+    """
+    Compute the new high-water mark after extracting ``df``.
+    
+    Tracks the max Transaction ID and Date processed, the first Date ever
+    seen (so the date dimension keeps covering full history) and the
+    number of fact rows loaded so far.
+    """
+    if df.empty:
+        return previous
+    
+    dates = pd.to_datetime(df['Date'], errors='coerce')
+    transaction_id = int(df['Transaction ID'].max())
+    first_date = str(dates.min().date())
+    last_date = str(dates.max().date())
+    if previous:
+        # Rebuilt partitions may only hold rows below the previous mark
+        transaction_id = max(transaction_id, previous['transaction_id'])
+        first_date = min(first_date, previous['first_date'])
+        last_date = max(last_date, previous['date'])
+    
+    return {
+        'transaction_id': transaction_id,
+        'date': last_date,
+        'first_date': first_date,
+        'fact_rows': (previous or {}).get('fact_rows', 0),
+        'updated_at': datetime.utcnow().isoformat(),
+    }
+
+
 # =====================================================================
 # Source 2: Fake Store API (Product Catalog)
 # =====================================================================
 
-def extract_api_products() -> pd.DataFrame:
+def products_frame(products: list) -> pd.DataFrame:
     """
-    Extract product catalog data from the Fake Store API.
+    Convert the Fake Store API product payload to a DataFrame.
     
+    Args:
+        products: Decoded JSON list from the /products endpoint
+        
     Returns:
         pd.DataFrame with columns:
             id, title, price, description, category, image,
             rating_rate, rating_count
     """
+    # Flatten the nested rating object (without mutating the payload,
+    # which may be shared with the HTTP cache)
+    rows = []
+    for product in products:
+        row = {k: v for k, v in product.items() if k != 'rating'}
+        rating = product.get('rating') or {}
+        row['rating_rate'] = rating.get('rate', 0.0)
+        row['rating_count'] = rating.get('count', 0)
+        rows.append(row)
+    
+    df = pd.DataFrame(rows)
+    df['_extracted_at'] = datetime.utcnow()
+    df['_source'] = 'fake_store_api'
+    
+    logger.info(f"[OK] Extracted {len(df)} products from API")
+    logger.info(f"   Categories: {df['category'].unique().tolist()}")
+    logger.info(f"   Price range: ${df['price'].min():.2f} - ${df['price'].max():.2f}")
+    
+    return df
+
+
+def extract_api_products() -> pd.DataFrame:
+    """
+    Extract product catalog data from the Fake Store API.
+    
+    Returns:
+        pd.DataFrame (see products_frame())
+    """
     logger.info(f"[API] Extracting product data from API: {FAKE_STORE_PRODUCTS_ENDPOINT}")
     
     try:
-        response = requests.get(FAKE_STORE_PRODUCTS_ENDPOINT, timeout=30)
-        response.raise_for_status()
-        
-        products = response.json()
-        
-        # Flatten the nested rating object
-        for product in products:
-            rating = product.pop('rating', {})
-            product['rating_rate'] = rating.get('rate', 0.0)
-            product['rating_count'] = rating.get('count', 0)
-        
-        df = pd.DataFrame(products)
-        df['_extracted_at'] = datetime.utcnow()
-        df['_source'] = 'fake_store_api'
-        
-        logger.info(f"[OK] Extracted {len(df)} products from API")
-        logger.info(f"   Categories: {df['category'].unique().tolist()}")
-        logger.info(f"   Price range: ${df['price'].min():.2f} - ${df['price'].max():.2f}")
-        
-        return df
+        return products_frame(fetch_json(FAKE_STORE_PRODUCTS_ENDPOINT))
         
     except requests.exceptions.RequestException as e:
         logger.error(f"[ERROR] API request failed: {e}")
@@ -110,10 +426,7 @@ def extract_api_categories() -> list:
     logger.info(f"[API] Extracting categories from API: {FAKE_STORE_CATEGORIES_ENDPOINT}")
     
     try:
-        response = requests.get(FAKE_STORE_CATEGORIES_ENDPOINT, timeout=30)
-        response.raise_for_status()
-        
-        categories = response.json()
+        categories = fetch_json(FAKE_STORE_CATEGORIES_ENDPOINT)
         logger.info(f"[OK] Extracted {len(categories)} categories: {categories}")
         
         return categories
@@ -123,17 +436,78 @@ def extract_api_categories() -> list:
         raise
 
 
+def extract_api_sources() -> Tuple[pd.DataFrame, list]:
+    """
+    Extract products and categories from the Fake Store API concurrently.
+    
+    Both endpoints are fetched in parallel over the shared keep-alive
+    session (with retry/backoff), so API latency is that of the slower
+    request rather than the sum of both.
+    
+    Returns:
+        (products DataFrame, list of category strings)
+    """
+    logger.info(
+        f"[API] Extracting products + categories concurrently from: "
+        f"{FAKE_STORE_PRODUCTS_ENDPOINT}, {FAKE_STORE_CATEGORIES_ENDPOINT}"
+    )
+    
+    try:
+        payloads = fetch_many({
+            'products': FAKE_STORE_PRODUCTS_ENDPOINT,
+            'categories': FAKE_STORE_CATEGORIES_ENDPOINT,
+        })
+    except requests.exceptions.RequestException as e:
+        logger.error(f"[ERROR] API request failed: {e}")
+        raise
+    
+    categories = payloads['categories']
+    logger.info(f"[OK] Extracted {len(categories)} categories: {categories}")
+    return products_frame(payloads['products']), categories
+
+
 # =====================================================================
 # Combined Extraction
 # =====================================================================
 
-def extract_all() -> dict:
+def extract_all(
+    incremental: bool = False,
+    land: Optional[bool] = None,
+    replace_partitions: bool = False,
+    partition_dates: Optional[Iterable] = None
+) -> dict:
     """
     Run all extractions and return a dictionary of DataFrames.
     
+    Args:
+        incremental: If True, extract only retail sales rows past the
+            stored watermark. The previous watermark is returned under
+            'watermark' and the advanced one under 'next_watermark'; the
+            caller persists it once the load has succeeded.
+        land: If True, also persist every raw extract to today's
+            partition of the Parquet landing zone (see etl.landing).
+            None means ETL_LANDING_ZONE, except in incremental mode: a
+            watermark delta is not a full extract, and replaying it from
+            the landing zone would truncate the warehouse to the delta.
+        replace_partitions: With incremental, return every source row of
+            the sale-date partitions (BQ_PARTITION_TYPE) touched by the
+            delta (plus ``partition_dates``) instead of the delta alone, so
+            those partitions can be rebuilt completely
+        partition_dates: Extra sale dates to rebuild, e.g. days whose
+            export was re-delivered without new Transaction IDs
+    
     Returns:
         dict with keys: 'retail_sales', 'api_products', 'api_categories'
+        (plus 'watermark' / 'next_watermark' in incremental mode)
     """
+    if land is None:
+        land = ETL_LANDING_ZONE and not incremental
+    elif land and incremental:
+        raise ValueError(
+            "Incremental extracts cannot be landed: the landing zone holds "
+            "full extracts only"
+        )
+    
     logger.info("=" * 60)
     logger.info(">> STARTING DATA EXTRACTION FROM ALL SOURCES")
     logger.info("=" * 60)
@@ -141,13 +515,29 @@ def extract_all() -> dict:
     results = {}
     
     # Source 1: Retail Sales CSV
-    results['retail_sales'] = extract_retail_sales()
+    if incremental:
+        watermark = get_watermark(RETAIL_SALES_SOURCE)
+        results['retail_sales'] = extract_retail_sales_incremental(watermark)
+        if replace_partitions:
+            dates = set(partition_dates or [])
+            if not results['retail_sales'].empty:
+                dates.update(pd.to_datetime(results['retail_sales']['Date']).dt.normalize())
+            results['retail_sales'] = (
+                extract_retail_sales_for_dates(dates) if dates else pd.DataFrame()
+            )
+        results['watermark'] = watermark
+        results['next_watermark'] = retail_sales_watermark(
+            results['retail_sales'], watermark
+        )
+    else:
+        results['retail_sales'] = extract_retail_sales()
     
-    # Source 2: Fake Store API Products
-    results['api_products'] = extract_api_products()
+    # Source 2 + 2b: Fake Store API Products & Categories (concurrent)
+    results['api_products'], results['api_categories'] = extract_api_sources()
     
-    # Source 2b: Fake Store API Categories
-    results['api_categories'] = extract_api_categories()
+    if land:
+        for source in LANDING_SOURCES:
+            write_landing(source, results[source])
     
     logger.info("=" * 60)
     logger.info("[OK] EXTRACTION COMPLETE")
@@ -0,0 +1,72 @@
+"""
+HASHING Module
+---------------------------------------------------------
+Shared row-hash engine used for surrogate / change-detection
+hashes (row_hash) across the transform layer.
+
+The hash input is built column-wise (one vectorized string
+conversion per column, then a single join pass) and digested in
+one batched pass, instead of building a pandas Series per row with
+DataFrame.apply(axis=1).
+
+Stable output contract:
+  row_hash == hashlib.md5(f"{col_1}_{col_2}_..._{col_n}".encode()).hexdigest()
+
+i.e. exactly the MD5 hex digest the previous per-row implementation
+produced. Hashes already stored in BigQuery (dim_customer.row_hash)
+therefore keep matching and SCD Type 2 change detection does not see
+every row as changed after an upgrade. A non-cryptographic
+pd.util.hash_pandas_object() hash would be faster still, but would
+break that contract.
+"""
+
+import hashlib
+import pandas as pd
+
+
+def _hash_text(series: pd.Series) -> pd.Series:
+    """Render a column exactly as f"{value}" would, NaN included."""
+    if pd.api.types.is_datetime64_dtype(series) and not (
+        series.dt.microsecond.any() or series.dt.nanosecond.any()
+    ):
+        # str(Timestamp) only adds fractional seconds when they are
+        # non-zero, so whole-second timestamps can use strftime
+        return series.dt.strftime('%Y-%m-%d %H:%M:%S').fillna('NaT')
+    return series.astype(object).map(str)
+
+
+def build_hash_input(
+    df: pd.DataFrame,
+    columns: list,
+    sep: str = '_'
+) -> list:
+    """
+    Build the hash input string for every row of ``df`` by converting
+    each of ``columns`` to text once and joining them with ``sep``.
+    """
+    parts = [_hash_text(df[col]).tolist() for col in columns]
+    return [sep.join(values) for values in zip(*parts)]
+
+
+def hash_columns(
+    df: pd.DataFrame,
+    columns: list,
+    sep: str = '_'
+) -> pd.Series:
+    """
+    Compute the MD5 row hash of ``columns`` for every row of ``df``.
+
+    Args:
+        df: Input DataFrame
+        columns: Columns to hash, in order
+        sep: Separator between column values
+
+    Returns:
+        pd.Series of 32-character hex digests aligned to df.index
+    """
+    md5 = hashlib.md5
+    return pd.Series(
+        [md5(value.encode()).hexdigest()
+         for value in build_hash_input(df, columns, sep)],
+        index=df.index,
+    )
@@ -0,0 +1,221 @@
+"""
+HTTP CACHE Module
+---------------------------------------------------------
+On-disk response cache for the REST sources, shared by the ETL
+extract stage and the Streamlit dashboard.
+
+Each cached URL is stored as two files under API_CACHE_DIR, keyed by
+the SHA-256 of the URL:
+  <key>.body  raw response body
+  <key>.json  metadata (url, ETag, Last-Modified, stored_at, size)
+
+Entries younger than API_CACHE_TTL_SEC are served without touching the
+network. Older entries are revalidated with a conditional request; on
+304 Not Modified the stored body is reused. The decoded payload of each
+URL is also memoised in-process with the validator of its body, so a
+revalidated entry is not JSON-parsed again within the same process. Once
+the cache grows past API_CACHE_MAX_MB the least recently used entries
+are evicted, on disk and from the memo.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Optional
+
+from config.settings import (
+    API_CACHE_DIR,
+    API_CACHE_TTL_SEC,
+    API_CACHE_MAX_MB,
+)
+
+logger = logging.getLogger(__name__)
+
+_cache_lock = threading.Lock()
+
+# url -> (validator, decoded JSON payload); only the latest body per URL
+_decoded = {}
+
+
+def _entry_paths(url: str, cache_dir: str = API_CACHE_DIR) -> tuple:
+    key = hashlib.sha256(url.encode()).hexdigest()
+    return (
+        os.path.join(cache_dir, f"{key}.json"),
+        os.path.join(cache_dir, f"{key}.body"),
+    )
+
+
+def _validator(entry: dict) -> str:
+    """Identifies the stored body; unchanged when an entry is revalidated."""
+    return (
+        entry.get('etag') or entry.get('last_modified')
+        or entry.get('sha256') or str(entry['stored_at'])
+    )
+
+
+# =====================================================================
+# Entry access
+# =====================================================================
+
+def get_entry(url: str, cache_dir: str = API_CACHE_DIR) -> Optional[dict]:
+    """Return the cached metadata for a URL, or None if not cached."""
+    meta_path, body_path = _entry_paths(url, cache_dir)
+    if not (os.path.exists(meta_path) and os.path.exists(body_path)):
+        return None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def is_fresh(entry: dict, ttl: int = API_CACHE_TTL_SEC) -> bool:
+    """True if the entry can be served without revalidation."""
+    return time.time() - entry['stored_at'] < ttl
+
+
+def conditional_headers(entry: Optional[dict]) -> dict:
+    """Request headers that turn a GET into a conditional GET."""
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def cached_payload(entry: dict, cache_dir: str = API_CACHE_DIR) -> Any:
+    """
+    Return the decoded JSON body of a cache entry.
+
+    The decoded object is shared between calls; callers must not
+    mutate it.
+
+    Raises:
+        FileNotFoundError if the entry was evicted since it was read;
+        treat it as a cache miss
+    """
+    url = entry['url']
+    meta_path, body_path = _entry_paths(url, cache_dir)
+    # Marks the entry as recently used, and fails if it was evicted
+    os.utime(meta_path)
+    validator = _validator(entry)
+    memo = _decoded.get(url)
+    if memo is None or memo[0] != validator:
+        with open(body_path, 'rb') as fh:
+            memo = (validator, json.loads(fh.read()))
+        _decoded[url] = memo
+    return memo[1]
+
+
+def revalidate(entry: dict, cache_dir: str = API_CACHE_DIR) -> dict:
+    """Mark an entry as fresh again after a 304 Not Modified."""
+    entry['stored_at'] = time.time()
+    meta_path, _ = _entry_paths(entry['url'], cache_dir)
+    with _cache_lock:
+        _write_json(meta_path, entry)
+    logger.info(f"[CACHE] Not modified: {entry['url']}")
+    return entry
+
+
+def store(url: str, response, cache_dir: str = API_CACHE_DIR) -> dict:
+    """
+    Cache a successful response.
+
+    Args:
+        url: Requested URL (cache key)
+        response: requests.Response with status 200
+
+    Returns:
+        The new cache entry metadata
+    """
+    entry = {
+        'url': url,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'stored_at': time.time(),
+        'size': len(response.content),
+        'sha256': hashlib.sha256(response.content).hexdigest(),
+    }
+    meta_path, body_path = _entry_paths(url, cache_dir)
+
+    with _cache_lock:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{body_path}.tmp"
+        with open(tmp_path, 'wb') as fh:
+            fh.write(response.content)
+        os.replace(tmp_path, body_path)
+        _write_json(meta_path, entry)
+        _decoded.pop(url, None)
+        evict(cache_dir=cache_dir)
+
+    logger.info(f"[CACHE] Stored {entry['size']} bytes for {url}")
+    return entry
+
+
+def _write_json(path: str, data: dict):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as fh:
+        json.dump(data, fh)
+    os.replace(tmp_path, path)
+
+
+# =====================================================================
+# Maintenance
+# =====================================================================
+
+def evict(max_mb: float = API_CACHE_MAX_MB, cache_dir: str = API_CACHE_DIR) -> int:
+    """
+    Remove least recently used entries until the cache fits in max_mb.
+
+    Returns:
+        Number of entries evicted
+    """
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    entries = []
+    total = 0
+    for name in os.listdir(cache_dir):
+        if not name.endswith('.json'):
+            continue
+        meta_path = os.path.join(cache_dir, name)
+        body_path = meta_path[:-len('.json')] + '.body'
+        size = os.path.getsize(meta_path)
+        if os.path.exists(body_path):
+            size += os.path.getsize(body_path)
+        entries.append((os.path.getmtime(meta_path), size, meta_path, body_path))
+        total += size
+
+    max_bytes = max_mb * 1024 * 1024
+    evicted = 0
+    for _, size, meta_path, body_path in sorted(entries):
+        if total <= max_bytes:
+            break
+        for path in (meta_path, body_path):
+            if os.path.exists(path):
+                os.remove(path)
+        total -= size
+        evicted += 1
+
+    if evicted:
+        for url in [
+            url for url in _decoded
+            if not os.path.exists(_entry_paths(url, cache_dir)[0])
+        ]:
+            _decoded.pop(url, None)
+        logger.info(f"[CACHE] Evicted {evicted} entries from {cache_dir}")
+    return evicted
+
+
+def clear(cache_dir: str = API_CACHE_DIR):
+    """Drop every cached response (on disk and in-process)."""
+    with _cache_lock:
+        _decoded.clear()
+        if os.path.isdir(cache_dir):
+            for name in os.listdir(cache_dir):
+                os.remove(os.path.join(cache_dir, name))
@@ -0,0 +1,241 @@
+"""
+KEYS Module
+---------------------------------------------------------
+Surrogate-key resolution engine for fact building.
+
+Natural keys are resolved against a dimension with a hash-index probe
+(pd.Index.get_indexer) instead of building a Python dict and calling
+Series.map per row. Categorical columns are probed once per category
+and the result is expanded through the category codes, so the cost is
+proportional to the number of distinct members, not the number of fact
+rows. Date keys are computed with integer arithmetic
+(year * 10000 + month * 100 + day) rather than a strftime round-trip.
+
+Dimension surrogate keys come from a persistent key registry: one
+Parquet file per dimension under KEY_REGISTRY_DIR mapping each natural
+key to the integer key it was first given. Known members keep their
+key across runs and new members are appended after the current maximum,
+so facts appended incrementally stay consistent with rows loaded
+earlier.
+
+Registry keys are durable keys: one per member for the life of the
+table, not one per version. In an SCD Type 2 dimension every version of
+a member carries the same key and (key, version) identifies a row, so
+facts joined on the key must also select a version (is_current, or the
+effective date range covering the sale date).
+"""
+
+import logging
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from config.settings import KEY_REGISTRY_DIR
+
+logger = logging.getLogger(__name__)
+
+_registry_lock = threading.Lock()
+# Registry path -> (file mtime, registry DataFrame) for the current process
+_registries = {}
+
+
+def date_keys(dates: pd.Series) -> pd.Series:
+    """YYYYMMDD integer date keys for a datetime Series."""
+    return (
+        dates.dt.year.astype('int64') * 10000
+        + dates.dt.month.astype('int64') * 100
+        + dates.dt.day.astype('int64')
+    )
+
+
+def _positions(index: pd.Index, values: pd.Series) -> np.ndarray:
+    """Position of each value in ``index`` (-1 when absent)."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        per_category = index.get_indexer(values.cat.categories)
+        codes = values.cat.codes.to_numpy()
+        if len(per_category) == 0:
+            # No categories: every row is null (code -1)
+            return np.full(len(codes), -1, dtype=np.intp)
+        return np.where(codes >= 0, per_category[codes], -1)
+    return index.get_indexer(values)
+
+
+def resolve_surrogate_keys(
+    values: pd.Series,
+    natural_keys: pd.Series,
+    surrogate_keys: pd.Series
+) -> pd.Series:
+    """
+    Look up the surrogate key of every natural key in ``values``.
+
+    Args:
+        values: Natural keys to resolve (fact rows; may be categorical)
+        natural_keys: Dimension natural key column
+        surrogate_keys: Dimension surrogate key column, aligned with
+            natural_keys. If a natural key occurs more than once, the last
+            occurrence wins (SCD versions share one durable key, so this
+            only matters for non-registry keys).
+
+    Returns:
+        pd.Series aligned to ``values``: int64 when every key resolved,
+        nullable Int64 with <NA> for unresolved keys otherwise
+    """
+    dim = pd.DataFrame({
+        'natural': natural_keys.to_numpy(),
+        'surrogate': surrogate_keys.to_numpy(),
+    }).drop_duplicates('natural', keep='last')
+
+    positions = _positions(pd.Index(dim['natural']), values)
+    keys = dim['surrogate'].to_numpy()[positions]
+
+    resolved = positions >= 0
+    if resolved.all():
+        return pd.Series(keys.astype('int64'), index=values.index)
+    return pd.Series(
+        pd.array(np.where(resolved, keys, 0), dtype='Int64'), index=values.index
+    ).mask(~resolved)
+
+
+def unresolved_key_report(
+    fact: pd.DataFrame,
+    key_columns: dict,
+    sample_size: int = 5
+) -> pd.DataFrame:
+    """
+    Summarize fact rows whose surrogate keys did not resolve.
+
+    Args:
+        fact: Fact rows holding both surrogate and natural key columns
+        key_columns: dict of surrogate key column -> natural key column
+        sample_size: Number of example natural keys per column
+
+    Returns:
+        pd.DataFrame with columns: key_column, natural_key, unresolved_rows,
+        unresolved_values, sample (one row per key column with misses)
+    """
+    rows = []
+    for key_column, natural_column in key_columns.items():
+        missing = fact[key_column].isna()
+        if not missing.any():
+            continue
+        values = pd.Series(fact.loc[missing, natural_column]).drop_duplicates()
+        rows.append({
+            'key_column': key_column,
+            'natural_key': natural_column,
+            'unresolved_rows': int(missing.sum()),
+            'unresolved_values': len(values),
+            'sample': values.head(sample_size).astype(str).tolist(),
+        })
+    return pd.DataFrame(rows, columns=[
+        'key_column', 'natural_key', 'unresolved_rows',
+        'unresolved_values', 'sample',
+    ])
+
+
+# =====================================================================
+# PERSISTENT KEY REGISTRY
+# =====================================================================
+
+def key_registry_path(dimension: str, registry_dir: str = KEY_REGISTRY_DIR) -> str:
+    """Parquet file holding the key registry of a dimension."""
+    return os.path.join(registry_dir, f"{dimension}.parquet")
+
+
+def load_key_registry(
+    dimension: str,
+    registry_dir: str = KEY_REGISTRY_DIR
+) -> pd.DataFrame:
+    """
+    Return the key registry of a dimension.
+    
+    Returns:
+        pd.DataFrame with columns natural_key and surrogate_key, in
+        allocation order (empty if no key has been allocated yet)
+    """
+    path = key_registry_path(dimension, registry_dir)
+    if not os.path.exists(path):
+        return pd.DataFrame({
+            'natural_key': pd.Series(dtype=object),
+            'surrogate_key': pd.Series(dtype='int64'),
+        })
+    
+    mtime = os.path.getmtime(path)
+    cached = _registries.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    registry = pd.read_parquet(path)
+    _registries[path] = (mtime, registry)
+    return registry
+
+
+def _save_key_registry(registry: pd.DataFrame, path: str):
+    """Atomically replace a registry file and refresh the process cache."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    registry.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    _registries[path] = (os.path.getmtime(path), registry)
+
+
+def _natural_values(values: pd.Series) -> pd.Series:
+    """Plain (non-categorical) view of natural key values."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.astype(values.cat.categories.dtype)
+    return values
+
+
+def assign_surrogate_keys(
+    dimension: str,
+    natural_keys: pd.Series,
+    registry_dir: str = KEY_REGISTRY_DIR
+) -> pd.Series:
+    """
+    Return durable surrogate keys for a dimension's natural keys.
+    
+    A natural key maps to one key for the table's life, so every SCD
+    Type 2 version of a member shares it. Natural keys already in the
+    registry keep their key. Unseen ones get
+    consecutive keys after the current maximum, in order of first
+    appearance, and the registry is written once for the whole batch.
+    
+    Args:
+        dimension: Dimension name (registry file name), e.g. 'dim_customer'
+        natural_keys: Natural key of every dimension row (may be categorical)
+        registry_dir: Directory holding the registry files
+        
+    Returns:
+        pd.Series of int64 keys aligned to ``natural_keys``
+    """
+    path = key_registry_path(dimension, registry_dir)
+    with _registry_lock:
+        registry = load_key_registry(dimension, registry_dir)
+        
+        positions = _positions(pd.Index(registry['natural_key']), natural_keys)
+        new_members = _natural_values(
+            natural_keys[positions < 0]
+        ).dropna().drop_duplicates()
+        
+        if len(new_members):
+            next_key = int(registry['surrogate_key'].max()) + 1 if len(registry) else 1
+            allocated = pd.DataFrame({
+                'natural_key': new_members.to_numpy(),
+                'surrogate_key': np.arange(
+                    next_key, next_key + len(new_members), dtype='int64'
+                ),
+            })
+            registry = (
+                allocated if registry.empty
+                else pd.concat([registry, allocated], ignore_index=True)
+            )
+            _save_key_registry(registry, path)
+    
+    logger.info(
+        f"[KEYS] {dimension}: {len(natural_keys)} keys resolved "
+        f"({len(new_members)} newly allocated, registry size {len(registry)})"
+    )
+    return resolve_surrogate_keys(
+        natural_keys, registry['natural_key'], registry['surrogate_key']
+    )
@@ -0,0 +1,147 @@
+"""
+LANDING Module
+---------------------------------------------------------
+Columnar Parquet landing zone for raw extracts.
+
+Each extracted source is written as-is (before any cleaning) to a
+Hive-style partition:
+
+  ETL_ARTIFACT_DIR/landing/source=<source>/extract_date=<YYYY-MM-DD>/part-0.parquet
+
+so a rerun or backfill can rebuild the warehouse from a past extract
+without calling the CSV export or the API again. Partitions are read
+back through memory-mapped Arrow files.
+"""
+
+import logging
+import os
+from datetime import date
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from config.settings import ETL_ARTIFACT_DIR, LANDING_COMPRESSION
+
+logger = logging.getLogger(__name__)
+
+LANDING_DIR = os.path.join(ETL_ARTIFACT_DIR, 'landing')
+
+# extract_all() keys persisted in the landing zone
+LANDING_SOURCES = ('retail_sales', 'api_products', 'api_categories')
+
+
+def landing_path(
+    source: str,
+    extract_date: str,
+    landing_dir: str = LANDING_DIR
+) -> str:
+    """Parquet file of one (source, extract_date) partition."""
+    return os.path.join(
+        landing_dir, f"source={source}", f"extract_date={extract_date}",
+        'part-0.parquet'
+    )
+
+
+def write_landing(
+    source: str,
+    data,
+    extract_date: Optional[str] = None,
+    compression: str = LANDING_COMPRESSION,
+    landing_dir: str = LANDING_DIR
+) -> str:
+    """
+    Persist one raw extract to its landing partition (replacing any
+    earlier extract of the same source on the same day).
+    
+    Args:
+        source: Source name (an extract_all() key)
+        data: DataFrame, or a list of values (stored as a 'value' column)
+        extract_date: Partition date (YYYY-MM-DD, default today)
+        compression: Parquet codec ('zstd' or 'snappy')
+        
+    Returns:
+        Path of the written Parquet file
+    """
+    extract_date = extract_date or date.today().isoformat()
+    if not isinstance(data, pd.DataFrame):
+        data = pd.DataFrame({'value': list(data)})
+    
+    path = landing_path(source, extract_date, landing_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    pq.write_table(
+        pa.Table.from_pandas(data, preserve_index=False),
+        tmp_path,
+        compression=compression,
+    )
+    os.replace(tmp_path, path)
+    
+    logger.info(
+        f"[LANDING] {source}: {len(data)} rows -> {path} ({compression})"
+    )
+    return path
+
+
+def read_landing(
+    source: str,
+    extract_date: str,
+    landing_dir: str = LANDING_DIR
+) -> pd.DataFrame:
+    """Read one landing partition back through a memory-mapped Arrow file."""
+    path = landing_path(source, extract_date, landing_dir)
+    table = pq.read_table(path, memory_map=True)
+    return table.to_pandas()
+
+
+def landing_dates(source: str, landing_dir: str = LANDING_DIR) -> list:
+    """Sorted extract dates available for a source."""
+    source_dir = os.path.join(landing_dir, f"source={source}")
+    if not os.path.isdir(source_dir):
+        return []
+    return sorted(
+        name.split('=', 1)[1] for name in os.listdir(source_dir)
+        if name.startswith('extract_date=')
+        and os.path.exists(os.path.join(source_dir, name, 'part-0.parquet'))
+    )
+
+
+def extract_from_landing(
+    extract_date: Optional[str] = None,
+    landing_dir: str = LANDING_DIR
+) -> dict:
+    """
+    Rebuild an extract_all() result from the landing zone.
+    
+    Args:
+        extract_date: Partition to read (YYYY-MM-DD); None picks the
+            latest date for which every source was landed
+        
+    Returns:
+        dict with keys: 'retail_sales', 'api_products', 'api_categories'
+        
+    Raises:
+        FileNotFoundError: if no complete partition exists
+    """
+    if extract_date is None:
+        complete = set.intersection(*(
+            set(landing_dates(source, landing_dir)) for source in LANDING_SOURCES
+        ))
+        if not complete:
+            raise FileNotFoundError(
+                f"No complete landing partition in {landing_dir}"
+            )
+        extract_date = max(complete)
+    
+    logger.info(f"[LANDING] Reading extracts for {extract_date} from {landing_dir}")
+    
+    results = {
+        source: read_landing(source, extract_date, landing_dir)
+        for source in LANDING_SOURCES
+    }
+    results['api_categories'] = results['api_categories']['value'].tolist()
+    
+    for source in LANDING_SOURCES:
+        logger.info(f"   {source}: {len(results[source])} records")
+    return results
@@ -11,9 +11,15 @@ Supports:
   - Data mart loads (WRITE_TRUNCATE)
 """
 
+import os
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from typing import Callable, Optional
 from google.cloud import bigquery
 from google.api_core.exceptions import NotFound
 
@@ -29,10 +35,20 @@ from config.settings import (
     FACT_SALES,
     MART_SALES_PERFORMANCE,
     MART_CATEGORY_ANALYSIS,
+    BQ_LOAD_WORKERS,
+    BQ_LOAD_MODE,
+    BQ_PARTITION_TYPE,
+    ETL_ARTIFACT_DIR,
+    SCD_CHANGE_DETECTION,
+    SCD_SNAPSHOT_DIR,
 )
+from etl.date_dimension import calendar_fingerprint
 
 logger = logging.getLogger(__name__)
 
+# Table label holding the content fingerprint of the loaded dim_date
+DIM_DATE_FINGERPRINT_LABEL = 'calendar_fingerprint'
+
 
 def get_bq_client() -> bigquery.Client:
     """Create and return a BigQuery client."""
@@ -97,6 +113,10 @@ SCHEMAS = {
         bigquery.SchemaField("is_weekend", "BOOLEAN"),
         bigquery.SchemaField("fiscal_year", "INTEGER"),
         bigquery.SchemaField("fiscal_quarter", "INTEGER"),
+        bigquery.SchemaField("fiscal_month", "INTEGER"),
+        bigquery.SchemaField("fiscal_week", "INTEGER"),
+        bigquery.SchemaField("is_holiday", "BOOLEAN"),
+        bigquery.SchemaField("holiday_name", "STRING"),
     ],
     'dim_customer': [
         bigquery.SchemaField("customer_key", "INTEGER"),
@@ -143,6 +163,7 @@ SCHEMAS = {
         bigquery.SchemaField("sales_key", "INTEGER"),
         bigquery.SchemaField("transaction_id", "INTEGER"),
         bigquery.SchemaField("date_key", "INTEGER"),
+        bigquery.SchemaField("sale_date", "DATE"),
         bigquery.SchemaField("customer_key", "INTEGER"),
         bigquery.SchemaField("category_key", "INTEGER"),
         bigquery.SchemaField("quantity", "INTEGER"),
@@ -188,47 +209,251 @@ SCHEMAS = {
 }
 
 
+# Physical layout of the large sales tables: time partitioning on the
+# sale date and clustering on the common dashboard filter columns
+TABLE_LAYOUTS = {
+    'stg_retail_sales': {
+        'partition_field': 'date',
+        'clustering_fields': ['product_category', 'customer_id'],
+    },
+    'fact_sales': {
+        'partition_field': 'sale_date',
+        'clustering_fields': ['product_category', 'customer_id'],
+    },
+}
+
+# Partition decorator date format per partitioning granularity
+PARTITION_DECORATOR_FORMATS = {
+    'DAY': '%Y%m%d',
+    'MONTH': '%Y%m',
+}
+
+
 # =====================================================================
 # TABLE LOADING FUNCTIONS
 # =====================================================================
 
-def load_table(
+# Arrow types matching each BigQuery column type in SCHEMAS. TIMESTAMP
+# columns carry a UTC zone so Parquet loads land as TIMESTAMP, not DATETIME.
+ARROW_TYPES = {
+    'INTEGER': pa.int64(),
+    'FLOAT': pa.float64(),
+    'STRING': pa.string(),
+    'BOOLEAN': pa.bool_(),
+    'TIMESTAMP': pa.timestamp('us', tz='UTC'),
+    'DATE': pa.date32(),
+}
+
+
+def time_partitioning(
+    table_name: str,
+    partition_type: str = BQ_PARTITION_TYPE
+) -> Optional[bigquery.TimePartitioning]:
+    """TimePartitioning spec of a table in TABLE_LAYOUTS (None otherwise)."""
+    layout = TABLE_LAYOUTS.get(table_name)
+    if layout is None:
+        return None
+    return bigquery.TimePartitioning(
+        type_=partition_type, field=layout['partition_field']
+    )
+
+
+def ensure_table_layout(
     client: bigquery.Client,
+    table_id: str,
+    table_name: str,
+    replace: bool = False
+):
+    """
+    Create a TABLE_LAYOUTS table with its partitioning and clustering.
+    
+    An existing table with a different layout (e.g. created before
+    partitioning was introduced) is recreated when ``replace`` is set,
+    i.e. when its contents are about to be truncated anyway; otherwise a
+    warning is logged and the table is left as is.
+    """
+    if table_name not in TABLE_LAYOUTS:
+        return
+    partitioning = time_partitioning(table_name)
+    clustering = TABLE_LAYOUTS[table_name]['clustering_fields']
+    
+    try:
+        table = client.get_table(table_id)
+        current = table.time_partitioning
+        if (current is not None
+                and current.field == partitioning.field
+                and current.type_ == partitioning.type_
+                and table.clustering_fields == clustering):
+            return
+        if not replace:
+            logger.warning(
+                f"[WARN] {table_id} is not partitioned/clustered as "
+                f"configured; it is recreated on the next full reload"
+            )
+            return
+        logger.info(f"[LOAD] Recreating {table_id} with partitioning/clustering")
+        client.delete_table(table_id, not_found_ok=True)
+    except NotFound:
+        pass
+    
+    table = bigquery.Table(table_id, schema=SCHEMAS[table_name])
+    table.time_partitioning = partitioning
+    table.clustering_fields = clustering
+    client.create_table(table, exists_ok=True)
+    logger.info(
+        f"[LOAD] Created {table_id} partitioned by {partitioning.field} "
+        f"({partitioning.type_}), clustered by {clustering}"
+    )
+
+
+def arrow_schema(table_name: str) -> pa.Schema:
+    """Derive the Arrow schema for a table from its BigQuery SCHEMAS entry."""
+    return pa.schema([
+        pa.field(field.name, ARROW_TYPES[field.field_type])
+        for field in SCHEMAS[table_name]
+    ])
+
+
+def parquet_artifact_path(table_id: str) -> str:
+    """Local Parquet artifact path for a BigQuery table."""
+    return os.path.join(
+        ETL_ARTIFACT_DIR, 'parquet', f"{table_id.split('.')[-1]}.parquet"
+    )
+
+
+def write_parquet_artifact(
     df: pd.DataFrame,
+    table_name: str,
+    path: str
+) -> str:
+    """
+    Serialize a DataFrame once to Parquet using the table's Arrow schema.
+    Columns not in the schema are dropped; missing ones are written as NULL.
+    """
+    schema = arrow_schema(table_name)
+    columns = {}
+    for field in schema:
+        if field.name not in df.columns:
+            columns[field.name] = pa.nulls(len(df), type=field.type)
+            continue
+        values = df[field.name]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype(object)
+        columns[field.name] = pa.array(values, type=field.type, from_pandas=True)
+    
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(pa.table(columns, schema=schema), path)
+    return path
+
+
+def load_parquet_artifact(
+    client: bigquery.Client,
+    path: str,
     table_id: str,
     table_name: str,
     write_disposition: str = "WRITE_TRUNCATE"
+):
+    """Load an existing Parquet artifact into BigQuery and wait for the job."""
+    job_config = bigquery.LoadJobConfig(
+        schema=SCHEMAS.get(table_name, []),
+        source_format=bigquery.SourceFormat.PARQUET,
+        write_disposition=write_disposition,
+        time_partitioning=time_partitioning(table_name),
+        clustering_fields=TABLE_LAYOUTS.get(table_name, {}).get('clustering_fields'),
+    )
+    with open(path, 'rb') as source:
+        job = client.load_table_from_file(
+            source, table_id, job_config=job_config
+        )
+    job.result()  # Wait for completion
+
+
+def load_table(
+    client: bigquery.Client,
+    df: pd.DataFrame,
+    table_id: str,
+    table_name: str,
+    write_disposition: str = "WRITE_TRUNCATE",
+    load_mode: str = BQ_LOAD_MODE,
+    retries: int = 2
 ) -> int:
     """
     Load a DataFrame into a BigQuery table.
     
+    Tables in TABLE_LAYOUTS are created partitioned and clustered first.
+    
     Args:
         client: BigQuery client
         df: DataFrame to load
-        table_id: Full table ID (project.dataset.table)
+        table_id: Full table ID (project.dataset.table), optionally with a
+            partition decorator ($YYYYMMDD) to write a single partition
         table_name: Short name for schema lookup
         write_disposition: WRITE_TRUNCATE or WRITE_APPEND
+        load_mode: 'dataframe' (load_table_from_dataframe) or 'parquet'
+            (serialize once to a local Parquet artifact, then
+            load_table_from_file; failed jobs are retried from the
+            same artifact up to ``retries`` times)
         
     Returns:
         Number of rows loaded
     """
-    logger.info(f"[LOAD] Loading {table_name} -> {table_id} ({write_disposition})")
-    
-    job_config = bigquery.LoadJobConfig(
-        schema=SCHEMAS.get(table_name, []),
-        write_disposition=write_disposition,
+    logger.info(
+        f"[LOAD] Loading {table_name} -> {table_id} "
+        f"({write_disposition}, {load_mode})"
     )
     
-    # Convert datetime columns for BigQuery compatibility
-    for col in df.columns:
-        if df[col].dtype == 'datetime64[ns]':
-            df[col] = df[col].dt.tz_localize(None)
+    base_table_id, _, partition = table_id.partition('$')
     
     try:
-        job = client.load_table_from_dataframe(
-            df, table_id, job_config=job_config
+        ensure_table_layout(
+            client, base_table_id, table_name,
+            replace=(write_disposition == "WRITE_TRUNCATE" and not partition)
         )
-        job.result()  # Wait for completion
+        
+        if load_mode == 'parquet':
+            path = write_parquet_artifact(
+                df, table_name, parquet_artifact_path(table_id)
+            )
+            for attempt in range(retries + 1):
+                try:
+                    load_parquet_artifact(
+                        client, path, table_id, table_name, write_disposition
+                    )
+                    break
+                except Exception as e:
+                    if attempt == retries:
+                        raise
+                    logger.warning(
+                        f"[WARN] Load of {table_name} failed ({e}); "
+                        f"retrying from {path}"
+                    )
+        else:
+            job_config = bigquery.LoadJobConfig(
+                schema=SCHEMAS.get(table_name, []),
+                write_disposition=write_disposition,
+                time_partitioning=time_partitioning(table_name),
+                clustering_fields=TABLE_LAYOUTS.get(table_name, {}).get('clustering_fields'),
+            )
+            
+            # Categoricals are loaded as their plain string values
+            df = df.assign(**{
+                col: df[col].astype(object) for col in df.columns
+                if isinstance(df[col].dtype, pd.CategoricalDtype)
+            })
+            
+            # Convert datetime columns for BigQuery compatibility
+            for col in df.columns:
+                if df[col].dtype == 'datetime64[ns]':
+                    df[col] = df[col].dt.tz_localize(None)
+            
+            job = client.load_table_from_dataframe(
+                df, table_id, job_config=job_config
+            )
+            job.result()  # Wait for completion
+        
+        if partition:
+            logger.info(f"[OK] Loaded {len(df)} rows into {table_id}")
+            return len(df)
         
         table = client.get_table(table_id)
         logger.info(f"[OK] Loaded {table.num_rows} rows into {table_id}")
@@ -239,96 +464,473 @@ def load_table(
         raise
 
 
+def load_table_partitions(
+    client: bigquery.Client,
+    df: pd.DataFrame,
+    table_id: str,
+    table_name: str,
+    partition_type: str = BQ_PARTITION_TYPE
+) -> int:
+    """
+    Replace only the partitions of a partitioned table that ``df`` covers.
+    
+    Rows are grouped by partition and each group is written with
+    WRITE_TRUNCATE to its partition decorator (table$YYYYMMDD), so a
+    reload of one day rewrites that day and leaves the rest of the table
+    untouched. ``df`` must hold the complete contents of every partition
+    it touches.
+    
+    Returns:
+        Number of rows loaded
+    """
+    partition_field = TABLE_LAYOUTS[table_name]['partition_field']
+    decorator_format = PARTITION_DECORATOR_FORMATS[partition_type]
+    
+    decorators = pd.to_datetime(df[partition_field]).dt.strftime(decorator_format)
+    rows = 0
+    for decorator, partition_rows in df.groupby(decorators.to_numpy(), sort=True):
+        rows += load_table(
+            client, partition_rows, f"{table_id}${decorator}", table_name,
+            "WRITE_TRUNCATE"
+        )
+    logger.info(
+        f"[OK] Replaced {decorators.nunique()} {partition_type.lower()} "
+        f"partitions of {table_id} ({rows} rows)"
+    )
+    return rows
+
+
+def load_dim_date(
+    client: bigquery.Client,
+    dim_date: pd.DataFrame
+) -> int:
+    """
+    Load dim_date only if its content changed since the last load.
+    
+    The content fingerprint of the loaded calendar is kept as a label on
+    the BigQuery table; when it matches (and the row count agrees) the
+    truncate-and-reload is skipped.
+    
+    Returns:
+        Number of rows in dim_date
+    """
+    fingerprint = calendar_fingerprint(dim_date)
+    
+    try:
+        table = client.get_table(DIM_DATE)
+        if (table.labels.get(DIM_DATE_FINGERPRINT_LABEL) == fingerprint
+                and table.num_rows == len(dim_date)):
+            logger.info(
+                f"[SKIP] dim_date unchanged ({len(dim_date)} rows) - "
+                f"reload skipped"
+            )
+            return table.num_rows
+    except NotFound:
+        pass
+    
+    rows = load_table(client, dim_date, DIM_DATE, 'dim_date')
+    
+    table = client.get_table(DIM_DATE)
+    table.labels = {**table.labels, DIM_DATE_FINGERPRINT_LABEL: fingerprint}
+    client.update_table(table, ['labels'])
+    return rows
+
+
+def make_chunk_loader(client: bigquery.Client) -> Callable[[str, pd.DataFrame], None]:
+    """
+    Return a sink for transform.transform_all_chunked() that loads each
+    streamed chunk as it is produced. The first chunk of a table truncates
+    it, later chunks append.
+    """
+    table_ids = {
+        'stg_retail_sales': STG_RETAIL_SALES,
+        'fact_sales': FACT_SALES,
+    }
+    started = set()
+    
+    def load_chunk(table_name: str, df: pd.DataFrame):
+        write_disposition = (
+            "WRITE_APPEND" if table_name in started else "WRITE_TRUNCATE"
+        )
+        load_table(
+            client, df, table_ids[table_name], table_name, write_disposition
+        )
+        started.add(table_name)
+    
+    return load_chunk
+
+
 # =====================================================================
 # SCD TYPE 2 MERGE FOR DIMENSIONS
 # =====================================================================
 
-def scd_type2_merge_customer(
-    client: bigquery.Client,
-    df_new: pd.DataFrame
+# SCD Type 2 dimensions: table name -> (table ID, natural key column)
+SCD2_DIMENSIONS = {
+    'dim_customer': (DIM_CUSTOMER, 'customer_id'),
+    'dim_product': (DIM_PRODUCT, 'api_product_id'),
+}
+
+
+def scd_snapshot_path(table_name: str) -> str:
+    """Local Parquet snapshot of the last loaded row_hash per natural key."""
+    return os.path.join(SCD_SNAPSHOT_DIR, f"{table_name}.parquet")
+
+
+def load_scd_snapshot(table_name: str) -> Optional[pd.DataFrame]:
+    """Return the row_hash snapshot of a dimension (None if there is none)."""
+    path = scd_snapshot_path(table_name)
+    if not os.path.exists(path):
+        return None
+    return pd.read_parquet(path)
+
+
+def save_scd_snapshot(
+    table_name: str,
+    df_loaded: pd.DataFrame,
+    snapshot: Optional[pd.DataFrame] = None
 ):
     """
-    Perform SCD Type 2 merge for the customer dimension.
-    Compares incoming rows with existing rows by row_hash.
-    New/changed records are inserted; old versions are expired.
+    Record the row_hash of the rows just loaded, on top of ``snapshot``
+    (pass None to replace it, e.g. after a first full load).
+    """
+    natural_key = SCD2_DIMENSIONS[table_name][1]
+    loaded = pd.DataFrame({
+        natural_key: np.asarray(df_loaded[natural_key]),
+        'row_hash': np.asarray(df_loaded['row_hash']),
+    })
+    if snapshot is not None:
+        loaded = pd.concat([snapshot, loaded], ignore_index=True).drop_duplicates(
+            natural_key, keep='last'
+        )
+    
+    path = scd_snapshot_path(table_name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    loaded.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def detect_changes(
+    df_new: pd.DataFrame,
+    snapshot: pd.DataFrame,
+    natural_key: str
+) -> pd.Series:
     """
-    logger.info("[SCD2] Performing SCD Type 2 merge for Customer dimension...")
+    Classify incoming dimension rows against the row_hash snapshot.
     
-    table_id = DIM_CUSTOMER
+    Returns:
+        pd.Series aligned to df_new with 'new', 'changed' or 'unchanged'
+    """
+    positions = pd.Index(snapshot[natural_key]).get_indexer(
+        np.asarray(df_new[natural_key])
+    )
+    known = positions >= 0
+    previous = snapshot['row_hash'].to_numpy()[np.where(known, positions, 0)]
+    changed = known & (previous != df_new['row_hash'].to_numpy())
+    
+    return pd.Series(
+        np.select([~known, changed], ['new', 'changed'], 'unchanged'),
+        index=df_new.index
+    )
+
+
+def scd_type2_merge_query(
+    table_id: str,
+    staging_table: str,
+    table_name: str,
+    natural_key: str
+) -> str:
+    """
+    Build the single-statement SCD Type 2 MERGE for a dimension.
+    
+    The source is the staging table twice: once keyed by the natural key
+    (new members are inserted, changed current rows are expired) and once
+    with a NULL merge key for the changed members only, which never
+    matches and therefore inserts their new version. Unchanged rows match
+    with equal row_hash and are left alone, so the target is scanned once.
+    
+    The new version keeps the surrogate key of the row it expires: the key
+    is the member's durable key (etl.keys), and a row is identified by
+    (key, version). Facts reference the durable key, so joins to an SCD
+    Type 2 dimension must pick one version, with is_current or with the
+    effective_start_date / effective_end_date range.
+    """
+    columns = [field.name for field in SCHEMAS[table_name]]
+    column_list = ", ".join(columns)
+    values_list = ", ".join(f"source.{col}" for col in columns)
+    
+    return f"""
+    MERGE `{table_id}` target
+    USING (
+        SELECT staging.{natural_key} AS merge_key, staging.*
+        FROM `{staging_table}` staging
+        UNION ALL
+        SELECT NULL AS merge_key, staging.* REPLACE (
+            CURRENT_TIMESTAMP() AS effective_start_date,
+            existing.version + 1 AS version
+        )
+        FROM `{staging_table}` staging
+        JOIN `{table_id}` existing
+            ON existing.{natural_key} = staging.{natural_key}
+            AND existing.is_current
+            AND existing.row_hash != staging.row_hash
+    ) source
+    ON target.{natural_key} = source.merge_key AND target.is_current
+    WHEN MATCHED AND target.row_hash != source.row_hash THEN
+        UPDATE SET
+            effective_end_date = CURRENT_TIMESTAMP(),
+            is_current = FALSE
+    WHEN NOT MATCHED THEN
+        INSERT ({column_list})
+        VALUES ({values_list})
+    """
+
+
+def scd_type2_merge(
+    client: bigquery.Client,
+    df_new: pd.DataFrame,
+    table_name: str,
+    change_detection: bool = SCD_CHANGE_DETECTION
+) -> int:
+    """
+    Perform an SCD Type 2 merge for a dimension in SCD2_DIMENSIONS.
+    
+    Incoming rows are compared with the current rows by row_hash in one
+    MERGE statement: changed rows are expired and their new version is
+    inserted, new members are inserted, unchanged rows are untouched.
+    A failed merge is raised rather than replaced by a truncate-reload,
+    which would discard the dimension's history.
+    
+    With change detection enabled, incoming rows are first compared with
+    the local row_hash snapshot and only new / changed rows are uploaded,
+    so the merge scales with churn rather than dimension size.
+    
+    Args:
+        change_detection: Diff against the local snapshot before uploading
+            (without a snapshot every row is uploaded)
+    
+    Returns:
+        Number of incoming rows
+    """
+    table_id, natural_key = SCD2_DIMENSIONS[table_name]
+    logger.info(f"[SCD2] Performing SCD Type 2 merge for {table_name}...")
     
     # Check if table exists
     try:
         client.get_table(table_id)
-        table_exists = True
     except NotFound:
-        table_exists = False
-    
-    if not table_exists:
         # First load - just insert everything
-        load_table(client, df_new, table_id, 'dim_customer', 'WRITE_TRUNCATE')
+        load_table(client, df_new, table_id, table_name, 'WRITE_TRUNCATE')
         logger.info("   First load - inserted all records as new")
-        return
+        if change_detection:
+            save_scd_snapshot(table_name, df_new)
+        return len(df_new)
+    
+    snapshot = load_scd_snapshot(table_name) if change_detection else None
+    df_delta = df_new
+    if snapshot is not None:
+        status = detect_changes(df_new, snapshot, natural_key)
+        counts = status.value_counts()
+        logger.info(
+            f"   Change detection: {counts.get('new', 0)} new, "
+            f"{counts.get('changed', 0)} changed, "
+            f"{counts.get('unchanged', 0)} unchanged"
+        )
+        df_delta = df_new[status.to_numpy() != 'unchanged']
+        if df_delta.empty:
+            logger.info(f"[SKIP] {table_name} unchanged - merge skipped")
+            return len(df_new)
+    
+    # Load the delta to a staging table, then merge it in one statement
+    staging_table = f"{table_id}_staging"
+    load_table(client, df_delta, staging_table, table_name, 'WRITE_TRUNCATE')
+    
+    try:
+        job = client.query(scd_type2_merge_query(
+            table_id, staging_table, table_name, natural_key
+        ))
+        job.result()
+        logger.info(
+            f"[OK] SCD Type 2 merge complete for {table_name} "
+            f"({job.num_dml_affected_rows} rows affected)"
+        )
+    finally:
+        # Clean up staging table
+        client.delete_table(staging_table, not_found_ok=True)
+    
+    if change_detection:
+        save_scd_snapshot(table_name, df_delta, snapshot)
+    return len(df_new)
+
+
+def scd_type2_merge_customer(
+    client: bigquery.Client,
+    df_new: pd.DataFrame
+) -> int:
+    """SCD Type 2 merge for the customer dimension."""
+    return scd_type2_merge(client, df_new, 'dim_customer')
+
+
+def category_merge_query(table_id: str, staging_table: str) -> str:
+    """
+    Build the MERGE that upserts dim_product_category by category_key.
     
-    # Load new data to a temp staging table
-    temp_table = f"{table_id}_staging"
-    load_table(client, df_new, temp_table, 'dim_customer', 'WRITE_TRUNCATE')
-    
-    # Execute SCD Type 2 merge query
-    merge_query = f"""
-    -- Step 1: Expire changed records in the target
-    UPDATE `{table_id}` target
-    SET 
-        target.effective_end_date = CURRENT_TIMESTAMP(),
-        target.is_current = FALSE
-    WHERE target.is_current = TRUE
-    AND target.customer_id IN (
-        SELECT staging.customer_id 
-        FROM `{temp_table}` staging
-        WHERE staging.row_hash != target.row_hash
-    );
-    
-    -- Step 2: Insert new / changed records
-    INSERT INTO `{table_id}`
-    SELECT * FROM `{temp_table}` staging
-    WHERE NOT EXISTS (
-        SELECT 1 FROM `{table_id}` target
-        WHERE target.customer_id = staging.customer_id
-        AND target.row_hash = staging.row_hash
-        AND target.is_current = TRUE
-    );
+    Categories are never deleted. category_source accumulates: a category
+    seen in a different source than before becomes 'both', and an empty
+    incoming source (a category only known from earlier loads) keeps the
+    existing value.
+    """
+    columns = [field.name for field in SCHEMAS['dim_product_category']]
+    column_list = ", ".join(columns)
+    values_list = ", ".join(f"source.{col}" for col in columns)
+    
+    return f"""
+    MERGE `{table_id}` target
+    USING `{staging_table}` source
+    ON target.category_key = source.category_key
+    WHEN MATCHED THEN
+        UPDATE SET
+            category_name = source.category_name,
+            category_source = CASE
+                WHEN source.category_source IS NULL THEN target.category_source
+                WHEN target.category_source IS NULL
+                    OR target.category_source = source.category_source
+                    THEN source.category_source
+                ELSE 'both'
+            END,
+            category_group = source.category_group,
+            _loaded_at = source._loaded_at
+    WHEN NOT MATCHED THEN
+        INSERT ({column_list})
+        VALUES ({values_list})
+    """
+
+
+def merge_dim_product_category(
+    client: bigquery.Client,
+    dim_category: pd.DataFrame
+) -> int:
     """
+    Upsert dim_product_category instead of replacing it (incremental runs).
     
+    A truncate-reload from an incremental batch would drop categories
+    that only appear in earlier loads and orphan their fact rows.
+    
+    Returns:
+        Number of incoming rows
+    """
+    logger.info("[MERGE] Merging dim_product_category...")
     try:
-        # BigQuery doesn't support multi-statement in one query easily,
-        # so split them
-        queries = [q.strip() for q in merge_query.split(';') if q.strip()]
-        for q in queries:
-            query_job = client.query(q)
-            query_job.result()
-        
-        logger.info("[OK] SCD Type 2 merge complete for Customer dimension")
-    except Exception as e:
-        logger.error(f"[ERROR] SCD merge failed: {e}")
-        # Fallback to full load
-        load_table(client, df_new, table_id, 'dim_customer', 'WRITE_TRUNCATE')
+        client.get_table(DIM_PRODUCT_CATEGORY)
+    except NotFound:
+        return load_table(
+            client, dim_category, DIM_PRODUCT_CATEGORY, 'dim_product_category'
+        )
     
-    # Clean up staging table
+    staging_table = f"{DIM_PRODUCT_CATEGORY}_staging"
+    load_table(
+        client, dim_category, staging_table, 'dim_product_category', 'WRITE_TRUNCATE'
+    )
     try:
-        client.delete_table(temp_table)
-    except Exception:
-        pass
+        job = client.query(category_merge_query(DIM_PRODUCT_CATEGORY, staging_table))
+        job.result()
+        logger.info(
+            f"[OK] Merged dim_product_category "
+            f"({job.num_dml_affected_rows} rows affected)"
+        )
+    finally:
+        client.delete_table(staging_table, not_found_ok=True)
+    return len(dim_category)
 
 
 # =====================================================================
 # ORCHESTRATOR
 # =====================================================================
 
-def load_all(transformed_data: dict) -> dict:
+def run_load_stage(
+    stage_name: str,
+    tasks: dict,
+    max_workers: int = BQ_LOAD_WORKERS
+) -> dict:
+    """
+    Run a group of mutually independent load tasks concurrently and
+    wait for all of them.
+    
+    Args:
+        stage_name: Label used in logs
+        tasks: dict of table name -> zero-argument callable returning
+            the number of rows loaded
+        max_workers: Maximum number of concurrent load jobs
+        
+    Returns:
+        dict of table name -> rows loaded
+        
+    Raises:
+        The first task error, after every task in the stage has finished.
+    """
+    if not tasks:
+        return {}
+    
+    workers = max(1, min(max_workers, len(tasks)))
+    logger.info(
+        f"[LOAD] Stage '{stage_name}': {len(tasks)} tables, {workers} workers"
+    )
+    
+    stats = {}
+    errors = {}
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix=f"bq-load-{stage_name}"
+    ) as executor:
+        futures = {executor.submit(task): name for name, task in tasks.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                stats[name] = future.result()
+            except Exception as e:
+                errors[name] = e
+    
+    if errors:
+        logger.error(
+            f"[ERROR] Stage '{stage_name}' failed for: {sorted(errors)}"
+        )
+        raise next(iter(errors.values()))
+    
+    # Keep the declared table order in the returned stats
+    return {name: stats[name] for name in tasks}
+
+
+def load_all(
+    transformed_data: dict,
+    streamed_rows: Optional[dict] = None,
+    max_workers: int = BQ_LOAD_WORKERS,
+    incremental: bool = False,
+    replace_partitions: bool = False
+) -> dict:
     """
     Load all transformed data into BigQuery.
     
+    Tables are loaded in dependency stages (staging + dimensions -> fact
+    -> marts). Load jobs within a stage are independent and run
+    concurrently on up to ``max_workers`` threads, so each stage takes
+    roughly as long as its slowest table.
+    
     Args:
         transformed_data: dict from transform.transform_all()
+        streamed_rows: Row counts of tables already loaded chunk by chunk
+            through make_chunk_loader(); those tables are skipped here
+        max_workers: Concurrent load jobs per stage (BQ_LOAD_WORKERS)
+        incremental: transformed_data holds only rows past the watermark.
+            stg_retail_sales and fact_sales are appended (WRITE_APPEND);
+            the marts, maintained from persisted partials, are reloaded in
+            full (they are small). dim_product_category is merged
+            rather than replaced. Dimension keys come from the
+            persistent key registry (etl.keys), so appended fact rows
+            reference the keys of rows loaded earlier.
+        replace_partitions: With incremental, the batch holds complete
+            sale-date partitions (every source row of those dates, see
+            extract_all(replace_partitions=True)): stg_retail_sales and
+            fact_sales replace just those partitions through partition
+            decorators instead of appending.
         
     Returns:
         dict with load statistics
@@ -340,13 +942,7 @@ def load_all(transformed_data: dict) -> dict:
     client = get_bq_client()
     ensure_dataset_exists(client)
     
-    stats = {}
-    
-    # 1. Load staging tables (full refresh)
-    stats['stg_retail_sales'] = load_table(
-        client, transformed_data['stg_retail_sales'],
-        STG_RETAIL_SALES, 'stg_retail_sales'
-    )
+    streamed_rows = streamed_rows or {}
     
     # Prepare API products for loading (rename columns)
     stg_api = transformed_data['stg_api_products'].copy()
@@ -358,47 +954,91 @@ def load_all(transformed_data: dict) -> dict:
             'category': 'product_category',
             'image': 'product_image_url',
         }, inplace=True)
-    stats['stg_api_products'] = load_table(
-        client, stg_api,
-        STG_API_PRODUCTS, 'stg_api_products'
-    )
     
-    # 2. Load dimension tables
-    stats['dim_date'] = load_table(
-        client, transformed_data['dim_date'],
-        DIM_DATE, 'dim_date'
-    )
+    sales_disposition = "WRITE_APPEND" if incremental else "WRITE_TRUNCATE"
     
-    # SCD Type 2 for Customer dimension
-    scd_type2_merge_customer(client, transformed_data['dim_customer'])
-    stats['dim_customer'] = len(transformed_data['dim_customer'])
+    def scd2_task(table_name):
+        return lambda: scd_type2_merge(
+            client, transformed_data[table_name], table_name
+        )
     
-    stats['dim_product'] = load_table(
-        client, transformed_data['dim_product'],
-        DIM_PRODUCT, 'dim_product'
-    )
+    def table_task(df, table_id, table_name, write_disposition="WRITE_TRUNCATE"):
+        return lambda: load_table(
+            client, df, table_id, table_name, write_disposition
+        )
     
-    stats['dim_product_category'] = load_table(
-        client, transformed_data['dim_product_category'],
-        DIM_PRODUCT_CATEGORY, 'dim_product_category'
-    )
+    def sales_task(df, table_id, table_name):
+        if incremental and replace_partitions:
+            return lambda: load_table_partitions(client, df, table_id, table_name)
+        return table_task(df, table_id, table_name, sales_disposition)
     
-    # 3. Load fact table
-    stats['fact_sales'] = load_table(
-        client, transformed_data['fact_sales'],
-        FACT_SALES, 'fact_sales'
-    )
+    # 1. Staging + dimension tables (no mutual dependencies)
+    dimension_tasks = {
+        'stg_retail_sales': sales_task(
+            transformed_data.get('stg_retail_sales'),
+            STG_RETAIL_SALES, 'stg_retail_sales'
+        ),
+        'stg_api_products': table_task(
+            stg_api, STG_API_PRODUCTS, 'stg_api_products'
+        ),
+        'dim_date': lambda: load_dim_date(client, transformed_data['dim_date']),
+        'dim_customer': scd2_task('dim_customer'),
+        'dim_product': scd2_task('dim_product'),
+        'dim_product_category': (
+            (lambda: merge_dim_product_category(
+                client, transformed_data['dim_product_category']
+            ))
+            if incremental else table_task(
+                transformed_data['dim_product_category'],
+                DIM_PRODUCT_CATEGORY, 'dim_product_category'
+            )
+        ),
+    }
     
-    # 4. Load data marts (full refresh)
-    stats['mart_sales_performance'] = load_table(
-        client, transformed_data['mart_sales_performance'],
-        MART_SALES_PERFORMANCE, 'mart_sales_performance'
-    )
+    # 2. Fact table (references the dimension keys)
+    fact_tasks = {
+        'fact_sales': sales_task(
+            transformed_data.get('fact_sales'),
+            FACT_SALES, 'fact_sales'
+        ),
+    }
     
-    stats['mart_category_analysis'] = load_table(
-        client, transformed_data['mart_category_analysis'],
-        MART_CATEGORY_ANALYSIS, 'mart_category_analysis'
-    )
+    # 3. Data marts (full refresh, derived from the fact table)
+    mart_tasks = {
+        'mart_sales_performance': table_task(
+            transformed_data['mart_sales_performance'],
+            MART_SALES_PERFORMANCE, 'mart_sales_performance'
+        ),
+        'mart_category_analysis': table_task(
+            transformed_data['mart_category_analysis'],
+            MART_CATEGORY_ANALYSIS, 'mart_category_analysis'
+        ),
+    }
+    
+    # Marts are None when an incremental run had no persisted partials
+    skipped_marts = [
+        name for name in mart_tasks if transformed_data.get(name) is None
+    ]
+    if skipped_marts:
+        logger.info(f"[LOAD] Data marts not rebuilt this run: {skipped_marts}")
+        mart_tasks = {
+            name: task for name, task in mart_tasks.items()
+            if name not in skipped_marts
+        }
+    
+    stats = {}
+    for stage_name, tasks in [
+        ('dimensions', dimension_tasks),
+        ('fact', fact_tasks),
+        ('marts', mart_tasks),
+    ]:
+        pending = {
+            name: task for name, task in tasks.items()
+            if name not in streamed_rows
+        }
+        stage_stats = run_load_stage(stage_name, pending, max_workers)
+        for name in tasks:
+            stats[name] = streamed_rows.get(name, stage_stats.get(name))
     
     logger.info("=" * 60)
     logger.info("[OK] ALL DATA LOADED TO BIGQUERY")
@@ -7,16 +7,23 @@ before loading to BigQuery.
 
 import pandas as pd
 import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
+from typing import Optional
 
 try:
     import mysql.connector
+    from mysql.connector import errorcode, pooling
     from mysql.connector import Error as MySQLError
     MYSQL_AVAILABLE = True
 except ImportError:
     MYSQL_AVAILABLE = False
 
-from config.settings import MYSQL_CONFIG
+from config.settings import MYSQL_CONFIG, MYSQL_LOAD_DATA_INFILE, ETL_BATCH_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -25,157 +32,359 @@ logger = logging.getLogger(__name__)
 # DATABASE CONNECTION
 # ═══════════════════════════════════════════════════════════════════════
 
-def get_mysql_connection():
-    """Create and return a MySQL connection."""
+POOL_KEYS = ('pool_name', 'pool_size', 'pool_reset_session')
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _require_mysql():
     if not MYSQL_AVAILABLE:
         raise ImportError(
             "mysql-connector-python is not installed. "
             "Install with: pip install mysql-connector-python"
         )
+
+
+def _connection_config(include_database: bool = True) -> dict:
+    """MYSQL_CONFIG without the pool settings (and optionally the database)."""
+    return {
+        k: v for k, v in MYSQL_CONFIG.items()
+        if k not in POOL_KEYS and (include_database or k != 'database')
+    }
+
+
+def get_connection_pool():
+    """
+    Return the process-wide MySQL connection pool, creating it on first
+    use. Size and name come from MYSQL_CONFIG ('pool_size', 'pool_name').
+    """
+    global _pool
+    _require_mysql()
     
+    with _pool_lock:
+        if _pool is None:
+            _pool = pooling.MySQLConnectionPool(
+                pool_name=MYSQL_CONFIG.get('pool_name', 'retail_staging_pool'),
+                pool_size=MYSQL_CONFIG.get('pool_size', 5),
+                pool_reset_session=True,
+                **_connection_config()
+            )
+            logger.info(
+                f"✅ Created MySQL connection pool '{_pool.pool_name}' "
+                f"(size {_pool.pool_size})"
+            )
+    return _pool
+
+
+def get_mysql_connection():
+    """
+    Check out a MySQL connection from the pool.
+    Calling close() on it returns it to the pool.
+    """
     try:
-        conn = mysql.connector.connect(**MYSQL_CONFIG)
-        if conn.is_connected():
-            logger.info("✅ Connected to MySQL database")
-            return conn
+        conn = get_connection_pool().get_connection()
+        # Health check: reconnect if the server dropped the idle connection
+        conn.ping(reconnect=True, attempts=3, delay=1)
+        return conn
     except MySQLError as e:
         logger.error(f"❌ MySQL connection failed: {e}")
         raise
 
 
-def create_staging_database():
-    """Create the staging database and tables."""
-    config_no_db = {k: v for k, v in MYSQL_CONFIG.items() if k != 'database'}
-    
+@contextmanager
+def mysql_connection():
+    """Context manager that checks out a pooled connection and returns it."""
+    conn = get_mysql_connection()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def _create_database(db_name: str):
+    """
+    Create the staging database with a one-off connection. Only needed
+    when the database does not exist yet, since pooled connections
+    are bound to it.
+    """
+    conn = mysql.connector.connect(**_connection_config(include_database=False))
     try:
-        conn = mysql.connector.connect(**config_no_db)
         cursor = conn.cursor()
-        
-        db_name = MYSQL_CONFIG['database']
         cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{db_name}`")
-        cursor.execute(f"USE `{db_name}`")
-        
-        # Create staging tables
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS stg_retail_sales (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                transaction_id INT,
-                sale_date DATE,
-                customer_id VARCHAR(20),
-                gender VARCHAR(10),
-                age INT,
-                product_category VARCHAR(50),
-                quantity INT,
-                price_per_unit DECIMAL(10, 2),
-                total_amount DECIMAL(10, 2),
-                row_hash VARCHAR(64),
-                extracted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                source VARCHAR(50),
-                INDEX idx_customer (customer_id),
-                INDEX idx_date (sale_date),
-                INDEX idx_category (product_category)
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS stg_api_products (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                api_product_id INT,
-                product_name VARCHAR(255),
-                api_price DECIMAL(10, 2),
-                description TEXT,
-                product_category VARCHAR(100),
-                product_image_url VARCHAR(500),
-                rating_rate DECIMAL(3, 1),
-                rating_count INT,
-                extracted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                source VARCHAR(50),
-                INDEX idx_product_id (api_product_id),
-                INDEX idx_category (product_category)
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS etl_run_log (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                run_id VARCHAR(36),
-                stage VARCHAR(20),
-                status VARCHAR(20),
-                records_processed INT,
-                duration_seconds DECIMAL(10, 2),
-                error_message TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-        """)
-        
         conn.commit()
-        logger.info(f"✅ MySQL staging database '{db_name}' created/verified")
-        
         cursor.close()
+    finally:
         conn.close()
+
+
+def create_staging_database():
+    """Create the staging database and tables."""
+    db_name = MYSQL_CONFIG['database']
+    
+    try:
+        try:
+            with mysql_connection():
+                pass
+        except MySQLError as e:
+            if e.errno != errorcode.ER_BAD_DB_ERROR:
+                raise
+            _create_database(db_name)
+        
+        with mysql_connection() as conn:
+            cursor = conn.cursor()
+            
+            # Create staging tables
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS stg_retail_sales (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    transaction_id INT,
+                    sale_date DATE,
+                    customer_id VARCHAR(20),
+                    gender VARCHAR(10),
+                    age INT,
+                    product_category VARCHAR(50),
+                    quantity INT,
+                    price_per_unit DECIMAL(10, 2),
+                    total_amount DECIMAL(10, 2),
+                    row_hash VARCHAR(64),
+                    extracted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    source VARCHAR(50),
+                    INDEX idx_customer (customer_id),
+                    INDEX idx_date (sale_date),
+                    INDEX idx_category (product_category)
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+            """)
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS stg_api_products (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    api_product_id INT,
+                    product_name VARCHAR(255),
+                    api_price DECIMAL(10, 2),
+                    description TEXT,
+                    product_category VARCHAR(100),
+                    product_image_url VARCHAR(500),
+                    rating_rate DECIMAL(3, 1),
+                    rating_count INT,
+                    extracted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    source VARCHAR(50),
+                    INDEX idx_product_id (api_product_id),
+                    INDEX idx_category (product_category)
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+            """)
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS etl_run_log (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    run_id VARCHAR(36),
+                    stage VARCHAR(20),
+                    status VARCHAR(20),
+                    records_processed INT,
+                    duration_seconds DECIMAL(10, 2),
+                    error_message TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+            """)
+            
+            conn.commit()
+            logger.info(f"✅ MySQL staging database '{db_name}' created/verified")
+            
+            cursor.close()
         
     except MySQLError as e:
         logger.error(f"❌ Failed to create staging database: {e}")
         raise
 
 
-def load_to_staging(df: pd.DataFrame, table_name: str):
-    """Load a DataFrame into a MySQL staging table."""
-    conn = get_mysql_connection()
+# ═══════════════════════════════════════════════════════════════════════
+# BULK LOADING
+# ═══════════════════════════════════════════════════════════════════════
+
+STAGING_COLUMNS = {
+    'stg_retail_sales': [
+        'transaction_id', 'sale_date', 'customer_id', 'gender', 'age',
+        'product_category', 'quantity', 'price_per_unit', 'total_amount',
+        'row_hash', 'source',
+    ],
+    'stg_api_products': [
+        'api_product_id', 'product_name', 'api_price', 'description',
+        'product_category', 'product_image_url', 'rating_rate',
+        'rating_count', 'source',
+    ],
+}
+
+
+def _first_column(df: pd.DataFrame, names: list, default):
+    """Return the first of ``names`` present in ``df``, else ``default``."""
+    for name in names:
+        if name in df.columns:
+            return df[name]
+    return default
+
+
+def _staging_frame(df: pd.DataFrame, table_name: str) -> pd.DataFrame:
+    """Convert a transformed DataFrame to the staging table's column layout."""
+    if table_name == 'stg_retail_sales':
+        frame = pd.DataFrame({
+            'transaction_id': df['transaction_id'].astype('Int64'),
+            'sale_date': df['date'].dt.strftime('%Y-%m-%d'),
+            'customer_id': df['customer_id'],
+            'gender': df['gender'],
+            'age': df['age'].astype('Int64'),
+            'product_category': df['product_category'],
+            'quantity': df['quantity'].astype('Int64'),
+            'price_per_unit': df['price_per_unit'].astype(float),
+            'total_amount': df['total_amount'].astype(float),
+            'row_hash': _first_column(df, ['row_hash'], ''),
+            'source': _first_column(df, ['_source'], 'kaggle'),
+        }, index=df.index)
+    elif table_name == 'stg_api_products':
+        frame = pd.DataFrame({
+            'api_product_id': pd.Series(
+                _first_column(df, ['id', 'api_product_id'], 0), index=df.index
+            ).astype('Int64'),
+            'product_name': _first_column(df, ['title', 'product_name'], ''),
+            'api_price': pd.Series(
+                _first_column(df, ['price', 'api_price'], 0), index=df.index
+            ).astype(float),
+            'description': pd.Series(
+                _first_column(df, ['description'], ''), index=df.index
+            ).astype(str).str[:500],
+            'product_category': _first_column(df, ['category', 'product_category'], ''),
+            'product_image_url': _first_column(df, ['image', 'product_image_url'], ''),
+            'rating_rate': pd.Series(
+                _first_column(df, ['rating_rate'], 0), index=df.index
+            ).astype(float),
+            'rating_count': pd.Series(
+                _first_column(df, ['rating_count'], 0), index=df.index
+            ).astype('Int64'),
+            'source': _first_column(df, ['_source'], 'fake_store_api'),
+        }, index=df.index)
+    else:
+        raise ValueError(f"Unknown staging table: {table_name}")
+    
+    return frame[STAGING_COLUMNS[table_name]]
+
+
+def _parameter_batches(frame: pd.DataFrame, batch_size: int):
+    """
+    Yield lists of row tuples of at most ``batch_size`` rows.
+    Each column is converted to Python values once (NaN -> None).
+    """
+    columns = [
+        frame[col].astype(object).where(frame[col].notna(), None).tolist()
+        for col in frame.columns
+    ]
+    for start in range(0, len(frame), batch_size):
+        yield list(zip(*(col[start:start + batch_size] for col in columns)))
+
+
+def _insert_batches(cursor, frame: pd.DataFrame, table_name: str, batch_size: int):
+    """Insert with executemany; the connector rewrites each batch into one multi-row INSERT."""
+    columns = STAGING_COLUMNS[table_name]
+    insert_sql = (
+        f"INSERT INTO `{table_name}` ({', '.join(columns)}) "
+        f"VALUES ({', '.join(['%s'] * len(columns))})"
+    )
+    for batch in _parameter_batches(frame, batch_size):
+        cursor.executemany(insert_sql, batch)
+
+
+def _load_data_infile(cursor, frame: pd.DataFrame, table_name: str):
+    """Bulk-load through a temporary CSV file and LOAD DATA LOCAL INFILE."""
+    tmp = tempfile.NamedTemporaryFile(
+        mode='w', suffix='.csv', delete=False, newline='', encoding='utf-8'
+    )
+    try:
+        with tmp:
+            frame.to_csv(
+                tmp, index=False, header=False, na_rep='NULL', lineterminator='\n'
+            )
+        cursor.execute(
+            f"""
+            LOAD DATA LOCAL INFILE %s
+            INTO TABLE `{table_name}`
+            CHARACTER SET utf8mb4
+            FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' ESCAPED BY ''
+            LINES TERMINATED BY '\\n'
+            ({', '.join(frame.columns)})
+            """,
+            (tmp.name,)
+        )
+    finally:
+        os.remove(tmp.name)
+
+
+def load_to_staging(
+    df: pd.DataFrame,
+    table_name: str,
+    use_load_data: Optional[bool] = None,
+    batch_size: int = ETL_BATCH_SIZE
+) -> dict:
+    """
+    Load a DataFrame into a MySQL staging table.
+    
+    Rows are sent in column-oriented batches of ``batch_size`` through
+    executemany (multi-row INSERTs), or via LOAD DATA LOCAL INFILE from a
+    temporary CSV when ``use_load_data`` is set (defaults to
+    MYSQL_LOAD_DATA_INFILE). If the server rejects LOAD DATA the batched
+    INSERT path is used instead.
+    
+    Returns:
+        dict with rows, seconds, rows_per_sec and method
+    """
+    frame = _staging_frame(df, table_name)
+    if use_load_data is None:
+        use_load_data = MYSQL_LOAD_DATA_INFILE
+    
+    with mysql_connection() as conn:
+        return _load_frame(conn, frame, table_name, use_load_data, batch_size)
+
+
+def _load_frame(
+    conn,
+    frame: pd.DataFrame,
+    table_name: str,
+    use_load_data: bool,
+    batch_size: int
+) -> dict:
+    """Truncate ``table_name`` and bulk-load ``frame`` on ``conn``."""
     cursor = conn.cursor()
     
     try:
+        start = time.perf_counter()
+        
         # Truncate existing data
         cursor.execute(f"TRUNCATE TABLE `{table_name}`")
         
-        if table_name == 'stg_retail_sales':
-            insert_sql = """
-                INSERT INTO stg_retail_sales 
-                (transaction_id, sale_date, customer_id, gender, age,
-                 product_category, quantity, price_per_unit, total_amount,
-                 row_hash, source)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            for _, row in df.iterrows():
-                cursor.execute(insert_sql, (
-                    int(row['transaction_id']),
-                    row['date'].strftime('%Y-%m-%d'),
-                    row['customer_id'],
-                    row['gender'],
-                    int(row['age']),
-                    row['product_category'],
-                    int(row['quantity']),
-                    float(row['price_per_unit']),
-                    float(row['total_amount']),
-                    row.get('row_hash', ''),
-                    row.get('_source', 'kaggle'),
-                ))
-                
-        elif table_name == 'stg_api_products':
-            insert_sql = """
-                INSERT INTO stg_api_products
-                (api_product_id, product_name, api_price, description,
-                 product_category, product_image_url, rating_rate,
-                 rating_count, source)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            for _, row in df.iterrows():
-                cursor.execute(insert_sql, (
-                    int(row.get('id', row.get('api_product_id', 0))),
-                    row.get('title', row.get('product_name', '')),
-                    float(row.get('price', row.get('api_price', 0))),
-                    str(row.get('description', ''))[:500],
-                    row.get('category', row.get('product_category', '')),
-                    row.get('image', row.get('product_image_url', '')),
-                    float(row.get('rating_rate', 0)),
-                    int(row.get('rating_count', 0)),
-                    row.get('_source', 'fake_store_api'),
-                ))
+        method = 'executemany'
+        if use_load_data:
+            try:
+                _load_data_infile(cursor, frame, table_name)
+                method = 'load_data_infile'
+            except MySQLError as e:
+                logger.warning(
+                    f"⚠️ LOAD DATA LOCAL INFILE failed for {table_name} ({e}); "
+                    "falling back to batched INSERTs"
+                )
+        if method == 'executemany':
+            _insert_batches(cursor, frame, table_name, batch_size)
         
         conn.commit()
+        elapsed = time.perf_counter() - start
+        
+        stats = {
+            'rows': len(frame),
+            'seconds': round(elapsed, 3),
+            'rows_per_sec': round(len(frame) / elapsed, 1) if elapsed > 0 else None,
+            'method': method,
+        }
         logger.info(
-            f"✅ Loaded {len(df)} rows into MySQL staging: {table_name}"
+            f"✅ Loaded {len(frame)} rows into MySQL staging: {table_name} "
+            f"({stats['rows_per_sec']} rows/sec via {method})"
         )
+        return stats
         
     except MySQLError as e:
         conn.rollback()
@@ -183,18 +392,13 @@ def load_to_staging(df: pd.DataFrame, table_name: str):
         raise
     finally:
         cursor.close()
-        conn.close()
 
 
 def read_from_staging(table_name: str) -> pd.DataFrame:
     """Read data from a MySQL staging table."""
-    conn = get_mysql_connection()
-    
-    try:
+    with mysql_connection() as conn:
         df = pd.read_sql(f"SELECT * FROM `{table_name}`", conn)
         logger.info(
             f"✅ Read {len(df)} rows from MySQL staging: {table_name}"
         )
         return df
-    finally:
-        conn.close()
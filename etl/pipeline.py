@@ -10,14 +10,24 @@ import os
 import io
 import logging
 import time
+import uuid
 from datetime import datetime
+from typing import Optional
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from etl.extract import extract_all
-from etl.transform import transform_all
-from etl.load import load_all
+from etl.extract import (
+    RETAIL_SALES_SOURCE,
+    extract_all,
+    extract_api_sources,
+    extract_retail_sales_chunks,
+    retail_sales_watermark,
+)
+from etl.transform import transform_all, transform_all_chunked, commit_mart_partials
+from etl.load import load_all, get_bq_client, ensure_dataset_exists, make_chunk_loader
+from etl.state import set_watermark, clear_watermark
+from etl.landing import extract_from_landing
 
 
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
@@ -45,13 +55,53 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
     return logging.getLogger("ETL_PIPELINE")
 
 
-def run_pipeline(skip_load: bool = False):
+def run_pipeline(
+    skip_load: bool = False,
+    chunked: bool = False,
+    incremental: bool = False,
+    land: Optional[bool] = None,
+    from_landing: Optional[str] = None,
+    replace_partitions: bool = False,
+    partition_dates: Optional[list] = None
+):
     """
     Execute the full ETL pipeline.
     
     Args:
         skip_load: If True, skip BigQuery loading (useful for testing)
+        chunked: If True, stream the retail sales CSV in ETL_CHUNK_SIZE
+            chunks through transform and load instead of reading it whole
+        incremental: If True, process only retail sales past the stored
+            watermark and append them; the watermark advances only after
+            a successful load
+        land: If True, persist raw extracts to the Parquet landing zone
+            (None: ETL_LANDING_ZONE, never in incremental mode, since the
+            landing zone holds full extracts only)
+        from_landing: Skip extraction and replay a landed extract instead:
+            an extract date (YYYY-MM-DD) or 'latest'
+        replace_partitions: With incremental, rebuild the sale-date
+            partitions touched by the delta from every source row of those
+            dates (not just the delta) instead of appending
+        partition_dates: With replace_partitions, further sale dates to
+            rebuild (YYYY-MM-DD), e.g. a re-delivered day that brings no
+            new Transaction IDs
     """
+    if replace_partitions and not incremental:
+        raise ValueError("replace_partitions requires incremental mode")
+    if partition_dates and not replace_partitions:
+        raise ValueError("partition_dates requires replace_partitions")
+    if chunked and incremental:
+        raise ValueError("chunked and incremental modes cannot be combined")
+    if land and incremental:
+        raise ValueError(
+            "land cannot be combined with incremental mode: a watermark "
+            "delta replayed from the landing zone would replace full history"
+        )
+    if from_landing and (chunked or incremental):
+        raise ValueError(
+            "from_landing cannot be combined with chunked or incremental mode"
+        )
+    
     logger = setup_logging()
     
     pipeline_start = time.time()
@@ -62,7 +112,11 @@ def run_pipeline(skip_load: bool = False):
     logger.info("+" + "=" * 58 + "+")
     logger.info(f"Pipeline started at: {datetime.now().isoformat()}")
     
+    run_id = f"pipeline_{datetime.now():%Y%m%dT%H%M%S}_{uuid.uuid4().hex[:8]}"
+    logger.info(f"Run id: {run_id}")
+    
     results = {
+        'run_id': run_id,
         'start_time': datetime.now(),
         'status': 'running',
         'stages': {},
@@ -75,56 +129,126 @@ def run_pipeline(skip_load: bool = False):
         logger.info("#" * 60)
         
         extract_start = time.time()
-        extracted_data = extract_all()
+        if from_landing:
+            extracted_data = extract_from_landing(
+                None if from_landing == 'latest' else from_landing
+            )
+        elif chunked:
+            # Retail sales are streamed during transform; only the API
+            # sources are extracted up front.
+            api_products, api_categories = extract_api_sources()
+            extracted_data = {
+                'api_products': api_products,
+                'api_categories': api_categories,
+            }
+        else:
+            extracted_data = extract_all(
+                incremental=incremental,
+                land=land,
+                replace_partitions=replace_partitions,
+                partition_dates=partition_dates
+            )
         extract_time = time.time() - extract_start
         
         results['stages']['extract'] = {
             'status': 'success',
             'duration_seconds': round(extract_time, 2),
             'records': {
-                'retail_sales': len(extracted_data['retail_sales']),
-                'api_products': len(extracted_data['api_products']),
-                'api_categories': len(extracted_data['api_categories']),
+                key: len(val) for key, val in extracted_data.items()
+                if key not in ('watermark', 'next_watermark')
             }
         }
         
-        # =========== STAGE 2: TRANSFORM ===========
-        logger.info("\n" + "#" * 60)
-        logger.info("# STAGE 2: TRANSFORM")
-        logger.info("#" * 60)
-        
-        transform_start = time.time()
-        transformed_data = transform_all(extracted_data)
-        transform_time = time.time() - transform_start
-        
-        results['stages']['transform'] = {
-            'status': 'success',
-            'duration_seconds': round(transform_time, 2),
-            'tables': {
-                key: len(val) for key, val in transformed_data.items()
-                if hasattr(val, '__len__')
-            }
-        }
-        
-        # =========== STAGE 3: LOAD ===========
-        if not skip_load:
+        if incremental and extracted_data['retail_sales'].empty:
+            logger.info("\n>> NO NEW RETAIL SALES - SKIPPING TRANSFORM AND LOAD")
+            results['stages']['transform'] = {'status': 'skipped'}
+            results['stages']['load'] = {'status': 'skipped'}
+        else:
+            # =========== STAGE 2: TRANSFORM ===========
             logger.info("\n" + "#" * 60)
-            logger.info("# STAGE 3: LOAD TO BIGQUERY")
+            logger.info("# STAGE 2: TRANSFORM")
             logger.info("#" * 60)
             
-            load_start = time.time()
-            load_stats = load_all(transformed_data)
-            load_time = time.time() - load_start
+            transform_start = time.time()
+            streamed_rows = None
+            if chunked:
+                # Streamed tables are loaded chunk by chunk as they are built
+                sink = None
+                if not skip_load:
+                    client = get_bq_client()
+                    ensure_dataset_exists(client)
+                    sink = make_chunk_loader(client)
+                transformed_data = transform_all_chunked(
+                    extract_retail_sales_chunks, extracted_data, sink=sink
+                )
+                streamed_rows = transformed_data.pop('streamed_rows')
+            else:
+                transformed_data = transform_all(
+                    extracted_data,
+                    run_id=run_id,
+                    replace_partitions=replace_partitions
+                )
+            transform_time = time.time() - transform_start
             
-            results['stages']['load'] = {
+            results['stages']['transform'] = {
                 'status': 'success',
-                'duration_seconds': round(load_time, 2),
-                'rows_loaded': load_stats,
+                'duration_seconds': round(transform_time, 2),
+                'tables': {
+                    **{
+                        key: len(val) for key, val in transformed_data.items()
+                        if hasattr(val, '__len__')
+                    },
+                    **(streamed_rows or {}),
+                }
             }
-        else:
-            logger.info("\n>> SKIPPING LOAD STAGE (skip_load=True)")
-            results['stages']['load'] = {'status': 'skipped'}
-        
+            
+            # =========== STAGE 3: LOAD ===========
+            if not skip_load:
+                logger.info("\n" + "#" * 60)
+                logger.info("# STAGE 3: LOAD TO BIGQUERY")
+                logger.info("#" * 60)
+            
+                load_start = time.time()
+                # Append only once a watermark exists; the first incremental
+                # run is a full load
+                load_stats = load_all(
+                    transformed_data,
+                    streamed_rows=streamed_rows,
+                    incremental=bool(extracted_data.get('watermark')),
+                    replace_partitions=replace_partitions
+                )
+                load_time = time.time() - load_start
+            
+                results['stages']['load'] = {
+                    'status': 'success',
+                    'duration_seconds': round(load_time, 2),
+                    'rows_loaded': load_stats,
+                }
+            
+                # Advance the watermark now that the load has succeeded
+                if chunked:
+                    # Not tracked for streamed runs: the next incremental
+                    # run starts with a full load again
+                    clear_watermark(RETAIL_SALES_SOURCE)
+                else:
+                    watermark = extracted_data.get('next_watermark') or retail_sales_watermark(
+                        extracted_data['retail_sales']
+                    )
+                    watermark = dict(watermark)
+                    # Rebuilt partitions also hold rows loaded before;
+                    # count only the rows past the previous mark
+                    previous = extracted_data.get('watermark')
+                    fact_sales = transformed_data['fact_sales']
+                    watermark['fact_rows'] += int(
+                        (fact_sales['transaction_id'] > previous['transaction_id']).sum()
+                        if previous else len(fact_sales)
+                    )
+                    set_watermark(RETAIL_SALES_SOURCE, watermark)
+                    commit_mart_partials(run_id)
+            else:
+                logger.info("\n>> SKIPPING LOAD STAGE (skip_load=True)")
+                results['stages']['load'] = {'status': 'skipped'}
+            
         # =========== SUMMARY ===========
         total_time = time.time() - pipeline_start
         results['status'] = 'success'
@@ -168,6 +292,41 @@ if __name__ == "__main__":
         action="store_true",
         help="Skip BigQuery loading (run extract + transform only)"
     )
+    parser.add_argument(
+        "--chunked",
+        action="store_true",
+        help="Stream the retail sales CSV in ETL_CHUNK_SIZE chunks"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Process only retail sales past the stored watermark (append)"
+    )
+    parser.add_argument(
+        "--replace-partitions",
+        nargs="*",
+        metavar="DATE",
+        help=(
+            "With --incremental: rebuild the sale-date partitions in the delta "
+            "(and any given YYYY-MM-DD dates) from all their source rows"
+        )
+    )
+    parser.add_argument(
+        "--land",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Persist raw extracts to the Parquet landing zone "
+            "(default: ETL_LANDING_ZONE, except with --incremental)"
+        )
+    )
+    parser.add_argument(
+        "--from-landing",
+        nargs="?",
+        const="latest",
+        metavar="DATE",
+        help="Replay a landed extract (YYYY-MM-DD, default: latest) instead of extracting"
+    )
     parser.add_argument(
         "--extract-only",
         action="store_true", 
@@ -179,10 +338,18 @@ if __name__ == "__main__":
     if args.extract_only:
         logger = setup_logging()
         logger.info("Running extraction only...")
-        data = extract_all()
+        data = extract_all(land=args.land)
         logger.info("Extraction complete!")
     else:
-        results = run_pipeline(skip_load=args.skip_load)
+        results = run_pipeline(
+            skip_load=args.skip_load,
+            chunked=args.chunked,
+            incremental=args.incremental,
+            land=args.land,
+            from_landing=args.from_landing,
+            replace_partitions=args.replace_partitions is not None,
+            partition_dates=args.replace_partitions,
+        )
         
         if results['status'] == 'failed':
             sys.exit(1)
@@ -0,0 +1,288 @@
+"""
+QUERIES Module
+---------------------------------------------------------
+Dashboard query layer with filter pushdown.
+
+Dashboard filters (category / gender multiselects, a date range) become
+a parameterized aggregate query over the retail sales rows, so the
+database filters, groups and aggregates and only the rows a chart
+needs come back. Queries reference only the columns behind the
+requested dimensions and measures, and the date range is a predicate on
+the partitioning column of stg_retail_sales (partition pruning in
+BigQuery).
+
+Two dialects share one query builder:
+  - 'bigquery': stg_retail_sales, with named query parameters
+    (@name, ARRAY parameters for IN UNNEST(...))
+  - 'sqlite': an in-memory copy of the local CSV (sqlite_sales_store())
+
+Dimensions and measures use the names of etl.cube, so query results and
+cube slices are interchangeable.
+
+Usage:
+    conn = sqlite_sales_store(read_retail_sales_csv())
+    query_sales(conn, 'sqlite', by=['month'],
+                filters={'gender': ['Female']},
+                date_range=('2023-01-01', '2023-06-30'))
+"""
+
+import logging
+import sqlite3
+from typing import Optional
+
+import pandas as pd
+
+from config.settings import MART_DISTINCT_COUNTS, STG_RETAIL_SALES
+from etl.cube import DAY_NAMES, DERIVED_MEASURES, derive_measures
+from etl.transform import AGE_GROUP_BINS, AGE_GROUP_LABELS
+
+logger = logging.getLogger(__name__)
+
+SQLITE_SALES_TABLE = 'stg_retail_sales'
+
+# Measure -> SQL aggregate over the staging columns
+SALES_MEASURES = {
+    'revenue': 'SUM(total_amount)',
+    'quantity': 'SUM(quantity)',
+    'price_sum': 'SUM(price_per_unit)',
+    'age_sum': 'SUM(age)',
+    'orders': 'COUNT(*)',
+    'transactions': 'COUNT(DISTINCT transaction_id)',
+    'max_order': 'MAX(total_amount)',
+    'min_age': 'MIN(age)',
+    'max_age': 'MAX(age)',
+    'unique_customers': 'COUNT(DISTINCT customer_id)',
+}
+
+# Measures that are 0 (not NULL) over no rows
+ADDITIVE_MEASURES = ['revenue', 'quantity', 'price_sum', 'age_sum']
+
+
+def _age_group_sql(column: str = 'age') -> str:
+    """CASE expression matching pd.cut(age, AGE_GROUP_BINS, AGE_GROUP_LABELS)."""
+    cases = ' '.join(
+        f"WHEN {column} > {low} AND {column} <= {high} THEN '{label}'"
+        for low, high, label in zip(AGE_GROUP_BINS, AGE_GROUP_BINS[1:], AGE_GROUP_LABELS)
+    )
+    return f"CASE {cases} END"
+
+
+def _sqlite_day_name_sql(column: str = 'date') -> str:
+    """Day name of a timestamp in SQLite (strftime('%w') is 0 = Sunday)."""
+    cases = ' '.join(
+        f"WHEN '{(i + 1) % 7}' THEN '{day}'" for i, day in enumerate(DAY_NAMES)
+    )
+    return f"CASE strftime('%w', {column}) {cases} END"
+
+
+# Dimension -> SQL expression per dialect
+SALES_DIMENSIONS = {
+    'bigquery': {
+        'month': "FORMAT_TIMESTAMP('%Y-%m', date)",
+        'day_of_week': "FORMAT_TIMESTAMP('%A', date)",
+        'product_category': 'product_category',
+        'gender': 'gender',
+        'age_group': _age_group_sql(),
+        'order_quantity': 'quantity',
+    },
+    'sqlite': {
+        'month': "strftime('%Y-%m', date)",
+        'day_of_week': _sqlite_day_name_sql(),
+        'product_category': 'product_category',
+        'gender': 'gender',
+        'age_group': _age_group_sql(),
+        'order_quantity': 'quantity',
+    },
+}
+
+
+# =====================================================================
+# QUERY BUILDER
+# =====================================================================
+
+def _required_measures(measures: Optional[list]) -> list:
+    """Base measures to aggregate for the requested (possibly derived) ones."""
+    if measures is None:
+        return list(SALES_MEASURES)
+    required = []
+    for name in measures:
+        for base in DERIVED_MEASURES.get(name, (name,)):
+            if base not in SALES_MEASURES:
+                raise ValueError(f"Unknown sales measure: {base}")
+            if base not in required:
+                required.append(base)
+    return required
+
+
+def _in_predicate(
+    expression: str,
+    name: str,
+    values: list,
+    dialect: str,
+    params: dict
+) -> str:
+    """``expression IN (values)`` with the values bound as parameters."""
+    if dialect == 'bigquery':
+        params[name] = list(values)
+        return f"{expression} IN UNNEST(@{name})"
+    names = []
+    for i, value in enumerate(values):
+        params[f"{name}_{i}"] = value
+        names.append(f":{name}_{i}")
+    return f"{expression} IN ({', '.join(names)})"
+
+
+def sales_query(
+    by: Optional[list] = None,
+    filters: Optional[dict] = None,
+    date_range: Optional[tuple] = None,
+    measures: Optional[list] = None,
+    dialect: str = 'bigquery',
+    table: Optional[str] = None,
+    distinct_counts: str = MART_DISTINCT_COUNTS
+) -> tuple:
+    """
+    Build the aggregate query behind a dashboard chart.
+
+    Args:
+        by: Dimensions to group by (SALES_DIMENSIONS); None for totals
+        filters: dict of dimension -> allowed values
+        date_range: (start, end) dates, both inclusive; None for all dates
+        measures: Measures to return (SALES_MEASURES or DERIVED_MEASURES);
+            None for all base measures
+        dialect: 'bigquery' or 'sqlite'
+        table: Table to query (default stg_retail_sales of the dialect)
+        distinct_counts: 'hll' uses APPROX_COUNT_DISTINCT in BigQuery
+
+    Returns:
+        (sql, params) with params a dict of parameter name -> value
+    """
+    by = list(by or [])
+    dimensions = SALES_DIMENSIONS[dialect]
+    if table is None:
+        table = f"`{STG_RETAIL_SALES}`" if dialect == 'bigquery' else SQLITE_SALES_TABLE
+
+    select = [f"{dimensions[d]} AS {d}" for d in by]
+    for name in _required_measures(measures):
+        aggregate = SALES_MEASURES[name]
+        if dialect == 'bigquery' and distinct_counts == 'hll':
+            aggregate = aggregate.replace('COUNT(DISTINCT ', 'APPROX_COUNT_DISTINCT(')
+        select.append(f"{aggregate} AS {name}")
+
+    params = {}
+    where = []
+    for dimension, values in (filters or {}).items():
+        where.append(_in_predicate(
+            dimensions[dimension], dimension, values, dialect, params
+        ))
+    if date_range is not None:
+        # Half-open [start, end + 1 day) so whole end days are included
+        start = pd.Timestamp(date_range[0]).normalize()
+        end = pd.Timestamp(date_range[1]).normalize() + pd.Timedelta(days=1)
+        if dialect == 'bigquery':
+            params['start_date'], params['end_date'] = start, end
+            where.append("date >= @start_date AND date < @end_date")
+        else:
+            params['start_date'] = start.strftime('%Y-%m-%d %H:%M:%S')
+            params['end_date'] = end.strftime('%Y-%m-%d %H:%M:%S')
+            where.append("date >= :start_date AND date < :end_date")
+
+    sql = f"SELECT {', '.join(select)} FROM {table}"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    if by:
+        positions = ', '.join(str(i + 1) for i in range(len(by)))
+        sql += f" GROUP BY {positions} ORDER BY {positions}"
+    return sql, params
+
+
+def bigquery_parameters(params: dict) -> list:
+    """BigQuery query parameters for a sales_query() params dict."""
+    from google.cloud import bigquery
+
+    parameters = []
+    for name, value in params.items():
+        if isinstance(value, list):
+            parameters.append(bigquery.ArrayQueryParameter(name, 'STRING', value))
+        elif isinstance(value, pd.Timestamp):
+            parameters.append(
+                bigquery.ScalarQueryParameter(name, 'TIMESTAMP', value.to_pydatetime())
+            )
+        else:
+            parameters.append(bigquery.ScalarQueryParameter(name, 'STRING', value))
+    return parameters
+
+
+# =====================================================================
+# EXECUTION
+# =====================================================================
+
+def sqlite_sales_store(df_raw: pd.DataFrame) -> sqlite3.Connection:
+    """
+    Load retail sales rows (CSV column names) into an in-memory SQLite
+    table laid out like stg_retail_sales, indexed on the filter columns.
+    """
+    conn = sqlite3.connect(':memory:', check_same_thread=False)
+    df = df_raw.rename(columns=lambda c: c.strip().lower().replace(' ', '_'))
+    df = df.assign(date=df['date'].dt.strftime('%Y-%m-%d %H:%M:%S'))
+    df.to_sql(SQLITE_SALES_TABLE, conn, index=False)
+    for column in ['date', 'product_category', 'gender']:
+        conn.execute(
+            f"CREATE INDEX idx_{SQLITE_SALES_TABLE}_{column} "
+            f"ON {SQLITE_SALES_TABLE} ({column})"
+        )
+    logger.info(f"[QUERY] SQLite sales store: {len(df)} rows")
+    return conn
+
+
+def query_sales(
+    connection,
+    dialect: str,
+    by: Optional[list] = None,
+    filters: Optional[dict] = None,
+    date_range: Optional[tuple] = None,
+    measures: Optional[list] = None
+) -> pd.DataFrame:
+    """
+    Run a sales_query() on a BigQuery client or SQLite connection.
+
+    Returns:
+        pd.DataFrame with the ``by`` columns and the aggregated and
+        derived measures (day_of_week ordered Monday..Sunday)
+    """
+    by = list(by or [])
+    sql, params = sales_query(by, filters, date_range, measures, dialect)
+
+    if dialect == 'bigquery':
+        from google.cloud import bigquery
+        job_config = bigquery.QueryJobConfig(query_parameters=bigquery_parameters(params))
+        result = connection.query(sql, job_config=job_config).to_dataframe()
+    else:
+        result = pd.read_sql_query(sql, connection, params=params)
+
+    for name in ADDITIVE_MEASURES:
+        if name in result.columns:
+            result[name] = pd.to_numeric(result[name].fillna(0))
+    if 'day_of_week' in result.columns:
+        result['day_of_week'] = pd.Categorical(
+            result['day_of_week'], categories=DAY_NAMES, ordered=True
+        )
+        result = result.sort_values(by, ignore_index=True)
+    result = derive_measures(result)
+    if measures is not None:
+        result = result[by + list(measures)]
+    return result
+
+
+def sales_date_bounds(connection, dialect: str) -> tuple:
+    """(first, last) sale date of the queried table."""
+    table = f"`{STG_RETAIL_SALES}`" if dialect == 'bigquery' else SQLITE_SALES_TABLE
+    sql = f"SELECT MIN(date) AS first_date, MAX(date) AS last_date FROM {table}"
+    if dialect == 'bigquery':
+        bounds = connection.query(sql).to_dataframe()
+    else:
+        bounds = pd.read_sql_query(sql, connection)
+    return (
+        pd.Timestamp(bounds['first_date'].iloc[0]).date(),
+        pd.Timestamp(bounds['last_date'].iloc[0]).date(),
+    )
@@ -0,0 +1,215 @@
+"""
+SKETCHES Module
+---------------------------------------------------------
+HyperLogLog distinct-count sketches in pure NumPy.
+
+A sketch is a uint8 array of 2**precision registers. Sketches of the
+same precision merge with an element-wise maximum, so partial sketches
+built per chunk, per partition or per incremental batch combine into the
+sketch of the union without revisiting the rows. Sketches serialize to
+plain bytes (one byte per register) for Parquet / JSON state.
+
+The relative standard error is about 1.04 / sqrt(2**precision); small
+cardinalities are estimated with linear counting and are close to exact.
+
+Usage:
+    df.groupby('month').agg(customers=('customer_id', approx_nunique()))
+"""
+
+import logging
+from typing import Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from config.settings import HLL_ERROR
+
+logger = logging.getLogger(__name__)
+
+MIN_PRECISION = 4
+MAX_PRECISION = 18
+
+
+# =====================================================================
+# REGISTERS
+# =====================================================================
+
+def hll_precision(error: float = HLL_ERROR) -> int:
+    """Smallest precision whose standard error is at most ``error``."""
+    precision = int(np.ceil(np.log2((1.04 / error) ** 2)))
+    return int(np.clip(precision, MIN_PRECISION, MAX_PRECISION))
+
+
+def _hash_values(values) -> np.ndarray:
+    """64-bit hashes of the non-null values (categoricals hashed per category)."""
+    values = pd.Series(values)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        # Categories are unique, so skip hash_array's own factorization
+        hashes = pd.util.hash_array(
+            values.cat.categories.to_numpy(dtype=object), categorize=False
+        )
+        return hashes[codes[codes >= 0]]
+    values = values.dropna()
+    if values.dtype.kind not in 'iub':
+        return pd.util.hash_array(values.to_numpy(dtype=object))
+    return pd.util.hash_array(values.to_numpy())
+
+
+def _index_and_rank(hashes: np.ndarray, precision: int) -> tuple:
+    """Register index (top bits) and rank (leading zeros + 1 of the rest)."""
+    index = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+    # Keep at most 53 remaining bits so the float64 bit length is exact
+    bits = min(64 - precision, 53)
+    rest = (hashes << np.uint64(precision)) >> np.uint64(64 - bits)
+    bit_length = np.frexp(rest.astype(np.float64))[1]
+    rank = (bits - bit_length + 1).astype(np.uint8)
+    return index, rank
+
+
+def hll_registers(values, precision: int) -> np.ndarray:
+    """Build the sketch of a collection of values."""
+    return hll_group_registers(
+        np.zeros(len(values), dtype=np.int64), 1, values, precision
+    )[0]
+
+
+def hll_group_registers(
+    groups: np.ndarray,
+    n_groups: int,
+    values,
+    precision: int
+) -> np.ndarray:
+    """
+    Build one sketch per group in a single pass.
+
+    Args:
+        groups: Group number (0 .. n_groups-1) of every value
+        n_groups: Number of groups
+        values: Values to count (nulls are ignored)
+        precision: Sketch precision
+
+    Returns:
+        np.ndarray of shape (n_groups, 2**precision), dtype uint8
+    """
+    values = pd.Series(values)
+    groups = np.asarray(groups, dtype=np.int64)
+    valid = values.notna().to_numpy()
+    if not valid.all():
+        values, groups = values[valid], groups[valid]
+
+    m = 1 << precision
+    index, rank = _index_and_rank(_hash_values(values), precision)
+    registers = np.zeros(n_groups * m, dtype=np.uint8)
+    np.maximum.at(registers, groups * m + index, rank)
+    return registers.reshape(n_groups, m)
+
+
+def hll_merge(sketches: Iterable[np.ndarray]) -> np.ndarray:
+    """Union of sketches of the same precision."""
+    return np.maximum.reduce(list(sketches))
+
+
+def hll_estimate(registers: np.ndarray) -> np.ndarray:
+    """
+    Estimated distinct count of a sketch, or of every row of a 2-D
+    array of sketches.
+    """
+    registers = np.atleast_2d(registers)
+    m = registers.shape[1]
+    if m >= 128:
+        alpha = 0.7213 / (1 + 1.079 / m)
+    else:
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}[m]
+
+    raw = alpha * m * m / np.exp2(-registers.astype(np.float64)).sum(axis=1)
+    zeros = (registers == 0).sum(axis=1)
+    with np.errstate(divide='ignore'):
+        linear = m * np.log(m / np.maximum(zeros, 1))
+    estimate = np.where((raw <= 2.5 * m) & (zeros > 0), linear, raw)
+    return estimate if estimate.size > 1 else estimate[0]
+
+
+def hll_to_bytes(registers: np.ndarray) -> bytes:
+    """Serialize a sketch (one byte per register)."""
+    return np.ascontiguousarray(registers, dtype=np.uint8).tobytes()
+
+
+def hll_from_bytes(data: bytes) -> np.ndarray:
+    """Deserialize a sketch written by hll_to_bytes()."""
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+# =====================================================================
+# PANDAS INTEGRATION
+# =====================================================================
+
+def approx_nunique(error: float = HLL_ERROR) -> Callable[[pd.Series], int]:
+    """
+    Named-aggregation function estimating Series.nunique() with a sketch:
+    ``df.groupby(key).agg(n=('col', approx_nunique(0.02)))``.
+    """
+    precision = hll_precision(error)
+
+    def _approx_nunique(values: pd.Series) -> int:
+        return int(round(hll_estimate(hll_registers(values, precision))))
+
+    _approx_nunique.__name__ = 'approx_nunique'
+    return _approx_nunique
+
+
+def grouped_sketches(
+    df: pd.DataFrame,
+    keys: list,
+    column: str,
+    error: float = HLL_ERROR
+) -> pd.DataFrame:
+    """
+    Sketch the distinct values of ``column`` per group.
+
+    Returns:
+        pd.DataFrame with the group keys and a 'sketch' bytes column
+    """
+    codes = df.groupby(keys, observed=True, sort=False).ngroup().to_numpy()
+    valid = codes >= 0  # rows with a null group key are dropped
+    if not valid.all():
+        df, codes = df[valid], codes[valid]
+
+    # With sort=False, groups are numbered in order of first appearance
+    first_rows = np.flatnonzero(~pd.Series(codes).duplicated().to_numpy())
+    registers = hll_group_registers(
+        codes, len(first_rows), df[column], hll_precision(error)
+    )
+    sketches = df[keys].iloc[first_rows].reset_index(drop=True)
+    sketches['sketch'] = [hll_to_bytes(row) for row in registers]
+    return sketches
+
+
+def union_sketches(sketches: pd.DataFrame, keys: list) -> pd.DataFrame:
+    """Union the sketches of a grouped_sketches()-style frame per ``keys``."""
+    if not keys:
+        merged = hll_merge(map(hll_from_bytes, sketches['sketch']))
+        return pd.DataFrame({'sketch': [hll_to_bytes(merged)]})
+    return sketches.groupby(keys, as_index=False, observed=True, sort=False).agg(
+        sketch=('sketch', lambda s: hll_to_bytes(hll_merge(map(hll_from_bytes, s))))
+    )
+
+
+def merge_sketch_frames(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    keys: list
+) -> pd.DataFrame:
+    """Union two grouped_sketches() frames group by group."""
+    return union_sketches(pd.concat([left, right], ignore_index=True), keys)
+
+
+def sketch_counts(sketches: pd.DataFrame) -> pd.Series:
+    """Rounded distinct-count estimate of every row of a sketch frame."""
+    if sketches.empty:
+        return pd.Series(dtype='int64', index=sketches.index)
+    registers = np.vstack([hll_from_bytes(s) for s in sketches['sketch']])
+    return pd.Series(
+        np.rint(np.atleast_1d(hll_estimate(registers))).astype('int64'),
+        index=sketches.index
+    )
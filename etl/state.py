@@ -0,0 +1,120 @@
+"""
+STATE Module
+---------------------------------------------------------
+Small local state store for values that must survive between
+pipeline runs, such as the incremental extraction watermark and the
+categorical dtype registry.
+
+State is kept as a single JSON document under ETL_ARTIFACT_DIR and
+replaced atomically on every write, so an interrupted run never
+leaves a half-written file behind.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Optional
+
+from config.settings import ETL_ARTIFACT_DIR
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = os.path.join(ETL_ARTIFACT_DIR, 'state', 'etl_state.json')
+
+_state_lock = threading.Lock()
+
+# In-process copies of the category registry, keyed by state file:
+# path -> [categories dict, has unsaved additions]
+_category_registries = {}
+
+
+def load_state(path: str = STATE_FILE) -> dict:
+    """Return the persisted state document (empty if none exists yet)."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as fh:
+        return json.load(fh)
+
+
+def save_state(state: dict, path: str = STATE_FILE):
+    """Atomically replace the persisted state document."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as fh:
+        json.dump(state, fh, indent=2, default=str)
+    os.replace(tmp_path, path)
+
+
+def get_watermark(source: str, path: str = STATE_FILE) -> Optional[dict]:
+    """Return the high-water mark recorded for a source, if any."""
+    return load_state(path).get('watermarks', {}).get(source)
+
+
+def set_watermark(source: str, watermark: dict, path: str = STATE_FILE):
+    """Record the high-water mark for a source."""
+    with _state_lock:
+        state = load_state(path)
+        state.setdefault('watermarks', {})[source] = watermark
+        save_state(state, path)
+    logger.info(f"[STATE] Watermark for {source} set to {watermark}")
+
+
+def clear_watermark(source: str, path: str = STATE_FILE):
+    """Forget the high-water mark for a source (next run starts from scratch)."""
+    with _state_lock:
+        state = load_state(path)
+        if state.get('watermarks', {}).pop(source, None) is not None:
+            save_state(state, path)
+            logger.info(f"[STATE] Watermark for {source} cleared")
+
+
+def register_categories(values: dict, path: str = STATE_FILE) -> dict:
+    """
+    Add newly seen values to the shared category registry.
+    
+    The registry keeps one append-only category list per column, so a
+    value keeps the same categorical code across runs and chunks. It is
+    meant for low-cardinality columns only. The state file is read once
+    per process; additions are kept in memory until
+    save_category_registry() writes them (once per run).
+    
+    Args:
+        values: dict of column name -> iterable of observed values
+        
+    Returns:
+        dict of column name -> full ordered category list
+    """
+    with _state_lock:
+        if path not in _category_registries:
+            _category_registries[path] = [
+                load_state(path).get('categories', {}), False
+            ]
+        entry = _category_registries[path]
+        registry = entry[0]
+        for column, observed in values.items():
+            categories = registry.setdefault(column, [])
+            known = set(categories)
+            new = sorted(v for v in set(observed) if v not in known)
+            if new:
+                categories.extend(new)
+                entry[1] = True
+        return {column: list(registry[column]) for column in values}
+
+
+def save_category_registry(path: str = STATE_FILE):
+    """Persist the categories registered in this process (no-op if none are new)."""
+    with _state_lock:
+        entry = _category_registries.get(path)
+        if entry is None or not entry[1]:
+            return
+        state = load_state(path)
+        # Keep values another process registered since this one read the file
+        persisted = state.setdefault('categories', {})
+        for column, categories in entry[0].items():
+            known = persisted.setdefault(column, [])
+            seen = set(known)
+            known.extend(v for v in categories if v not in seen)
+        save_state(state, path)
+        entry[1] = False
+    logger.info(f"[STATE] Category registry saved to {path}")
@@ -16,9 +16,36 @@ Implements:
 
 import pandas as pd
 import numpy as np
-import hashlib
 import logging
+import os
+import shutil
+import time
+import uuid
 from datetime import datetime, timedelta
+from typing import Callable, Iterable, Optional
+
+from config.settings import (
+    DIM_DATE_FUTURE_YEARS,
+    ETL_ARTIFACT_DIR,
+    MART_DISTINCT_COUNTS,
+)
+from etl.artifacts import run_artifact_dir
+from etl.date_dimension import build_calendar_cached, load_holidays
+from etl.hashing import hash_columns
+from etl.keys import (
+    assign_surrogate_keys,
+    date_keys,
+    load_key_registry,
+    resolve_surrogate_keys,
+    unresolved_key_report,
+)
+from etl.sketches import (
+    grouped_sketches,
+    merge_sketch_frames,
+    sketch_counts,
+    union_sketches,
+)
+from etl.state import register_categories, save_category_registry
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +54,29 @@ logger = logging.getLogger(__name__)
 # DATA CLEANING & VALIDATION
 # =====================================================================
 
+# Low-cardinality sales columns held as pandas categoricals from cleaning
+# through fact and mart building. High-cardinality ids (customer_id) stay
+# plain strings: their registry would grow without bound.
+CATEGORICAL_COLUMNS = ['gender', 'product_category', '_source']
+
+
+def to_categorical(
+    df: pd.DataFrame,
+    columns: list = CATEGORICAL_COLUMNS
+) -> pd.DataFrame:
+    """
+    Convert ``columns`` to categoricals backed by the shared category
+    registry (etl.state), so codes are stable across runs and chunks.
+    """
+    columns = [col for col in columns if col in df.columns]
+    registry = register_categories({
+        col: df[col].dropna().unique().tolist() for col in columns
+    })
+    for col in columns:
+        df[col] = pd.Categorical(df[col], categories=registry[col])
+    return df
+
+
 def clean_retail_sales(df: pd.DataFrame) -> pd.DataFrame:
     """Clean and validate the retail sales DataFrame."""
     logger.info("[CLEAN] Cleaning retail sales data...")
@@ -47,8 +97,8 @@ def clean_retail_sales(df: pd.DataFrame) -> pd.DataFrame:
         logger.warning(f"[WARN] Removing {null_dates} rows with invalid dates")
         df_clean = df_clean.dropna(subset=['date'])
     
-    # Validate numeric columns
-    numeric_cols = ['quantity', 'price_per_unit', 'total_amount']
+    # Validate numeric columns (malformed values become NaN)
+    numeric_cols = ['age', 'quantity', 'price_per_unit', 'total_amount']
     for col in numeric_cols:
         df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
     
@@ -85,13 +135,12 @@ def clean_retail_sales(df: pd.DataFrame) -> pd.DataFrame:
     df_clean['age'] = df_clean['age'].clip(lower=18, upper=100)
     
     # Generate surrogate keys
-    df_clean['row_hash'] = df_clean.apply(
-        lambda row: hashlib.md5(
-            f"{row['transaction_id']}_{row['date']}_{row['customer_id']}".encode()
-        ).hexdigest(),
-        axis=1
+    df_clean['row_hash'] = hash_columns(
+        df_clean, ['transaction_id', 'date', 'customer_id']
     )
     
+    df_clean = to_categorical(df_clean)
+    
     logger.info(f"[OK] Cleaned retail sales: {len(df_clean)} records remain")
     return df_clean
 
@@ -127,6 +176,66 @@ def clean_api_products(df: pd.DataFrame) -> pd.DataFrame:
     return df_clean
 
 
+# =====================================================================
+# CHUNK FOLDING
+# =====================================================================
+
+def _partial_rows(partial) -> int:
+    """Row count of a partial: a DataFrame or a dict of DataFrames."""
+    if isinstance(partial, dict):
+        return sum(len(df) for df in partial.values())
+    return len(partial)
+
+
+def _merge_in_order(parts: list, merge: Callable):
+    """Merge partials pairwise in a balanced tree, keeping their order."""
+    while len(parts) > 1:
+        parts = [
+            merge(parts[i], parts[i + 1]) if i + 1 < len(parts) else parts[i]
+            for i in range(0, len(parts), 2)
+        ]
+    return parts[0]
+
+
+def fold_partial(
+    state: Optional[dict],
+    partial,
+    merge: Callable
+) -> dict:
+    """
+    Fold one chunk's partial into a running fold of mergeable partials.
+    
+    Merging every chunk straight into the accumulator re-processes the
+    whole accumulator per chunk, which is quadratic in the number of
+    chunks once it grows with the input. Partials are buffered instead
+    and merged (pairwise, in source order) into the accumulator only when
+    the buffer holds at least as many rows, so each row takes part in
+    O(log chunks) merges. The fold holds at most twice the rows of the
+    merged result plus one chunk's partial; see folded_partials().
+    
+    Args:
+        state: Previous fold_partial() result, or None to start a fold
+        partial: Partial of the next chunk (DataFrame or dict of DataFrames)
+        merge: Binary merge of two partials, e.g. merge_customer_aggregates
+    """
+    state = state or {'merged': None, 'pending': [], 'pending_rows': 0}
+    state['pending'].append(partial)
+    state['pending_rows'] += _partial_rows(partial)
+    merged = state['merged']
+    if merged is None or state['pending_rows'] >= _partial_rows(merged):
+        pending = _merge_in_order(state['pending'], merge)
+        state['merged'] = pending if merged is None else merge(merged, pending)
+        state['pending'], state['pending_rows'] = [], 0
+    return state
+
+
+def folded_partials(state: Optional[dict], merge: Callable):
+    """Merged result of a fold_partial() fold (None for an empty fold)."""
+    if state is None:
+        return None
+    return _merge_in_order([state['merged']] + state['pending'], merge)
+
+
 # =====================================================================
 # DIMENSION TABLE TRANSFORMATIONS
 # =====================================================================
@@ -136,33 +245,24 @@ def build_dim_date(df_sales: pd.DataFrame) -> pd.DataFrame:
     Build the Date dimension table covering the full date range 
     of the sales data.
     """
+    return build_dim_date_range(df_sales['date'].min(), df_sales['date'].max())
+
+
+def build_dim_date_range(min_date, max_date) -> pd.DataFrame:
+    """
+    Build the Date dimension table covering the full calendar years 
+    between min_date and max_date (plus DIM_DATE_FUTURE_YEARS).
+    """
     logger.info("[DIM] Building Date dimension...")
     
-    min_date = df_sales['date'].min()
-    max_date = df_sales['date'].max()
-    
     # Extend range to full years
     start_date = pd.Timestamp(year=min_date.year, month=1, day=1)
-    end_date = pd.Timestamp(year=max_date.year, month=12, day=31)
-    
-    date_range = pd.date_range(start=start_date, end=end_date, freq='D')
-    
-    dim_date = pd.DataFrame({'full_date': date_range})
-    dim_date['date_key'] = dim_date['full_date'].dt.strftime('%Y%m%d').astype(int)
-    dim_date['year'] = dim_date['full_date'].dt.year
-    dim_date['quarter'] = dim_date['full_date'].dt.quarter
-    dim_date['month'] = dim_date['full_date'].dt.month
-    dim_date['month_name'] = dim_date['full_date'].dt.month_name()
-    dim_date['week_of_year'] = dim_date['full_date'].dt.isocalendar().week.astype(int)
-    dim_date['day_of_month'] = dim_date['full_date'].dt.day
-    dim_date['day_of_week'] = dim_date['full_date'].dt.dayofweek
-    dim_date['day_name'] = dim_date['full_date'].dt.day_name()
-    dim_date['is_weekend'] = dim_date['day_of_week'].isin([5, 6])
-    dim_date['fiscal_year'] = dim_date['full_date'].apply(
-        lambda d: d.year + 1 if d.month >= 10 else d.year
+    end_date = pd.Timestamp(
+        year=max_date.year + DIM_DATE_FUTURE_YEARS, month=12, day=31
     )
-    dim_date['fiscal_quarter'] = dim_date['full_date'].apply(
-        lambda d: (d.month - 10) % 12 // 3 + 1
+    
+    dim_date = build_calendar_cached(
+        start_date.year, end_date.year, holidays=load_holidays()
     )
     
     logger.info(
@@ -172,42 +272,82 @@ def build_dim_date(df_sales: pd.DataFrame) -> pd.DataFrame:
     return dim_date
 
 
+# Customer age bands (dim_customer.age_group, dashboard cube)
+AGE_GROUP_BINS = [0, 25, 35, 45, 55, 65, 100]
+AGE_GROUP_LABELS = ['18-25', '26-35', '36-45', '46-55', '56-65', '65+']
+
+
 def build_dim_customer(df_sales: pd.DataFrame) -> pd.DataFrame:
     """
     Build the Customer dimension with SCD Type 2 support.
     Tracks changes in customer attributes (age, gender) over time.
     """
-    logger.info("[DIM] Building Customer dimension (SCD Type 2)...")
-    
     # Get unique customer profiles
-    customers = df_sales.groupby('customer_id').agg(
+    return _finalize_dim_customer(aggregate_customers(df_sales))
+
+
+def aggregate_customers(df_sales: pd.DataFrame) -> pd.DataFrame:
+    """Reduce cleaned sales rows to one profile row per customer."""
+    return df_sales.groupby('customer_id', observed=True).agg(
         gender=('gender', 'first'),
         age=('age', 'first'),
         first_purchase_date=('date', 'min'),
         last_purchase_date=('date', 'max'),
         total_transactions=('transaction_id', 'nunique'),
     ).reset_index()
+
+
+def merge_customer_aggregates(
+    acc: Optional[pd.DataFrame],
+    partial: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Merge two aggregate_customers() results, ``acc`` covering the rows
+    before ``partial``. Fold chunks with fold_partial() rather than
+    merging each into one growing aggregate.
+    
+    Chunks must be merged in source order so 'first' keeps its meaning.
+    Transaction counts are summed, which assumes a transaction ID does not
+    span chunks (true for the one-row-per-transaction source export).
+    The result has one row per distinct customer_id.
+    """
+    if acc is None:
+        return partial
+    return pd.concat([acc, partial], ignore_index=True).groupby(
+        'customer_id', observed=True
+    ).agg(
+        gender=('gender', 'first'),
+        age=('age', 'first'),
+        first_purchase_date=('first_purchase_date', 'min'),
+        last_purchase_date=('last_purchase_date', 'max'),
+        total_transactions=('total_transactions', 'sum'),
+    ).reset_index()
+
+
+def _finalize_dim_customer(customers: pd.DataFrame) -> pd.DataFrame:
+    """Add SCD Type 2, hash and segment columns to aggregated customers."""
+    logger.info("[DIM] Building Customer dimension (SCD Type 2)...")
     
-    # Add SCD Type 2 columns
-    customers['customer_key'] = range(1, len(customers) + 1)
+    customers = customers.copy()
+    
+    # Add SCD Type 2 columns (customer_key is the durable key shared by
+    # every version the load MERGE creates)
+    customers['customer_key'] = assign_surrogate_keys(
+        'dim_customer', customers['customer_id']
+    )
     customers['effective_start_date'] = customers['first_purchase_date']
     customers['effective_end_date'] = pd.Timestamp('9999-12-31')
     customers['is_current'] = True
     customers['version'] = 1
     
     # Generate row hash for change detection
-    customers['row_hash'] = customers.apply(
-        lambda row: hashlib.md5(
-            f"{row['customer_id']}_{row['gender']}_{row['age']}".encode()
-        ).hexdigest(),
-        axis=1
+    customers['row_hash'] = hash_columns(
+        customers, ['customer_id', 'gender', 'age']
     )
     
     # Add age group classification
     customers['age_group'] = pd.cut(
-        customers['age'],
-        bins=[0, 25, 35, 45, 55, 65, 100],
-        labels=['18-25', '26-35', '36-45', '46-55', '56-65', '65+']
+        customers['age'], bins=AGE_GROUP_BINS, labels=AGE_GROUP_LABELS
     )
     
     # Customer segment based on transaction count
@@ -260,18 +400,18 @@ def build_dim_product(
         'Beauty': 'jewelery',
     }
     
-    # Add SCD Type 2 columns
-    products['product_key'] = range(1, len(products) + 1)
+    # Add SCD Type 2 columns (product_key is the durable key shared by
+    # every version the load MERGE creates)
+    products['product_key'] = assign_surrogate_keys(
+        'dim_product', products['api_product_id']
+    )
     products['effective_start_date'] = datetime.utcnow()
     products['effective_end_date'] = pd.Timestamp('9999-12-31')
     products['is_current'] = True
     products['version'] = 1
     
-    products['row_hash'] = products.apply(
-        lambda row: hashlib.md5(
-            f"{row['api_product_id']}_{row['product_name']}_{row['api_price']}".encode()
-        ).hexdigest(),
-        axis=1
+    products['row_hash'] = hash_columns(
+        products, ['api_product_id', 'product_name', 'api_price']
     )
     
     products['_loaded_at'] = datetime.utcnow()
@@ -283,11 +423,18 @@ def build_dim_product(
 def build_dim_product_category(
     df_sales: pd.DataFrame,
     df_api_products: pd.DataFrame,
-    api_categories: list
+    api_categories: list,
+    include_registered: bool = False
 ) -> pd.DataFrame:
     """
     Build the Product Category dimension combining 
     categories from both sources.
+    
+    Args:
+        include_registered: Also include every category in the key
+            registry, i.e. categories of earlier loads that are absent
+            from this (incremental) batch. Their category_source is left
+            empty, since this run did not see them in either source.
     """
     logger.info("[DIM] Building Product Category dimension...")
     
@@ -298,18 +445,25 @@ def build_dim_product_category(
     api_cats = [cat.strip().title() for cat in api_categories]
     
     # Combine all unique categories
-    all_categories = sorted(set(retail_cats + api_cats))
+    seen_categories = set(retail_cats + api_cats)
+    all_categories = set(seen_categories)
+    if include_registered:
+        all_categories.update(load_key_registry('dim_product_category')['natural_key'])
+    all_categories = sorted(all_categories)
     
+    category_names = pd.Series(all_categories, dtype=object)
     dim_category = pd.DataFrame({
-        'category_key': range(1, len(all_categories) + 1),
-        'category_name': all_categories,
+        'category_key': assign_surrogate_keys('dim_product_category', category_names),
+        'category_name': category_names,
     })
     
     # Add category metadata
     dim_category['category_source'] = dim_category['category_name'].apply(
-        lambda c: 'both' if c in retail_cats and c.lower() in [
-            x.lower() for x in api_cats
-        ] else ('retail' if c in retail_cats else 'api')
+        lambda c: None if c not in seen_categories else (
+            'both' if c in retail_cats and c.lower() in [
+                x.lower() for x in api_cats
+            ] else ('retail' if c in retail_cats else 'api')
+        )
     )
     
     # Category group classification
@@ -343,42 +497,86 @@ def build_dim_product_category(
 # FACT TABLE TRANSFORMATIONS
 # =====================================================================
 
+# Surrogate key column -> natural key column it is resolved from
+FACT_KEY_COLUMNS = {
+    'date_key': 'date',
+    'customer_key': 'customer_id',
+    'category_key': 'product_category',
+}
+
+
 def build_fact_sales(
     df_sales: pd.DataFrame,
     dim_customer: pd.DataFrame,
     dim_category: pd.DataFrame,
-    dim_date: pd.DataFrame
+    dim_date: pd.DataFrame,
+    sales_key_offset: Optional[int] = 0
 ) -> pd.DataFrame:
     """
     Build the Fact Sales table by joining cleaned sales data 
     with dimension surrogate keys.
-    """
-    logger.info("[FACT] Building Fact Sales table...")
-    
-    fact = df_sales.copy()
-    
-    # Add date key
-    fact['date_key'] = fact['date'].dt.strftime('%Y%m%d').astype(int)
     
-    # Join customer dimension key
-    customer_key_map = dim_customer.set_index('customer_id')['customer_key'].to_dict()
-    fact['customer_key'] = fact['customer_id'].map(customer_key_map)
+    Keys are resolved with index probes (see etl.keys); rows whose keys
+    do not resolve are reported in the log and keep a null key.
     
-    # Join category dimension key
-    category_key_map = dim_category.set_index('category_name')['category_key'].to_dict()
-    fact['category_key'] = fact['product_category'].map(category_key_map)
+    sales_key_offset shifts the generated sales_key so that chunks
+    built separately get non-overlapping keys. With None, sales_key comes
+    from the 'fact_sales' key registry keyed by transaction_id instead, so
+    a transaction keeps its key when its sale-date partition is rebuilt.
+    """
+    logger.info("[FACT] Building Fact Sales table...")
     
-    # Select fact table columns
-    fact_sales = fact[[
-        'transaction_id', 'date_key', 'customer_key', 'category_key',
-        'quantity', 'price_per_unit', 'total_amount',
-        'customer_id', 'product_category', 'gender', 'age',
-        '_extracted_at', '_source'
-    ]].copy()
+    # Add date key (only dates covered by dim_date resolve)
+    date_key = date_keys(df_sales['date'])
+    date_key = resolve_surrogate_keys(
+        date_key, dim_date['date_key'], dim_date['date_key']
+    )
     
-    fact_sales['sales_key'] = range(1, len(fact_sales) + 1)
+    fact_sales = pd.DataFrame({
+        'transaction_id': df_sales['transaction_id'],
+        'date_key': date_key,
+        'sale_date': df_sales['date'].dt.normalize(),
+        # Join customer dimension key
+        'customer_key': resolve_surrogate_keys(
+            df_sales['customer_id'],
+            dim_customer['customer_id'], dim_customer['customer_key']
+        ),
+        # Join category dimension key
+        'category_key': resolve_surrogate_keys(
+            df_sales['product_category'],
+            dim_category['category_name'], dim_category['category_key']
+        ),
+        'quantity': df_sales['quantity'],
+        'price_per_unit': df_sales['price_per_unit'],
+        'total_amount': df_sales['total_amount'],
+        'customer_id': df_sales['customer_id'],
+        'product_category': df_sales['product_category'],
+        'gender': df_sales['gender'],
+        'age': df_sales['age'],
+        '_extracted_at': df_sales['_extracted_at'],
+        '_source': df_sales['_source'],
+    }, index=df_sales.index)
+    
+    if sales_key_offset is None:
+        fact_sales['sales_key'] = assign_surrogate_keys(
+            'fact_sales', df_sales['transaction_id']
+        )
+    else:
+        fact_sales['sales_key'] = range(
+            sales_key_offset + 1, sales_key_offset + len(fact_sales) + 1
+        )
     fact_sales['_loaded_at'] = datetime.utcnow()
     
+    unresolved = unresolved_key_report(
+        fact_sales.assign(date=df_sales['date']), FACT_KEY_COLUMNS
+    )
+    for row in unresolved.itertuples(index=False):
+        logger.warning(
+            f"[WARN] {row.unresolved_rows} fact rows with unresolved "
+            f"{row.key_column} ({row.unresolved_values} distinct "
+            f"{row.natural_key}, e.g. {row.sample})"
+        )
+    
     logger.info(f"[OK] Fact Sales: {len(fact_sales)} records")
     logger.info(
         f"   Total revenue: ${fact_sales['total_amount'].sum():,.2f}"
@@ -390,6 +588,147 @@ def build_fact_sales(
 # DATA MART TRANSFORMATIONS
 # =====================================================================
 
+MART_MONTH_COLUMNS = ['year', 'month', 'month_name']
+
+# Partials are kept per sale date, below the marts' own grain, so the
+# partials of a rebuilt sale-date partition can be swapped out
+# (replace_partial_dates) instead of being added twice.
+PARTIAL_DATE_COLUMN = 'sale_date'
+PARTIAL_MONTH_KEYS = [PARTIAL_DATE_COLUMN] + MART_MONTH_COLUMNS
+
+
+def _sum_partials(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    keys: list
+) -> pd.DataFrame:
+    """Combine two additive partial aggregates on their group keys."""
+    return pd.concat([left, right], ignore_index=True).groupby(
+        keys, as_index=False, observed=True
+    ).sum()
+
+
+def _distinct_partials(left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
+    """Combine two sets of distinct key tuples."""
+    return pd.concat([left, right], ignore_index=True).drop_duplicates(
+        ignore_index=True
+    )
+
+
+def _distinct_values(
+    rows: pd.DataFrame,
+    keys: list,
+    column: str,
+    mode: str = MART_DISTINCT_COUNTS
+) -> pd.DataFrame:
+    """
+    Mergeable partial for counting distinct ``column`` values per group:
+    the distinct key tuples ('exact') or one HyperLogLog sketch per
+    group ('hll', see etl.sketches).
+    """
+    if mode == 'hll':
+        return grouped_sketches(rows, keys, column)
+    return rows[keys + [column]].drop_duplicates(ignore_index=True)
+
+
+def _merge_distinct_values(
+    left: Optional[pd.DataFrame],
+    right: Optional[pd.DataFrame],
+    keys: list
+) -> pd.DataFrame:
+    """Combine two _distinct_values() partials."""
+    if (left is None or right is None
+            or ('sketch' in left.columns) != ('sketch' in right.columns)):
+        raise ValueError(
+            "Mart partials mix exact and sketch distinct counts "
+            "(MART_DISTINCT_COUNTS changed); run a full load to rebuild them"
+        )
+    if 'sketch' in left.columns:
+        return merge_sketch_frames(left, right, keys)
+    return _distinct_partials(left, right)
+
+
+def _count_distinct_values(
+    partial: pd.DataFrame,
+    keys: list,
+    column: str,
+    name: str
+) -> pd.DataFrame:
+    """Distinct count per ``keys`` group of a _distinct_values() partial."""
+    if 'sketch' in partial.columns:
+        partial = union_sketches(partial, keys)
+        return partial[keys].assign(**{name: sketch_counts(partial)})
+    return partial.groupby(
+        keys, observed=True
+    )[column].nunique().rename(name).reset_index()
+
+
+def _sum_to_grain(partial: pd.DataFrame, keys: list) -> pd.DataFrame:
+    """Roll an additive per-sale-date partial up to the mart grain."""
+    return partial.drop(columns=PARTIAL_DATE_COLUMN).groupby(
+        keys, as_index=False, observed=True
+    ).sum()
+
+
+def summarize_sales_performance(
+    fact_sales: pd.DataFrame,
+    dim_date: pd.DataFrame
+) -> dict:
+    """
+    Reduce fact rows to mergeable partial aggregates for the
+    Sales Performance mart (see merge_sales_performance_partials).
+    """
+    rows = fact_sales.merge(
+        dim_date[['date_key'] + MART_MONTH_COLUMNS],
+        on='date_key',
+        how='left'
+    )
+    
+    aggregations = {
+        'total_revenue': ('total_amount', 'sum'),
+        'order_count': ('total_amount', 'count'),
+        'total_transactions': ('transaction_id', 'nunique'),
+        'total_quantity': ('quantity', 'sum'),
+    }
+    partials = {
+        'customers': _distinct_values(rows, PARTIAL_MONTH_KEYS, 'customer_id'),
+    }
+    if MART_DISTINCT_COUNTS == 'hll':
+        del aggregations['total_transactions']
+        partials['transactions'] = _distinct_values(
+            rows, PARTIAL_MONTH_KEYS, 'transaction_id'
+        )
+    
+    partials['monthly'] = rows.groupby(PARTIAL_MONTH_KEYS).agg(
+        **aggregations
+    ).reset_index()
+    return partials
+
+
+def merge_sales_performance_partials(
+    acc: Optional[dict],
+    partial: dict
+) -> dict:
+    """
+    Fold one chunk's Sales Performance partials into the running partials.
+    Exact transaction counts are summed, so a transaction ID must not span
+    chunks (sketched counts have no such restriction).
+    """
+    if acc is None:
+        return partial
+    merged = {
+        'monthly': _sum_partials(
+            acc['monthly'], partial['monthly'], PARTIAL_MONTH_KEYS
+        ),
+    }
+    for name in ('customers', 'transactions'):
+        if name in acc or name in partial:
+            merged[name] = _merge_distinct_values(
+                acc.get(name), partial.get(name), PARTIAL_MONTH_KEYS
+            )
+    return merged
+
+
 def build_mart_sales_performance(
     fact_sales: pd.DataFrame,
     dim_date: pd.DataFrame,
@@ -399,25 +738,39 @@ def build_mart_sales_performance(
     Build the Sales Performance data mart.
     Aggregates sales metrics by various time periods.
     """
-    logger.info("[MART] Building Sales Performance data mart...")
-    
-    # Merge with date dimension
-    mart = fact_sales.merge(
-        dim_date[['date_key', 'year', 'quarter', 'month', 'month_name', 'day_name', 'is_weekend']],
-        on='date_key',
-        how='left'
+    return build_mart_sales_performance_from_partials(
+        summarize_sales_performance(fact_sales, dim_date)
     )
+
+
+def build_mart_sales_performance_from_partials(partials: dict) -> pd.DataFrame:
+    """Finalize the Sales Performance data mart from merged partials."""
+    logger.info("[MART] Building Sales Performance data mart...")
     
     # Monthly performance
-    monthly = mart.groupby(
-        ['year', 'month', 'month_name']
-    ).agg(
-        total_revenue=('total_amount', 'sum'),
-        total_transactions=('transaction_id', 'nunique'),
-        total_quantity=('quantity', 'sum'),
-        avg_order_value=('total_amount', 'mean'),
-        unique_customers=('customer_id', 'nunique'),
-    ).reset_index()
+    monthly = _sum_to_grain(partials['monthly'], MART_MONTH_COLUMNS).merge(
+        _count_distinct_values(
+            partials['customers'], MART_MONTH_COLUMNS,
+            'customer_id', 'unique_customers'
+        ),
+        on=MART_MONTH_COLUMNS, how='left'
+    )
+    if 'transactions' in partials:
+        monthly = monthly.merge(
+            _count_distinct_values(
+                partials['transactions'], MART_MONTH_COLUMNS,
+                'transaction_id', 'total_transactions'
+            ),
+            on=MART_MONTH_COLUMNS, how='left'
+        )
+    monthly['avg_order_value'] = (
+        monthly['total_revenue'] / monthly['order_count']
+    )
+    monthly = monthly[[
+        'year', 'month', 'month_name', 'total_revenue',
+        'total_transactions', 'total_quantity', 'avg_order_value',
+        'unique_customers',
+    ]]
     
     # Calculate month-over-month growth
     monthly = monthly.sort_values(['year', 'month'])
@@ -433,6 +786,71 @@ def build_mart_sales_performance(
     return monthly
 
 
+def summarize_category_analysis(fact_sales: pd.DataFrame) -> dict:
+    """
+    Reduce fact rows to mergeable partial aggregates for the
+    Category Analysis mart (see merge_category_analysis_partials).
+    """
+    aggregations = {
+        'total_revenue': ('total_amount', 'sum'),
+        'order_count': ('total_amount', 'count'),
+        'total_transactions': ('transaction_id', 'nunique'),
+        'total_quantity': ('quantity', 'sum'),
+        'price_sum': ('price_per_unit', 'sum'),
+        'price_count': ('price_per_unit', 'count'),
+        'age_sum': ('age', 'sum'),
+        'age_count': ('age', 'count'),
+    }
+    keys = [PARTIAL_DATE_COLUMN, 'product_category']
+    partials = {}
+    if MART_DISTINCT_COUNTS == 'hll':
+        del aggregations['total_transactions']
+        partials['transactions'] = _distinct_values(
+            fact_sales, keys, 'transaction_id'
+        )
+    
+    category = fact_sales.groupby(keys, observed=True).agg(
+        **aggregations
+    ).reset_index()
+    
+    gender = fact_sales.groupby(keys + ['gender'], observed=True).agg(
+        gender_revenue=('total_amount', 'sum')
+    ).reset_index()
+    
+    partials.update({
+        'category': category,
+        'gender': gender,
+        'customers': _distinct_values(fact_sales, keys, 'customer_id'),
+    })
+    return partials
+
+
+def merge_category_analysis_partials(
+    acc: Optional[dict],
+    partial: dict
+) -> dict:
+    """
+    Fold one chunk's Category Analysis partials into the running partials.
+    Exact transaction counts are summed, so a transaction ID must not span
+    chunks (sketched counts have no such restriction).
+    """
+    if acc is None:
+        return partial
+    keys = [PARTIAL_DATE_COLUMN, 'product_category']
+    merged = {
+        'category': _sum_partials(acc['category'], partial['category'], keys),
+        'gender': _sum_partials(
+            acc['gender'], partial['gender'], keys + ['gender']
+        ),
+    }
+    for name in ('customers', 'transactions'):
+        if name in acc or name in partial:
+            merged[name] = _merge_distinct_values(
+                acc.get(name), partial.get(name), keys
+            )
+    return merged
+
+
 def build_mart_category_analysis(
     fact_sales: pd.DataFrame,
     dim_category: pd.DataFrame,
@@ -442,18 +860,50 @@ def build_mart_category_analysis(
     Build the Product Category Analysis data mart.
     Provides category-level analytics including demographics.
     """
+    return build_mart_category_analysis_from_partials(
+        summarize_category_analysis(fact_sales), dim_category
+    )
+
+
+def build_mart_category_analysis_from_partials(
+    partials: dict,
+    dim_category: pd.DataFrame
+) -> pd.DataFrame:
+    """Finalize the Category Analysis data mart from merged partials."""
     logger.info("[MART] Building Category Analysis data mart...")
     
     # Category performance
-    category_perf = fact_sales.groupby('product_category').agg(
-        total_revenue=('total_amount', 'sum'),
-        total_transactions=('transaction_id', 'nunique'),
-        total_quantity=('quantity', 'sum'),
-        avg_price=('price_per_unit', 'mean'),
-        avg_order_value=('total_amount', 'mean'),
-        unique_customers=('customer_id', 'nunique'),
-        avg_customer_age=('age', 'mean'),
-    ).reset_index()
+    category_perf = _sum_to_grain(
+        partials['category'], ['product_category']
+    ).merge(
+        _count_distinct_values(
+            partials['customers'], ['product_category'],
+            'customer_id', 'unique_customers'
+        ),
+        on='product_category', how='left'
+    )
+    if 'transactions' in partials:
+        category_perf = category_perf.merge(
+            _count_distinct_values(
+                partials['transactions'], ['product_category'],
+                'transaction_id', 'total_transactions'
+            ),
+            on='product_category', how='left'
+        )
+    category_perf['avg_price'] = (
+        category_perf['price_sum'] / category_perf['price_count']
+    )
+    category_perf['avg_order_value'] = (
+        category_perf['total_revenue'] / category_perf['order_count']
+    )
+    category_perf['avg_customer_age'] = (
+        category_perf['age_sum'] / category_perf['age_count']
+    )
+    category_perf = category_perf[[
+        'product_category', 'total_revenue', 'total_transactions',
+        'total_quantity', 'avg_price', 'avg_order_value',
+        'unique_customers', 'avg_customer_age',
+    ]]
     
     # Revenue share
     total_revenue = category_perf['total_revenue'].sum()
@@ -462,17 +912,14 @@ def build_mart_category_analysis(
     ).round(2)
     
     # Gender split per category
-    gender_split = fact_sales.groupby(
-        ['product_category', 'gender']
-    ).agg(
-        gender_revenue=('total_amount', 'sum')
-    ).reset_index()
-    
-    gender_pivot = gender_split.pivot_table(
+    gender_pivot = _sum_to_grain(
+        partials['gender'], ['product_category', 'gender']
+    ).pivot_table(
         index='product_category',
         columns='gender',
         values='gender_revenue',
-        fill_value=0
+        fill_value=0,
+        observed=True
     ).reset_index()
     
     if 'Female' in gender_pivot.columns and 'Male' in gender_pivot.columns:
@@ -507,16 +954,268 @@ def build_mart_category_analysis(
     return mart
 
 
+# =====================================================================
+# INCREMENTAL MART MAINTENANCE
+# =====================================================================
+
+# Mart partials of everything loaded so far ('current'). The partials of
+# a run that has been transformed but not yet loaded are pending in that
+# run's artifact directory, so overlapping or retried runs never see or
+# promote each other's.
+MART_PARTIALS_DIR = os.path.join(ETL_ARTIFACT_DIR, 'mart_partials')
+
+
+def pending_mart_partials_dir(run_id: str) -> str:
+    """Directory holding the not yet committed mart partials of a run."""
+    return os.path.join(run_artifact_dir(run_id), 'mart_partials')
+
+
+def load_mart_partials(
+    run_id: Optional[str] = None,
+    partials_dir: str = MART_PARTIALS_DIR
+) -> Optional[dict]:
+    """Read the current mart partials, or the pending ones of ``run_id``, if any."""
+    root = (
+        os.path.join(partials_dir, 'current') if run_id is None
+        else pending_mart_partials_dir(run_id)
+    )
+    if not os.path.isdir(root):
+        return None
+    return {
+        mart: {
+            name[:-len('.parquet')]: pd.read_parquet(os.path.join(root, mart, name))
+            for name in sorted(os.listdir(os.path.join(root, mart)))
+        }
+        for mart in sorted(os.listdir(root))
+    }
+
+
+def save_pending_mart_partials(partials: dict, run_id: str):
+    """
+    Persist the partials of a transformed run as pending for that run;
+    they become the base of the next incremental run once
+    commit_mart_partials(run_id) is called after a successful load.
+    """
+    root = pending_mart_partials_dir(run_id)
+    shutil.rmtree(root, ignore_errors=True)
+    for mart, parts in partials.items():
+        os.makedirs(os.path.join(root, mart))
+        for name, df in parts.items():
+            df.to_parquet(os.path.join(root, mart, f"{name}.parquet"), index=False)
+
+
+def commit_mart_partials(run_id: str, partials_dir: str = MART_PARTIALS_DIR):
+    """Promote the pending mart partials of ``run_id`` to current (no-op if none)."""
+    pending = pending_mart_partials_dir(run_id)
+    if not os.path.isdir(pending):
+        return
+    current = os.path.join(partials_dir, 'current')
+    previous = os.path.join(partials_dir, 'previous')
+    os.makedirs(partials_dir, exist_ok=True)
+    shutil.rmtree(previous, ignore_errors=True)
+    if os.path.isdir(current):
+        os.replace(current, previous)
+    os.replace(pending, current)
+    shutil.rmtree(previous, ignore_errors=True)
+    logger.info(f"[MART] Committed mart partials of run {run_id} to {current}")
+
+
+def replace_partial_dates(partials: dict, dates: Iterable) -> dict:
+    """
+    Drop the contribution of the given sale dates from a mart's partials,
+    so the partials of those dates, rebuilt from complete partitions, can
+    be merged in without counting their earlier rows twice.
+    """
+    dates = pd.DatetimeIndex(pd.to_datetime(list(dates))).normalize()
+    return {
+        name: df[~df[PARTIAL_DATE_COLUMN].isin(dates)].reset_index(drop=True)
+        for name, df in partials.items()
+    }
+
+
+def build_marts_incremental(
+    fact_sales: pd.DataFrame,
+    dim_date: pd.DataFrame,
+    dim_category: pd.DataFrame,
+    incremental: bool,
+    run_id: str,
+    build_seconds: Optional[dict] = None,
+    replace_partitions: bool = False
+) -> dict:
+    """
+    Build both marts, folding only ``fact_sales`` into persisted partials.
+    
+    In incremental mode the new fact rows are summarized and merged into
+    the 'current' partials, so the marts (including revenue_growth_pct and
+    revenue_share_pct, which are recomputed from the merged partials)
+    cover full history at the cost of the delta. The merged partials are
+    saved as pending for ``run_id``. With exact distinct counts their
+    'customers' frames keep one row per distinct customer and sale date
+    of the whole history; MART_DISTINCT_COUNTS=hll bounds them.
+    
+    Args:
+        build_seconds: If given, receives the build time of each mart
+            (summarizing, merging and finalizing its partials)
+        replace_partitions: ``fact_sales`` holds every row of its sale
+            dates (extract_all(replace_partitions=True)); the persisted
+            partials of those dates are replaced rather than added to
+    
+    Returns:
+        dict with 'mart_sales_performance' and 'mart_category_analysis';
+        both are None in incremental mode when no partials were persisted
+        yet, since marts of the delta alone would overwrite full history
+    """
+    seconds = {'mart_sales_performance': 0.0, 'mart_category_analysis': 0.0}
+    
+    def timed(mart: str, func: Callable, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        seconds[mart] += time.perf_counter() - start
+        return result
+    
+    partials = {
+        'sales_performance': timed(
+            'mart_sales_performance', summarize_sales_performance, fact_sales, dim_date
+        ),
+        'category_analysis': timed(
+            'mart_category_analysis', summarize_category_analysis, fact_sales
+        ),
+    }
+    if incremental:
+        base = load_mart_partials()
+        if base is None:
+            logger.warning(
+                "[MART] No persisted mart partials - marts are not rebuilt "
+                "until the next full run"
+            )
+            return {'mart_sales_performance': None, 'mart_category_analysis': None}
+        if any(
+            PARTIAL_DATE_COLUMN not in df.columns
+            for parts in base.values() for df in parts.values()
+        ):
+            raise ValueError(
+                "Mart partials predate per-sale-date partials; "
+                "run a full load to rebuild them"
+            )
+        if replace_partitions:
+            dates = fact_sales[PARTIAL_DATE_COLUMN].dropna().unique()
+            logger.info(
+                f"[MART] Replacing the mart partials of {len(dates)} rebuilt sale dates"
+            )
+            base = {
+                name: replace_partial_dates(parts, dates)
+                for name, parts in base.items()
+            }
+        logger.info(f"[MART] Folding {len(fact_sales)} fact rows into mart partials")
+        partials = {
+            'sales_performance': timed(
+                'mart_sales_performance', merge_sales_performance_partials,
+                base['sales_performance'], partials['sales_performance']
+            ),
+            'category_analysis': timed(
+                'mart_category_analysis', merge_category_analysis_partials,
+                base['category_analysis'], partials['category_analysis']
+            ),
+        }
+    
+    save_pending_mart_partials(partials, run_id)
+    marts = {
+        'mart_sales_performance': timed(
+            'mart_sales_performance', build_mart_sales_performance_from_partials,
+            partials['sales_performance']
+        ),
+        'mart_category_analysis': timed(
+            'mart_category_analysis', build_mart_category_analysis_from_partials,
+            partials['category_analysis'], dim_category
+        ),
+    }
+    if build_seconds is not None:
+        build_seconds.update(seconds)
+    return marts
+
+
+# =====================================================================
+# REPORTING
+# =====================================================================
+
+def table_report(
+    tables: dict,
+    build_seconds: Optional[dict] = None
+) -> pd.DataFrame:
+    """
+    Per-table memory and throughput report.
+    
+    Args:
+        tables: dict of table name -> DataFrame (other values are ignored)
+        build_seconds: Optional dict of table name -> build time
+        
+    Returns:
+        pd.DataFrame with columns: table, rows, memory_mb, bytes_per_row,
+        categorical_columns, build_sec, rows_per_sec
+    """
+    build_seconds = build_seconds or {}
+    rows = []
+    for name, df in tables.items():
+        if not isinstance(df, pd.DataFrame):
+            continue
+        memory = int(df.memory_usage(deep=True).sum())
+        seconds = build_seconds.get(name)
+        rows.append({
+            'table': name,
+            'rows': len(df),
+            'memory_mb': round(memory / 1024 ** 2, 3),
+            'bytes_per_row': round(memory / len(df)) if len(df) else 0,
+            'categorical_columns': sum(
+                isinstance(dtype, pd.CategoricalDtype) for dtype in df.dtypes
+            ),
+            'build_sec': round(seconds, 4) if seconds is not None else None,
+            'rows_per_sec': (
+                round(len(df) / seconds) if seconds else None
+            ),
+        })
+    return pd.DataFrame(rows)
+
+
+def log_table_report(report: pd.DataFrame):
+    """Log a table_report() one line per table."""
+    for row in report.itertuples(index=False):
+        throughput = (
+            f", {row.build_sec:.3f}s ({row.rows_per_sec:,.0f} rows/s)"
+            if pd.notna(row.build_sec) and pd.notna(row.rows_per_sec) else ""
+        )
+        logger.info(
+            f"   {row.table}: {row.rows} records, {row.memory_mb:.2f} MB "
+            f"({row.bytes_per_row} B/row, {row.categorical_columns} "
+            f"categorical){throughput}"
+        )
+
+
 # =====================================================================
 # ORCHESTRATOR
 # =====================================================================
 
-def transform_all(extracted_data: dict) -> dict:
+def transform_all(
+    extracted_data: dict,
+    run_id: Optional[str] = None,
+    replace_partitions: bool = False
+) -> dict:
     """
     Run all transformations on extracted data.
     
+    sales_key comes from the 'fact_sales' key registry, so a transaction
+    keeps its key across full, incremental and partition-replacing runs.
+    
     Args:
-        extracted_data: dict from extract.extract_all()
+        extracted_data: dict from extract.extract_all(). In incremental
+            mode it carries the previous 'watermark', which keeps the date
+            dimension covering full history; the marts are then
+            maintained from persisted partials (build_marts_incremental).
+        run_id: Run whose pending mart partials are written; pass the same
+            id to commit_mart_partials() after a successful load (default:
+            a new id, logged)
+        replace_partitions: The extract holds complete sale dates
+            (extract_all(replace_partitions=True)), whose mart partials
+            are replaced instead of added to
         
     Returns:
         dict with all dimension, fact, and mart DataFrames
@@ -526,47 +1225,194 @@ def transform_all(extracted_data: dict) -> dict:
     logger.info("=" * 60)
     
     results = {}
+    build_seconds = {}
+    watermark = extracted_data.get('watermark')
+    if run_id is None:
+        run_id = f"transform_{datetime.utcnow():%Y%m%dT%H%M%S}_{uuid.uuid4().hex[:8]}"
+        logger.info(f"[TRANSFORM] Run id: {run_id}")
+    
+    def timed(name: str, func: Callable, *args, **kwargs):
+        start = time.perf_counter()
+        results[name] = func(*args, **kwargs)
+        build_seconds[name] = time.perf_counter() - start
+        return results[name]
     
     # 1. Clean raw data
-    clean_sales = clean_retail_sales(extracted_data['retail_sales'])
-    clean_products = clean_api_products(extracted_data['api_products'])
-    
-    results['stg_retail_sales'] = clean_sales
-    results['stg_api_products'] = clean_products
+    clean_sales = timed(
+        'stg_retail_sales', clean_retail_sales, extracted_data['retail_sales']
+    )
+    clean_products = timed(
+        'stg_api_products', clean_api_products, extracted_data['api_products']
+    )
     
     # 2. Build dimension tables
-    results['dim_date'] = build_dim_date(clean_sales)
-    results['dim_customer'] = build_dim_customer(clean_sales)
-    results['dim_product'] = build_dim_product(clean_products, clean_sales)
-    results['dim_product_category'] = build_dim_product_category(
-        clean_sales, clean_products, extracted_data['api_categories']
+    if watermark:
+        timed(
+            'dim_date', build_dim_date_range,
+            min(pd.Timestamp(watermark['first_date']), clean_sales['date'].min()),
+            max(pd.Timestamp(watermark['date']), clean_sales['date'].max())
+        )
+    else:
+        timed('dim_date', build_dim_date, clean_sales)
+    timed('dim_customer', build_dim_customer, clean_sales)
+    timed('dim_product', build_dim_product, clean_products, clean_sales)
+    timed(
+        'dim_product_category', build_dim_product_category,
+        clean_sales, clean_products, extracted_data['api_categories'],
+        include_registered=bool(watermark)
     )
     
     # 3. Build fact table
-    results['fact_sales'] = build_fact_sales(
+    timed(
+        'fact_sales', build_fact_sales,
         clean_sales,
         results['dim_customer'],
         results['dim_product_category'],
-        results['dim_date']
+        results['dim_date'],
+        sales_key_offset=None
     )
     
-    # 4. Build data marts
-    results['mart_sales_performance'] = build_mart_sales_performance(
+    # 4. Build data marts (folding the new fact rows into the persisted
+    #    partials in incremental mode)
+    marts = build_marts_incremental(
         results['fact_sales'],
         results['dim_date'],
-        results['dim_customer']
-    )
-    results['mart_category_analysis'] = build_mart_category_analysis(
-        results['fact_sales'],
         results['dim_product_category'],
-        results['dim_customer']
+        incremental=bool(watermark),
+        run_id=run_id,
+        build_seconds=build_seconds,
+        replace_partitions=replace_partitions
     )
+    results.update(marts)
+    save_category_registry()
     
     logger.info("=" * 60)
     logger.info("[OK] ALL TRANSFORMATIONS COMPLETE")
-    for key, val in results.items():
-        if isinstance(val, pd.DataFrame):
-            logger.info(f"   {key}: {len(val)} records")
+    log_table_report(table_report(results, build_seconds))
+    logger.info("=" * 60)
+    
+    return results
+
+
+def transform_all_chunked(
+    sales_chunks: Callable[[], Iterable[pd.DataFrame]],
+    extracted_data: dict,
+    sink: Optional[Callable[[str, pd.DataFrame], None]] = None
+) -> dict:
+    """
+    Chunked variant of transform_all() for sales exports too large
+    to hold in memory.
+    
+    The sales source is read twice. Pass 1 cleans each chunk and folds it
+    into the customer aggregate, date range and category set. Pass 2
+    re-reads the source, builds fact rows per chunk against the finished
+    dimensions, hands every stg_retail_sales / fact_sales chunk to ``sink``
+    and folds it into the mart partials (fold_partial(), so the work stays
+    near-linear in the number of chunks).
+    
+    Memory is one chunk plus the folds, each at most twice its merged
+    result: the customer aggregate has one row per distinct customer_id
+    and, with exact distinct counts, the 'customers' mart partials one
+    row per distinct (sale date, customer_id) and (sale date, category,
+    customer_id). Where Customer ID is unique per transaction (as in the
+    bundled export) these grow linearly with the row count; with
+    MART_DISTINCT_COUNTS=hll the mart side is bounded by one sketch per
+    sale date and group instead.
+    
+    Args:
+        sales_chunks: Zero-argument callable returning a fresh iterator of
+            raw sales chunks (e.g. extract.extract_retail_sales_chunks)
+        extracted_data: dict with 'api_products' and 'api_categories'
+        sink: Called as sink(table_name, chunk) for each streamed chunk
+        
+    Returns:
+        dict like transform_all(), except that the streamed tables
+        ('stg_retail_sales', 'fact_sales') are not included; their row
+        counts are returned under 'streamed_rows'.
+    """
+    logger.info("=" * 60)
+    logger.info("[TRANSFORM] STARTING CHUNKED DATA TRANSFORMATIONS")
+    logger.info("=" * 60)
+    
+    results = {}
+    
+    clean_products = clean_api_products(extracted_data['api_products'])
+    results['stg_api_products'] = clean_products
+    
+    # Pass 1: dimension aggregates
+    customers = None
+    min_date = max_date = None
+    categories = set()
+    for chunk in sales_chunks():
+        clean_chunk = clean_retail_sales(chunk)
+        if clean_chunk.empty:
+            continue
+        customers = fold_partial(
+            customers, aggregate_customers(clean_chunk), merge_customer_aggregates
+        )
+        chunk_min, chunk_max = clean_chunk['date'].min(), clean_chunk['date'].max()
+        min_date = chunk_min if min_date is None else min(min_date, chunk_min)
+        max_date = chunk_max if max_date is None else max(max_date, chunk_max)
+        categories.update(clean_chunk['product_category'].dropna().unique())
+    
+    if customers is None:
+        raise ValueError("Retail sales source produced no valid rows")
+    
+    category_sales = pd.DataFrame({'product_category': sorted(categories)})
+    results['dim_date'] = build_dim_date_range(min_date, max_date)
+    results['dim_customer'] = _finalize_dim_customer(
+        folded_partials(customers, merge_customer_aggregates)
+    )
+    results['dim_product'] = build_dim_product(clean_products, category_sales)
+    results['dim_product_category'] = build_dim_product_category(
+        category_sales, clean_products, extracted_data['api_categories']
+    )
+    
+    # Pass 2: fact rows, streamed out chunk by chunk
+    streamed_rows = {'stg_retail_sales': 0, 'fact_sales': 0}
+    performance = category = None
+    for chunk in sales_chunks():
+        clean_chunk = clean_retail_sales(chunk)
+        if clean_chunk.empty:
+            continue
+        fact_chunk = build_fact_sales(
+            clean_chunk,
+            results['dim_customer'],
+            results['dim_product_category'],
+            results['dim_date'],
+            sales_key_offset=streamed_rows['fact_sales'],
+        )
+        performance = fold_partial(
+            performance,
+            summarize_sales_performance(fact_chunk, results['dim_date']),
+            merge_sales_performance_partials
+        )
+        category = fold_partial(
+            category, summarize_category_analysis(fact_chunk),
+            merge_category_analysis_partials
+        )
+        
+        if sink is not None:
+            sink('stg_retail_sales', clean_chunk)
+            sink('fact_sales', fact_chunk)
+        streamed_rows['stg_retail_sales'] += len(clean_chunk)
+        streamed_rows['fact_sales'] += len(fact_chunk)
+    
+    results['mart_sales_performance'] = build_mart_sales_performance_from_partials(
+        folded_partials(performance, merge_sales_performance_partials)
+    )
+    results['mart_category_analysis'] = build_mart_category_analysis_from_partials(
+        folded_partials(category, merge_category_analysis_partials),
+        results['dim_product_category']
+    )
+    results['streamed_rows'] = streamed_rows
+    save_category_registry()
+    
+    logger.info("=" * 60)
+    logger.info("[OK] ALL CHUNKED TRANSFORMATIONS COMPLETE")
+    log_table_report(table_report(results))
+    for key, val in streamed_rows.items():
+        logger.info(f"   {key}: {val} records (streamed)")
     logger.info("=" * 60)
     
     return results
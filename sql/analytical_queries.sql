@@ -1,6 +1,10 @@
 -- ═══════════════════════════════════════════════════════════════════════
 -- Analytical Queries for the DataFoundation Retail Data Warehouse
 -- ═══════════════════════════════════════════════════════════════════════
+-- fact_sales is partitioned by sale_date and clustered by
+-- product_category, customer_id. Filter on f.sale_date (not only on
+-- dim_date columns) so BigQuery prunes partitions instead of scanning
+-- the whole fact table.
 
 
 -- ─── 1. Monthly Sales Trend ─────────────────────────────────────────
@@ -140,3 +144,36 @@ FROM `multi-source-retail-data.retail_dw.fact_sales` f
 JOIN `multi-source-retail-data.retail_dw.dim_date` d ON f.date_key = d.date_key
 GROUP BY d.year, d.quarter
 ORDER BY d.year, d.quarter;
+
+
+-- ─── 9. Recent Daily Revenue by Category (partition-pruned) ─────────
+-- Reads only the last 30 sale_date partitions; the category filter is
+-- served from the clustered blocks
+SELECT
+    f.sale_date,
+    f.product_category,
+    SUM(f.total_amount) AS daily_revenue,
+    COUNT(DISTINCT f.transaction_id) AS daily_transactions,
+    COUNT(DISTINCT f.customer_id) AS daily_customers
+FROM `multi-source-retail-data.retail_dw.fact_sales` f
+WHERE f.sale_date >= DATE_SUB(CURRENT_DATE(), INTERVAL 30 DAY)
+  AND f.product_category IN ('Beauty', 'Clothing', 'Electronics')
+GROUP BY f.sale_date, f.product_category
+ORDER BY f.sale_date, f.product_category;
+
+
+-- ─── 10. Revenue by Customer Profile at Time of Sale (SCD2 as-of) ───
+-- customer_key is shared by all versions of a customer: join the version
+-- that was in effect on the sale date, never the bare key
+SELECT
+    c.age_group,
+    c.customer_segment,
+    SUM(f.total_amount) AS total_revenue,
+    COUNT(DISTINCT f.transaction_id) AS total_transactions
+FROM `multi-source-retail-data.retail_dw.fact_sales` f
+JOIN `multi-source-retail-data.retail_dw.dim_customer` c
+    ON f.customer_key = c.customer_key
+    AND TIMESTAMP(f.sale_date) >= c.effective_start_date
+    AND TIMESTAMP(f.sale_date) < c.effective_end_date
+GROUP BY c.age_group, c.customer_segment
+ORDER BY total_revenue DESC;
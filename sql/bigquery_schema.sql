@@ -24,7 +24,9 @@ CREATE OR REPLACE TABLE `multi-source-retail-data.retail_dw.stg_retail_sales` (
     row_hash          STRING,
     _extracted_at     TIMESTAMP,
     _source           STRING
-);
+)
+PARTITION BY DATE(date)
+CLUSTER BY product_category, customer_id;
 
 -- Staging: API Products (from Fake Store API)
 CREATE OR REPLACE TABLE `multi-source-retail-data.retail_dw.stg_api_products` (
@@ -59,10 +61,17 @@ CREATE OR REPLACE TABLE `multi-source-retail-data.retail_dw.dim_date` (
     day_name          STRING,
     is_weekend        BOOL,
     fiscal_year       INT64,
-    fiscal_quarter    INT64
+    fiscal_quarter    INT64,
+    fiscal_month      INT64,
+    fiscal_week       INT64,
+    is_holiday        BOOL,
+    holiday_name      STRING
 );
 
 -- Dimension: Customer (SCD Type 2)
+-- customer_key is a durable key shared by every version of a customer;
+-- (customer_key, version) is unique. Join facts with is_current = TRUE or
+-- on the effective_start_date / effective_end_date range.
 CREATE OR REPLACE TABLE `multi-source-retail-data.retail_dw.dim_customer` (
     customer_key          INT64 NOT NULL,
     customer_id           STRING,
@@ -82,6 +91,8 @@ CREATE OR REPLACE TABLE `multi-source-retail-data.retail_dw.dim_customer` (
 );
 
 -- Dimension: Product (SCD Type 2)
+-- product_key is a durable key shared by every version of a product;
+-- (product_key, version) is unique.
 CREATE OR REPLACE TABLE `multi-source-retail-data.retail_dw.dim_product` (
     product_key           INT64 NOT NULL,
     api_product_id        INT64,
@@ -119,6 +130,7 @@ CREATE OR REPLACE TABLE `multi-source-retail-data.retail_dw.fact_sales` (
     sales_key         INT64 NOT NULL,
     transaction_id    INT64,
     date_key          INT64,
+    sale_date         DATE,
     customer_key      INT64,
     category_key      INT64,
     quantity          INT64,
@@ -131,7 +143,9 @@ CREATE OR REPLACE TABLE `multi-source-retail-data.retail_dw.fact_sales` (
     _extracted_at     TIMESTAMP,
     _source           STRING,
     _loaded_at        TIMESTAMP
-);
+)
+PARTITION BY sale_date
+CLUSTER BY product_category, customer_id;
 
 
 -- ═══════════════════════════════════════════════════════════════════════
@@ -20,7 +20,20 @@ from datetime import datetime
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from config.settings import GCP_PROJECT_ID, BQ_DATASET
+from config.settings import (
+    BQ_DATASET,
+    BQ_READ_MAX_ROWS,
+    DASHBOARD_QUERY_BACKEND,
+    GCP_PROJECT_ID,
+    MART_DISTINCT_COUNTS,
+)
+from etl.bq_reader import get_shared_bq_client, read_table
+from etl.cube import build_sales_cube, cube_members, slice_cube
+from etl.queries import query_sales, sales_date_bounds, sqlite_sales_store
+from etl.sketches import approx_nunique
+
+# Distinct-count aggregation for the dashboard's groupby summaries
+DISTINCT_COUNT = approx_nunique() if MART_DISTINCT_COUNTS == 'hll' else 'nunique'
 
 # ═══════════════════════════════════════════════════════════════════════
 # PAGE CONFIGURATION
@@ -332,20 +345,38 @@ st.markdown("""
 # ═══════════════════════════════════════════════════════════════════════
 
 @st.cache_data(ttl=300)
-def load_bigquery_data(table_name: str) -> pd.DataFrame:
-    """Load data from BigQuery table with caching."""
+def load_bigquery_data(
+    table_name: str,
+    columns: list = None,
+    row_restriction: str = None,
+    max_rows: int = None,
+) -> pd.DataFrame:
+    """
+    Read a BigQuery table with the Storage Read API: selected columns,
+    server-side row filter and an optional row cap (see
+    etl.bq_reader.read_table). The whole table is read unless
+    ``max_rows`` is given.
+    """
     try:
-        from google.cloud import bigquery
-        client = bigquery.Client(project=GCP_PROJECT_ID)
-        table_id = f"{GCP_PROJECT_ID}.{BQ_DATASET}.{table_name}"
-        query = f"SELECT * FROM `{table_id}`"
-        df = client.query(query).to_dataframe()
-        return df
+        return read_table(table_name, columns, row_restriction, max_rows)
     except Exception as e:
         st.warning(f"⚠️ Could not load BigQuery data for `{table_name}`: {e}")
         return pd.DataFrame()
 
 
+@st.cache_data(ttl=300)
+def load_bigquery_table_info(table_name: str) -> tuple:
+    """Column names and row count of a BigQuery table (table metadata only)."""
+    try:
+        table = get_shared_bq_client().get_table(
+            f"{GCP_PROJECT_ID}.{BQ_DATASET}.{table_name}"
+        )
+        return [field.name for field in table.schema], table.num_rows
+    except Exception as e:
+        st.warning(f"⚠️ Could not read BigQuery metadata for `{table_name}`: {e}")
+        return [], 0
+
+
 @st.cache_data(ttl=60)
 def load_local_csv() -> pd.DataFrame:
     """Load the local retail sales CSV for preview."""
@@ -354,25 +385,98 @@ def load_local_csv() -> pd.DataFrame:
             os.path.dirname(os.path.abspath(__file__)),
             'retail_sales_dataset.csv'
         )
-        return pd.read_csv(csv_path, parse_dates=['Date'])
+        from etl.extract import read_retail_sales_csv
+        return read_retail_sales_csv(csv_path)
     except Exception as e:
         st.warning(f"⚠️ Could not load CSV: {e}")
         return pd.DataFrame()
 
 
+@st.cache_data(ttl=60)
+def load_sales_cube() -> dict:
+    """Aggregate the local retail sales CSV into the dashboard sales cube."""
+    df = load_local_csv()
+    if df.empty:
+        return None
+    return build_sales_cube(df)
+
+
+# Cube / query dimension -> column name used by the dashboard charts
+CUBE_COLUMN_NAMES = {
+    'month': 'Month',
+    'day_of_week': 'DayOfWeek',
+    'product_category': 'Product Category',
+    'gender': 'Gender',
+    'age_group': 'AgeGroup',
+    'order_quantity': 'Quantity',
+}
+
+
+def chart_columns(
+    result: pd.DataFrame,
+    by: list = None,
+    measures: dict = None,
+) -> pd.DataFrame:
+    """
+    Name the columns of a cube slice / query result for a chart:
+    dimension columns get their dashboard names and ``measures``
+    (measure -> column name) selects and renames the measures to keep.
+    """
+    result = result.rename(columns=CUBE_COLUMN_NAMES)
+    if measures is None:
+        return result
+    columns = [CUBE_COLUMN_NAMES[d] for d in by or []] + list(measures)
+    return result[columns].rename(columns=measures)
+
+
+def cube_slice(
+    cube: dict,
+    by: list = None,
+    filters: dict = None,
+    measures: dict = None,
+) -> pd.DataFrame:
+    """Slice the sales cube for a chart (see chart_columns())."""
+    return chart_columns(slice_cube(cube, by, filters), by, measures)
+
+
+@st.cache_resource(ttl=60)
+def get_sales_query_connection():
+    """Connection the filtered sales queries run on (DASHBOARD_QUERY_BACKEND)."""
+    if DASHBOARD_QUERY_BACKEND == 'bigquery':
+        return get_shared_bq_client()
+    return sqlite_sales_store(load_local_csv())
+
+
+@st.cache_data(ttl=60)
+def query_sales_data(
+    by: list = None,
+    filters: dict = None,
+    date_range: tuple = None,
+    measures: dict = None,
+) -> pd.DataFrame:
+    """
+    Aggregate rows for a chart, computed by the query backend with the
+    filters and date range pushed down (see chart_columns()).
+    """
+    result = query_sales(
+        get_sales_query_connection(), DASHBOARD_QUERY_BACKEND,
+        by, filters, date_range, list(measures) if measures else None,
+    )
+    return chart_columns(result, by, measures)
+
+
+@st.cache_data(ttl=60)
+def load_sales_date_bounds() -> tuple:
+    """First and last sale date for the date range filter."""
+    return sales_date_bounds(get_sales_query_connection(), DASHBOARD_QUERY_BACKEND)
+
+
 @st.cache_data(ttl=300)
 def load_api_products() -> pd.DataFrame:
-    """Fetch products from Fake Store API for preview."""
+    """Fetch products from Fake Store API for preview (via the shared HTTP cache)."""
     try:
-        import requests
-        resp = requests.get("https://fakestoreapi.com/products", timeout=15)
-        resp.raise_for_status()
-        products = resp.json()
-        for p in products:
-            rating = p.pop('rating', {})
-            p['rating_rate'] = rating.get('rate', 0)
-            p['rating_count'] = rating.get('count', 0)
-        return pd.DataFrame(products)
+        from etl.extract import extract_api_products
+        return extract_api_products()
     except Exception as e:
         st.warning(f"⚠️ Could not load API data: {e}")
         return pd.DataFrame()
@@ -507,6 +611,7 @@ with st.sidebar:
 
 # Always load local data for preview
 df_sales_raw = load_local_csv()
+sales_cube = load_sales_cube()
 df_api_products = load_api_products()
 
 # Load BigQuery data if selected
@@ -551,34 +656,31 @@ if page == "🏠 Dashboard Overview":
     """, unsafe_allow_html=True)
 
     if not df_sales_raw.empty:
-        df = df_sales_raw.copy()
-        df['Date'] = pd.to_datetime(df['Date'])
-        df['Month'] = df['Date'].dt.to_period('M').astype(str)
-
-        # ── Core aggregations ─────────────────────────────────────────────
-        total_revenue      = df['Total Amount'].sum()
-        total_transactions = df['Transaction ID'].nunique()
-        unique_customers   = df['Customer ID'].nunique()
-        avg_order_value    = df['Total Amount'].mean()
-        total_units_sold   = df['Quantity'].sum()
-        num_categories     = df['Product Category'].nunique()
-        avg_price_per_unit = df['Price per Unit'].mean()
-        avg_qty_per_order  = df['Quantity'].mean()
-        max_single_txn     = df['Total Amount'].max()
+        # ── Core aggregations (sliced from the sales cube) ────────────────
+        totals = cube_slice(sales_cube).iloc[0]
+        total_revenue      = totals['revenue']
+        total_transactions = int(totals['transactions'])
+        unique_customers   = int(totals['unique_customers'])
+        avg_order_value    = totals['avg_order_value']
+        total_units_sold   = int(totals['quantity'])
+        num_categories     = len(cube_members(sales_cube, 'product_category'))
+        avg_price_per_unit = totals['avg_price']
+        avg_qty_per_order  = totals['avg_quantity']
+        max_single_txn     = totals['max_order']
         api_products_count = len(df_api_products) if not df_api_products.empty else 0
 
         # Best month
-        monthly_rev  = df.groupby('Month')['Total Amount'].sum()
+        monthly_rev  = cube_slice(sales_cube, ['month']).set_index('Month')['revenue']
         best_month   = monthly_rev.idxmax()
         best_month_rev = monthly_rev.max()
 
         # Top category
-        cat_rev      = df.groupby('Product Category')['Total Amount'].sum()
+        cat_rev      = cube_slice(sales_cube, ['product_category']).set_index('Product Category')['revenue']
         top_category = cat_rev.idxmax()
         top_cat_pct  = cat_rev.max() / total_revenue * 100
 
         # Gender revenue
-        gender_rev   = df.groupby('Gender')['Total Amount'].sum()
+        gender_rev   = cube_slice(sales_cube, ['gender']).set_index('Gender')['revenue']
         top_gender   = gender_rev.idxmax()
         top_gender_pct = gender_rev.max() / total_revenue * 100
         female_rev   = gender_rev.get('Female', 0)
@@ -589,9 +691,9 @@ if page == "🏠 Dashboard Overview":
         rev_per_customer = total_revenue / unique_customers
 
         # Age stats
-        avg_cust_age  = df['Age'].mean()
-        youngest_cust = df['Age'].min()
-        oldest_cust   = df['Age'].max()
+        avg_cust_age  = totals['avg_age']
+        youngest_cust = int(totals['min_age'])
+        oldest_cust   = int(totals['max_age'])
 
         # MoM growth
         monthly_sorted = monthly_rev.sort_index()
@@ -667,10 +769,10 @@ if page == "🏠 Dashboard Overview":
 
         with col_left:
             st.markdown("#### &#128200; Monthly Revenue Trend")
-            monthly_agg = df.groupby('Month').agg(
-                Revenue=('Total Amount', 'sum'),
-                Transactions=('Transaction ID', 'nunique'),
-            ).reset_index()
+            monthly_agg = cube_slice(
+                sales_cube, ['month'],
+                measures={'revenue': 'Revenue', 'transactions': 'Transactions'},
+            )
             fig = go.Figure()
             fig.add_trace(go.Scatter(
                 x=monthly_agg['Month'],
@@ -696,7 +798,9 @@ if page == "🏠 Dashboard Overview":
 
         with col_right:
             st.markdown("#### &#127991; Revenue by Category")
-            cat_rev_df = df.groupby('Product Category')['Total Amount'].sum().reset_index()
+            cat_rev_df = cube_slice(
+                sales_cube, ['product_category'], measures={'revenue': 'Total Amount'}
+            )
             fig = px.pie(
                 cat_rev_df, values='Total Amount', names='Product Category',
                 color_discrete_sequence=CHART_COLORS, hole=0.45,
@@ -721,7 +825,9 @@ if page == "🏠 Dashboard Overview":
 
         with vc1:
             st.markdown("**Units Sold by Category**")
-            units_cat = df.groupby('Product Category')['Quantity'].sum().reset_index()
+            units_cat = cube_slice(
+                sales_cube, ['product_category'], measures={'quantity': 'Quantity'}
+            )
             fig_u = px.bar(
                 units_cat, x='Product Category', y='Quantity',
                 color='Product Category', color_discrete_sequence=CHART_COLORS,
@@ -739,7 +845,10 @@ if page == "🏠 Dashboard Overview":
 
         with vc2:
             st.markdown("**Avg Order Value by Gender & Category**")
-            aov_gc = df.groupby(['Gender', 'Product Category'])['Total Amount'].mean().reset_index()
+            aov_gc = cube_slice(
+                sales_cube, ['gender', 'product_category'],
+                measures={'avg_order_value': 'Total Amount'},
+            )
             fig_g = px.bar(
                 aov_gc, x='Product Category', y='Total Amount',
                 color='Gender', barmode='group',
@@ -781,48 +890,62 @@ if page == "🏠 Dashboard Overview":
     """, unsafe_allow_html=True)
     
     if not df_sales_raw.empty:
-        # Filters
-        filter_col1, filter_col2 = st.columns(2)
+        # Filters (pushed down into the sales queries)
+        filter_col1, filter_col2, filter_col3 = st.columns(3)
         with filter_col1:
             selected_categories = st.multiselect(
                 "Filter by Category",
-                df_sales_raw['Product Category'].unique(),
-                default=df_sales_raw['Product Category'].unique()
+                cube_members(sales_cube, 'product_category'),
+                default=cube_members(sales_cube, 'product_category')
             )
         with filter_col2:
             selected_genders = st.multiselect(
                 "Filter by Gender",
-                df_sales_raw['Gender'].unique(),
-                default=df_sales_raw['Gender'].unique()
+                cube_members(sales_cube, 'gender'),
+                default=cube_members(sales_cube, 'gender')
+            )
+        with filter_col3:
+            first_date, last_date = load_sales_date_bounds()
+            selected_dates = st.date_input(
+                "Date Range",
+                value=(first_date, last_date),
+                min_value=first_date,
+                max_value=last_date,
             )
         
-        df_filtered = df_sales_raw[
-            (df_sales_raw['Product Category'].isin(selected_categories)) &
-            (df_sales_raw['Gender'].isin(selected_genders))
-        ]
+        sales_filters = {
+            'product_category': selected_categories,
+            'gender': selected_genders,
+        }
+        # Only the start date is set while the range is being picked
+        date_range = tuple(selected_dates) if len(selected_dates) == 2 else None
+        filtered_totals = query_sales_data(
+            filters=sales_filters, date_range=date_range
+        ).iloc[0]
         
         # KPIs
         kpi1, kpi2, kpi3, kpi4 = st.columns(4)
         with kpi1:
-            st.metric("Filtered Revenue", f"${df_filtered['Total Amount'].sum():,.0f}")
+            st.metric("Filtered Revenue", f"${filtered_totals['revenue']:,.0f}")
         with kpi2:
-            st.metric("Transactions", f"{df_filtered['Transaction ID'].nunique():,}")
+            st.metric("Transactions", f"{int(filtered_totals['transactions']):,}")
         with kpi3:
-            st.metric("Avg Quantity", f"{df_filtered['Quantity'].mean():.1f}")
+            st.metric("Avg Quantity", f"{filtered_totals['avg_quantity']:.1f}")
         with kpi4:
-            st.metric("Avg Price/Unit", f"${df_filtered['Price per Unit'].mean():.0f}")
+            st.metric("Avg Price/Unit", f"${filtered_totals['avg_price']:.0f}")
         
         st.divider()
         
         # Monthly trend
         st.markdown("#### 📈 Monthly Revenue & Transaction Trend")
-        df_monthly = df_filtered.copy()
-        df_monthly['Month'] = df_monthly['Date'].dt.to_period('M').astype(str)
-        monthly = df_monthly.groupby('Month').agg(
-            Revenue=('Total Amount', 'sum'),
-            Transactions=('Transaction ID', 'nunique'),
-            AvgOrder=('Total Amount', 'mean'),
-        ).reset_index()
+        monthly = query_sales_data(
+            ['month'], sales_filters, date_range,
+            measures={
+                'revenue': 'Revenue',
+                'transactions': 'Transactions',
+                'avg_order_value': 'AvgOrder',
+            },
+        )
         
         fig = make_subplots(specs=[[{"secondary_y": True}]])
         fig.add_trace(
@@ -864,10 +987,10 @@ if page == "🏠 Dashboard Overview":
         
         with chart_col1:
             st.markdown("#### 🏷️ Revenue by Category")
-            cat_data = df_filtered.groupby('Product Category').agg(
-                Revenue=('Total Amount', 'sum'),
-                Qty=('Quantity', 'sum'),
-            ).reset_index().sort_values('Revenue', ascending=True)
+            cat_data = query_sales_data(
+                ['product_category'], sales_filters, date_range,
+                measures={'revenue': 'Revenue', 'quantity': 'Qty'},
+            ).sort_values('Revenue', ascending=True)
             
             fig = px.bar(
                 cat_data, x='Revenue', y='Product Category',
@@ -885,25 +1008,33 @@ if page == "🏠 Dashboard Overview":
         
         with chart_col2:
             st.markdown("#### 📊 Quantity Distribution")
+            quantity_data = query_sales_data(
+                ['order_quantity', 'product_category'], sales_filters, date_range,
+                measures={'orders': 'Orders'},
+            )
             fig = px.histogram(
-                df_filtered, x='Quantity', nbins=10,
+                quantity_data, x='Quantity', y='Orders', histfunc='sum', nbins=10,
                 color='Product Category',
                 color_discrete_sequence=CHART_COLORS,
                 opacity=0.85,
             )
             fig.update_layout(**CHART_TEMPLATE['layout'], height=300,
-                              bargap=0.05)
+                              bargap=0.05, yaxis_title='count')
             fig.update_traces(marker_line_width=0)
             apply_chart_animation(fig)
             st.plotly_chart(fig, use_container_width=True)
         
         # Daily heatmap
         st.markdown("#### 🗓️ Daily Sales Heatmap")
-        df_heatmap = df_filtered.copy()
-        df_heatmap['DayOfWeek'] = df_heatmap['Date'].dt.day_name()
-        df_heatmap['Month'] = df_heatmap['Date'].dt.month_name()
-        
-        heatmap_data = df_heatmap.groupby(['DayOfWeek', 'Month'])['Total Amount'].sum().reset_index()
+        heatmap_data = query_sales_data(
+            ['day_of_week', 'month'], sales_filters, date_range,
+            measures={'revenue': 'Total Amount'},
+        )
+        # Calendar months of different years share a heatmap column
+        heatmap_data['Month'] = pd.to_datetime(heatmap_data['Month']).dt.month_name()
+        heatmap_data = heatmap_data.groupby(
+            ['DayOfWeek', 'Month'], observed=True
+        )['Total Amount'].sum().reset_index()
         heatmap_pivot = heatmap_data.pivot(
             index='DayOfWeek', columns='Month', values='Total Amount'
         ).fillna(0)
@@ -951,15 +1082,18 @@ if page == "🏠 Dashboard Overview":
     
     if not df_sales_raw.empty:
         # Category metrics
-        cat_analysis = df_sales_raw.groupby('Product Category').agg(
-            Revenue=('Total Amount', 'sum'),
-            Transactions=('Transaction ID', 'nunique'),
-            Quantity=('Quantity', 'sum'),
-            AvgPrice=('Price per Unit', 'mean'),
-            AvgOrderValue=('Total Amount', 'mean'),
-            Customers=('Customer ID', 'nunique'),
-            AvgAge=('Age', 'mean'),
-        ).reset_index()
+        cat_analysis = cube_slice(
+            sales_cube, ['product_category'],
+            measures={
+                'revenue': 'Revenue',
+                'transactions': 'Transactions',
+                'quantity': 'Quantity',
+                'avg_price': 'AvgPrice',
+                'avg_order_value': 'AvgOrderValue',
+                'unique_customers': 'Customers',
+                'avg_age': 'AvgAge',
+            },
+        )
         
         total_rev = cat_analysis['Revenue'].sum()
         cat_analysis['RevenueShare'] = (
@@ -1014,9 +1148,10 @@ if page == "🏠 Dashboard Overview":
         
         with chart_col2:
             st.markdown("#### Gender Split by Category")
-            gender_cat = df_sales_raw.groupby(
-                ['Product Category', 'Gender']
-            )['Total Amount'].sum().reset_index()
+            gender_cat = cube_slice(
+                sales_cube, ['product_category', 'gender'],
+                measures={'revenue': 'Total Amount'},
+            )
             
             fig = px.bar(
                 gender_cat,
@@ -1042,11 +1177,8 @@ if page == "🏠 Dashboard Overview":
         date_col = 'Date' 
         
         if date_col in df_sales_raw.columns:
-            # Create a Year-Month string for grouping (e.g., '2023-01')
-            df_sales_raw['YearMonth'] = pd.to_datetime(df_sales_raw[date_col]).dt.to_period('M').astype(str)
-            
             # Interactive Filter
-            all_categories = df_sales_raw['Product Category'].unique()
+            all_categories = cube_members(sales_cube, 'product_category')
             selected_categories = st.multiselect(
                 "Filter by Product Category:",
                 options=all_categories,
@@ -1055,11 +1187,11 @@ if page == "🏠 Dashboard Overview":
             
             if selected_categories:
                 # Filter and aggregate
-                df_monthly = df_sales_raw[df_sales_raw['Product Category'].isin(selected_categories)]
-                monthly_cat = df_monthly.groupby(['YearMonth', 'Product Category']).agg(
-                    Revenue=('Total Amount', 'sum'),
-                    UnitsSold=('Quantity', 'sum')
-                ).reset_index()
+                monthly_cat = cube_slice(
+                    sales_cube, ['month', 'product_category'],
+                    {'product_category': selected_categories},
+                    measures={'revenue': 'Revenue', 'quantity': 'UnitsSold'},
+                ).rename(columns={'Month': 'YearMonth'})
                 
                 # Sort chronologically
                 monthly_cat = monthly_cat.sort_values('YearMonth')
@@ -1089,16 +1221,19 @@ if page == "🏠 Dashboard Overview":
             st.warning(f"Could not find a date column named '{date_col}' to generate monthly trends.")
          # ── KPI Summary Table ─────────────────────────────────────────────
         st.markdown("#### &#128203;Summary by Category")
-        cat_summary = df.groupby('Product Category').agg(
-            Revenue      = ('Total Amount',   'sum'),
-            Transactions = ('Transaction ID', 'nunique'),
-            Customers    = ('Customer ID',    'nunique'),
-            Units_Sold   = ('Quantity',       'sum'),
-            Avg_Order    = ('Total Amount',   'mean'),
-            Avg_Price    = ('Price per Unit', 'mean'),
-            Avg_Qty      = ('Quantity',       'mean'),
-            Avg_Age      = ('Age',            'mean'),
-        ).reset_index()
+        cat_summary = cube_slice(
+            sales_cube, ['product_category'],
+            measures={
+                'revenue':          'Revenue',
+                'transactions':     'Transactions',
+                'unique_customers': 'Customers',
+                'quantity':         'Units_Sold',
+                'avg_order_value':  'Avg_Order',
+                'avg_price':        'Avg_Price',
+                'avg_quantity':     'Avg_Qty',
+                'avg_age':          'Avg_Age',
+            },
+        )
         cat_summary['Rev_Share_%'] = (cat_summary['Revenue'] / total_revenue * 100).round(1)
         # Format for display
         display_summary = cat_summary.copy()
@@ -1342,48 +1477,62 @@ elif page == "📊 Sales Analytics":
     """, unsafe_allow_html=True)
     
     if not df_sales_raw.empty:
-        # Filters
-        filter_col1, filter_col2 = st.columns(2)
+        # Filters (pushed down into the sales queries)
+        filter_col1, filter_col2, filter_col3 = st.columns(3)
         with filter_col1:
             selected_categories = st.multiselect(
                 "Filter by Category",
-                df_sales_raw['Product Category'].unique(),
-                default=df_sales_raw['Product Category'].unique()
+                cube_members(sales_cube, 'product_category'),
+                default=cube_members(sales_cube, 'product_category')
             )
         with filter_col2:
             selected_genders = st.multiselect(
                 "Filter by Gender",
-                df_sales_raw['Gender'].unique(),
-                default=df_sales_raw['Gender'].unique()
+                cube_members(sales_cube, 'gender'),
+                default=cube_members(sales_cube, 'gender')
+            )
+        with filter_col3:
+            first_date, last_date = load_sales_date_bounds()
+            selected_dates = st.date_input(
+                "Date Range",
+                value=(first_date, last_date),
+                min_value=first_date,
+                max_value=last_date,
             )
         
-        df_filtered = df_sales_raw[
-            (df_sales_raw['Product Category'].isin(selected_categories)) &
-            (df_sales_raw['Gender'].isin(selected_genders))
-        ]
+        sales_filters = {
+            'product_category': selected_categories,
+            'gender': selected_genders,
+        }
+        # Only the start date is set while the range is being picked
+        date_range = tuple(selected_dates) if len(selected_dates) == 2 else None
+        filtered_totals = query_sales_data(
+            filters=sales_filters, date_range=date_range
+        ).iloc[0]
         
         # KPIs
         kpi1, kpi2, kpi3, kpi4 = st.columns(4)
         with kpi1:
-            st.metric("Filtered Revenue", f"${df_filtered['Total Amount'].sum():,.0f}")
+            st.metric("Filtered Revenue", f"${filtered_totals['revenue']:,.0f}")
         with kpi2:
-            st.metric("Transactions", f"{df_filtered['Transaction ID'].nunique():,}")
+            st.metric("Transactions", f"{int(filtered_totals['transactions']):,}")
         with kpi3:
-            st.metric("Avg Quantity", f"{df_filtered['Quantity'].mean():.1f}")
+            st.metric("Avg Quantity", f"{filtered_totals['avg_quantity']:.1f}")
         with kpi4:
-            st.metric("Avg Price/Unit", f"${df_filtered['Price per Unit'].mean():.0f}")
+            st.metric("Avg Price/Unit", f"${filtered_totals['avg_price']:.0f}")
         
         st.divider()
         
         # Monthly trend
         st.markdown("#### 📈 Monthly Revenue & Transaction Trend")
-        df_monthly = df_filtered.copy()
-        df_monthly['Month'] = df_monthly['Date'].dt.to_period('M').astype(str)
-        monthly = df_monthly.groupby('Month').agg(
-            Revenue=('Total Amount', 'sum'),
-            Transactions=('Transaction ID', 'nunique'),
-            AvgOrder=('Total Amount', 'mean'),
-        ).reset_index()
+        monthly = query_sales_data(
+            ['month'], sales_filters, date_range,
+            measures={
+                'revenue': 'Revenue',
+                'transactions': 'Transactions',
+                'avg_order_value': 'AvgOrder',
+            },
+        )
         
         fig = make_subplots(specs=[[{"secondary_y": True}]])
         fig.add_trace(
@@ -1421,10 +1570,10 @@ elif page == "📊 Sales Analytics":
         
         with chart_col1:
             st.markdown("#### 🏷️ Revenue by Category")
-            cat_data = df_filtered.groupby('Product Category').agg(
-                Revenue=('Total Amount', 'sum'),
-                Qty=('Quantity', 'sum'),
-            ).reset_index().sort_values('Revenue', ascending=True)
+            cat_data = query_sales_data(
+                ['product_category'], sales_filters, date_range,
+                measures={'revenue': 'Revenue', 'quantity': 'Qty'},
+            ).sort_values('Revenue', ascending=True)
             
             fig = px.bar(
                 cat_data, x='Revenue', y='Product Category',
@@ -1442,24 +1591,33 @@ elif page == "📊 Sales Analytics":
         
         with chart_col2:
             st.markdown("#### 📊 Quantity Distribution")
+            quantity_data = query_sales_data(
+                ['order_quantity', 'product_category'], sales_filters, date_range,
+                measures={'orders': 'Orders'},
+            )
             fig = px.histogram(
-                df_filtered, x='Quantity', nbins=10,
+                quantity_data, x='Quantity', y='Orders', histfunc='sum', nbins=10,
                 color='Product Category',
                 color_discrete_sequence=CHART_COLORS,
                 opacity=0.85,
             )
-            fig.update_layout(**CHART_TEMPLATE['layout'], height=300, bargap=0.05)
+            fig.update_layout(**CHART_TEMPLATE['layout'], height=300,
+                              bargap=0.05, yaxis_title='count')
             fig.update_traces(marker_line_width=0)
             apply_chart_animation(fig)
             st.plotly_chart(fig, use_container_width=True)
         
         # Daily heatmap
         st.markdown("#### 🗓️ Daily Sales Heatmap")
-        df_heatmap = df_filtered.copy()
-        df_heatmap['DayOfWeek'] = df_heatmap['Date'].dt.day_name()
-        df_heatmap['Month'] = df_heatmap['Date'].dt.month_name()
-        
-        heatmap_data = df_heatmap.groupby(['DayOfWeek', 'Month'])['Total Amount'].sum().reset_index()
+        heatmap_data = query_sales_data(
+            ['day_of_week', 'month'], sales_filters, date_range,
+            measures={'revenue': 'Total Amount'},
+        )
+        # Calendar months of different years share a heatmap column
+        heatmap_data['Month'] = pd.to_datetime(heatmap_data['Month']).dt.month_name()
+        heatmap_data = heatmap_data.groupby(
+            ['DayOfWeek', 'Month'], observed=True
+        )['Total Amount'].sum().reset_index()
         heatmap_pivot = heatmap_data.pivot(
             index='DayOfWeek', columns='Month', values='Total Amount'
         ).fillna(0)
@@ -1510,15 +1668,18 @@ elif page == "🏷️ Category Analysis":
     
     if not df_sales_raw.empty:
         # Category metrics
-        cat_analysis = df_sales_raw.groupby('Product Category').agg(
-            Revenue=('Total Amount', 'sum'),
-            Transactions=('Transaction ID', 'nunique'),
-            Quantity=('Quantity', 'sum'),
-            AvgPrice=('Price per Unit', 'mean'),
-            AvgOrderValue=('Total Amount', 'mean'),
-            Customers=('Customer ID', 'nunique'),
-            AvgAge=('Age', 'mean'),
-        ).reset_index()
+        cat_analysis = cube_slice(
+            sales_cube, ['product_category'],
+            measures={
+                'revenue': 'Revenue',
+                'transactions': 'Transactions',
+                'quantity': 'Quantity',
+                'avg_price': 'AvgPrice',
+                'avg_order_value': 'AvgOrderValue',
+                'unique_customers': 'Customers',
+                'avg_age': 'AvgAge',
+            },
+        )
         
         total_rev = cat_analysis['Revenue'].sum()
         cat_analysis['RevenueShare'] = (
@@ -1573,9 +1734,10 @@ elif page == "🏷️ Category Analysis":
         
         with chart_col2:
             st.markdown("#### Gender Split by Category")
-            gender_cat = df_sales_raw.groupby(
-                ['Product Category', 'Gender']
-            )['Total Amount'].sum().reset_index()
+            gender_cat = cube_slice(
+                sales_cube, ['product_category', 'gender'],
+                measures={'revenue': 'Total Amount'},
+            )
             
             fig = px.bar(
                 gender_cat,
@@ -1601,11 +1763,8 @@ elif page == "🏷️ Category Analysis":
         date_col = 'Date' 
         
         if date_col in df_sales_raw.columns:
-            # Create a Year-Month string for grouping (e.g., '2023-01')
-            df_sales_raw['YearMonth'] = pd.to_datetime(df_sales_raw[date_col]).dt.to_period('M').astype(str)
-            
             # Interactive Filter
-            all_categories = df_sales_raw['Product Category'].unique()
+            all_categories = cube_members(sales_cube, 'product_category')
             selected_categories = st.multiselect(
                 "Filter by Product Category:",
                 options=all_categories,
@@ -1614,11 +1773,11 @@ elif page == "🏷️ Category Analysis":
             
             if selected_categories:
                 # Filter and aggregate
-                df_monthly = df_sales_raw[df_sales_raw['Product Category'].isin(selected_categories)]
-                monthly_cat = df_monthly.groupby(['YearMonth', 'Product Category']).agg(
-                    Revenue=('Total Amount', 'sum'),
-                    UnitsSold=('Quantity', 'sum')
-                ).reset_index()
+                monthly_cat = cube_slice(
+                    sales_cube, ['month', 'product_category'],
+                    {'product_category': selected_categories},
+                    measures={'revenue': 'Revenue', 'quantity': 'UnitsSold'},
+                ).rename(columns={'Month': 'YearMonth'})
                 
                 # Sort chronologically
                 monthly_cat = monthly_cat.sort_values('YearMonth')
@@ -1706,7 +1865,7 @@ elif page == "👤 Customer Insights":
             Gender=('Gender', 'first'),
             Age=('Age', 'first'),
             TotalSpent=('Total Amount', 'sum'),
-            Transactions=('Transaction ID', 'nunique'),
+            Transactions=('Transaction ID', DISTINCT_COUNT),
             AvgOrder=('Total Amount', 'mean'),
             FirstPurchase=('Date', 'min'),
             LastPurchase=('Date', 'max'),
@@ -1900,7 +2059,7 @@ elif page == "🗄️ Data Warehouse":
     ┌─────────────────┐     ┌─────────────────────────┐     ┌──────────────────┐
     │   dim_date       │     │      fact_sales          │     │  dim_customer    │
     ├─────────────────┤     ├─────────────────────────┤     ├──────────────────┤
-    │ date_key    (PK) │◄───│ date_key          (FK)  │───►│ customer_key (PK)│
+    │ date_key    (PK) │◄───│ date_key          (FK)  │───►│ customer_key (DK)│
     │ full_date        │     │ customer_key      (FK)  │     │ customer_id      │
     │ year             │     │ category_key      (FK)  │     │ gender           │
     │ quarter          │     │ sales_key         (PK)  │     │ age / age_group  │
@@ -1913,7 +2072,7 @@ elif page == "🗄️ Data Warehouse":
                             ┌────────────▼────────────┐     ┌──────────────────┐
                             │  dim_product_category    │     │   dim_product    │
                             ├─────────────────────────┤     ├──────────────────┤
-                            │ category_key       (PK) │     │ product_key (PK) │
+                            │ category_key       (PK) │     │ product_key (DK) │
                             │ category_name            │     │ api_product_id   │
                             │ category_source          │     │ product_name     │
                             │ category_group           │     │ api_price        │
@@ -1951,12 +2110,35 @@ elif page == "🗄️ Data Warehouse":
              'mart_sales_performance', 'mart_category_analysis']
         )
         
+        table_columns, table_rows = load_bigquery_table_info(table_to_view)
+        browse_col1, browse_col2 = st.columns(2)
+        with browse_col1:
+            selected_columns = st.multiselect(
+                "Columns", table_columns, default=table_columns
+            )
+        with browse_col2:
+            row_restriction = st.text_input(
+                "Row filter (SQL condition)",
+                placeholder="e.g. sale_date >= '2023-06-01'",
+            )
+        
         if st.button("🔍 View Table Data"):
-            with st.spinner("Loading from BigQuery..."):
-                df = load_bigquery_data(table_to_view)
+            with st.spinner("Reading from BigQuery..."):
+                df = load_bigquery_data(
+                    table_to_view, selected_columns, row_restriction or None,
+                    max_rows=BQ_READ_MAX_ROWS,
+                )
                 if not df.empty:
                     st.dataframe(df, use_container_width=True, height=400)
-                    st.info(f"📊 {len(df)} rows × {len(df.columns)} columns")
+                    st.info(
+                        f"📊 {len(df):,} of {table_rows:,} rows × {len(df.columns)} columns"
+                    )
+                    if BQ_READ_MAX_ROWS and len(df) >= BQ_READ_MAX_ROWS:
+                        st.warning(
+                            f"⚠️ Preview capped at {BQ_READ_MAX_ROWS:,} rows "
+                            f"(an arbitrary subset, not the first rows). Narrow the "
+                            f"row filter or raise BQ_READ_MAX_ROWS to see more."
+                        )
     else:
         st.info(
             "💡 Switch to **BigQuery (Live)** data source in the sidebar "
@@ -2011,7 +2193,9 @@ CREATE TABLE dim_date (
     date_key INT64, full_date DATE, year INT64, quarter INT64,
     month INT64, month_name STRING, week_of_year INT64,
     day_of_month INT64, day_of_week INT64, day_name STRING,
-    is_weekend BOOL, fiscal_year INT64, fiscal_quarter INT64
+    is_weekend BOOL, fiscal_year INT64, fiscal_quarter INT64,
+    fiscal_month INT64, fiscal_week INT64,
+    is_holiday BOOL, holiday_name STRING
 );
             """, language="sql")
         
@@ -2019,12 +2203,15 @@ CREATE TABLE dim_date (
             st.code("""
 CREATE TABLE fact_sales (
     sales_key INT64, transaction_id INT64,
-    date_key INT64, customer_key INT64, category_key INT64,
+    date_key INT64, sale_date DATE,
+    customer_key INT64, category_key INT64,
     quantity INT64, price_per_unit FLOAT64, total_amount FLOAT64,
     customer_id STRING, product_category STRING,
     gender STRING, age INT64,
     _extracted_at TIMESTAMP, _source STRING, _loaded_at TIMESTAMP
-);
+)
+PARTITION BY sale_date
+CLUSTER BY product_category, customer_id;
 
 CREATE TABLE mart_sales_performance (
     year INT64, month INT64, month_name STRING,
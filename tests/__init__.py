@@ -0,0 +1 @@
+# Test suite (run from the repository root: python -m pytest tests)
@@ -0,0 +1,102 @@
+"""
+Shared fixtures: an isolated artifact directory and a local stub HTTP
+server for the REST client tests.
+
+ETL_ARTIFACT_DIR (and with it API_CACHE_DIR) is pointed at a temporary
+directory before any etl module is imported, so tests never touch the
+real artifacts/ tree.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+os.environ['ETL_ARTIFACT_DIR'] = tempfile.mkdtemp(prefix='etl_test_artifacts_')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from etl import http_cache  # noqa: E402
+
+
+class StubServer:
+    """
+    Local HTTP server answering GETs from scripted responses.
+    
+    ``routes`` maps a path to a list of responses, consumed in order; the
+    last one is repeated once the list is exhausted. A response is a dict
+    with 'status', optional 'headers' and optional 'body' (JSON-encoded
+    unless bytes), or a callable taking the request headers and
+    returning such a dict. Every request is recorded in ``requests`` as
+    (path, headers dict).
+    """
+    
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+    
+    def url(self, path: str) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}{path}"
+    
+    def requests_to(self, path: str) -> list:
+        return [headers for p, headers in self.requests if p == path]
+    
+    def _next_response(self, path: str, headers: dict) -> dict:
+        with self._lock:
+            self.requests.append((path, headers))
+            queue = self.routes.get(path)
+            if not queue:
+                return {'status': 404}
+            response = queue.pop(0) if len(queue) > 1 else queue[0]
+        return response(headers) if callable(response) else response
+    
+    def _handler(self):
+        stub = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                response = stub._next_response(self.path, dict(self.headers))
+                body = response.get('body', b'')
+                if not isinstance(body, bytes):
+                    body = json.dumps(body).encode()
+                self.send_response(response['status'])
+                for name, value in response.get('headers', {}).items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return Handler
+    
+    def start(self):
+        self._thread.start()
+    
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    server = StubServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def cache_dir():
+    """Empty HTTP cache directory used by fetch_json()."""
+    http_cache.clear()
+    yield http_cache.API_CACHE_DIR
+    http_cache.clear()
@@ -0,0 +1,201 @@
+"""Retry/backoff and conditional-GET behaviour of etl.api_client."""
+
+import os
+import time
+
+import pytest
+import requests
+
+from etl import api_client, http_cache
+
+PRODUCTS = [{'id': 1, 'title': 'Backpack', 'price': 109.95}]
+
+
+def expire(url: str):
+    """Age a cache entry past API_CACHE_TTL_SEC so it must be revalidated."""
+    entry = http_cache.get_entry(url)
+    entry['stored_at'] -= http_cache.API_CACHE_TTL_SEC + 1
+    meta_path, _ = http_cache._entry_paths(url)
+    http_cache._write_json(meta_path, entry)
+
+
+# =====================================================================
+# Retry / backoff
+# =====================================================================
+
+def test_retries_transient_errors_then_succeeds(stub_server):
+    stub_server.routes['/products'] = [
+        {'status': 503},
+        {'status': 502},
+        {'status': 200, 'body': PRODUCTS},
+    ]
+    session = api_client.build_session(retries=3, backoff=0)
+    
+    payload = api_client.fetch_json(
+        stub_server.url('/products'), session=session, use_cache=False
+    )
+    
+    assert payload == PRODUCTS
+    assert len(stub_server.requests_to('/products')) == 3
+
+
+def test_backs_off_between_retries(stub_server):
+    stub_server.routes['/products'] = [
+        {'status': 500},
+        {'status': 500},
+        {'status': 200, 'body': PRODUCTS},
+    ]
+    backoff = 0.2
+    session = api_client.build_session(retries=3, backoff=backoff)
+    
+    start = time.perf_counter()
+    api_client.fetch_json(stub_server.url('/products'), session=session, use_cache=False)
+    elapsed = time.perf_counter() - start
+    
+    # The second retry sleeps backoff * 2 ** 1
+    assert elapsed >= backoff * 2
+
+
+def test_honours_retry_after(stub_server):
+    stub_server.routes['/products'] = [
+        {'status': 429, 'headers': {'Retry-After': '1'}},
+        {'status': 200, 'body': PRODUCTS},
+    ]
+    session = api_client.build_session(retries=2, backoff=0)
+    
+    start = time.perf_counter()
+    payload = api_client.fetch_json(
+        stub_server.url('/products'), session=session, use_cache=False
+    )
+    
+    assert payload == PRODUCTS
+    assert time.perf_counter() - start >= 1
+
+
+def test_raises_once_retries_are_exhausted(stub_server):
+    stub_server.routes['/products'] = [{'status': 503}]
+    session = api_client.build_session(retries=2, backoff=0)
+    
+    with pytest.raises(requests.exceptions.HTTPError):
+        api_client.fetch_json(
+            stub_server.url('/products'), session=session, use_cache=False
+        )
+    assert len(stub_server.requests_to('/products')) == 3
+
+
+def test_does_not_retry_client_errors(stub_server):
+    stub_server.routes['/products'] = [{'status': 404}]
+    session = api_client.build_session(retries=3, backoff=0)
+    
+    with pytest.raises(requests.exceptions.HTTPError):
+        api_client.fetch_json(
+            stub_server.url('/products'), session=session, use_cache=False
+        )
+    assert len(stub_server.requests_to('/products')) == 1
+
+
+# =====================================================================
+# Cache + conditional GET
+# =====================================================================
+
+def test_fresh_entry_is_served_without_a_request(stub_server, cache_dir):
+    stub_server.routes['/products'] = [
+        {'status': 200, 'headers': {'ETag': '"v1"'}, 'body': PRODUCTS},
+    ]
+    session = api_client.build_session(retries=0)
+    url = stub_server.url('/products')
+    
+    assert api_client.fetch_json(url, session=session) == PRODUCTS
+    assert api_client.fetch_json(url, session=session) == PRODUCTS
+    assert len(stub_server.requests_to('/products')) == 1
+
+
+def test_stale_entry_is_revalidated_with_304(stub_server, cache_dir):
+    def conditional(headers):
+        if headers.get('If-None-Match') == '"v1"':
+            return {'status': 304, 'headers': {'ETag': '"v1"'}}
+        return {'status': 200, 'headers': {'ETag': '"v1"'}, 'body': PRODUCTS}
+    
+    stub_server.routes['/products'] = [conditional]
+    session = api_client.build_session(retries=0)
+    url = stub_server.url('/products')
+    
+    api_client.fetch_json(url, session=session)
+    expire(url)
+    payload = api_client.fetch_json(url, session=session)
+    
+    first, second = stub_server.requests_to('/products')
+    assert 'If-None-Match' not in first
+    assert second['If-None-Match'] == '"v1"'
+    assert payload == PRODUCTS
+    # The 304 made the entry fresh again: no third request
+    assert http_cache.is_fresh(http_cache.get_entry(url))
+    api_client.fetch_json(url, session=session)
+    assert len(stub_server.requests_to('/products')) == 2
+
+
+def test_revalidation_sends_last_modified(stub_server, cache_dir):
+    last_modified = 'Wed, 21 Oct 2025 07:28:00 GMT'
+    stub_server.routes['/categories'] = [
+        {'status': 200, 'headers': {'Last-Modified': last_modified}, 'body': ['a']},
+        {'status': 304},
+    ]
+    session = api_client.build_session(retries=0)
+    url = stub_server.url('/categories')
+    
+    api_client.fetch_json(url, session=session)
+    expire(url)
+    
+    assert api_client.fetch_json(url, session=session) == ['a']
+    assert stub_server.requests_to('/categories')[1]['If-Modified-Since'] == last_modified
+
+
+def test_changed_resource_replaces_cached_payload(stub_server, cache_dir):
+    updated = PRODUCTS + [{'id': 2, 'title': 'T-Shirt', 'price': 22.3}]
+    stub_server.routes['/products'] = [
+        {'status': 200, 'headers': {'ETag': '"v1"'}, 'body': PRODUCTS},
+        {'status': 200, 'headers': {'ETag': '"v2"'}, 'body': updated},
+    ]
+    session = api_client.build_session(retries=0)
+    url = stub_server.url('/products')
+    
+    api_client.fetch_json(url, session=session)
+    expire(url)
+    
+    assert api_client.fetch_json(url, session=session) == updated
+    assert http_cache.get_entry(url)['etag'] == '"v2"'
+    assert os.path.exists(http_cache._entry_paths(url)[1])
+
+
+def test_entry_evicted_during_revalidation_is_fetched_again(stub_server, cache_dir):
+    def evict_then_304(headers):
+        if headers.get('If-None-Match') == '"v1"':
+            http_cache.evict(max_mb=0)
+            return {'status': 304, 'headers': {'ETag': '"v1"'}}
+        return {'status': 200, 'headers': {'ETag': '"v1"'}, 'body': PRODUCTS}
+    
+    stub_server.routes['/products'] = [evict_then_304]
+    session = api_client.build_session(retries=0)
+    url = stub_server.url('/products')
+    
+    api_client.fetch_json(url, session=session)
+    expire(url)
+    
+    assert api_client.fetch_json(url, session=session) == PRODUCTS
+    third = stub_server.requests_to('/products')[2]
+    assert 'If-None-Match' not in third
+    assert http_cache.get_entry(url) is not None
+
+
+def test_fetch_many_returns_every_payload(stub_server, cache_dir):
+    stub_server.routes['/products'] = [{'status': 200, 'body': PRODUCTS}]
+    stub_server.routes['/categories'] = [{'status': 200, 'body': ['a', 'b']}]
+    session = api_client.build_session(retries=0)
+    
+    payloads = api_client.fetch_many({
+        'products': stub_server.url('/products'),
+        'categories': stub_server.url('/categories'),
+    }, session=session)
+    
+    assert list(payloads) == ['products', 'categories']
+    assert payloads == {'products': PRODUCTS, 'categories': ['a', 'b']}
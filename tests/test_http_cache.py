@@ -0,0 +1,133 @@
+"""Storage, revalidation and LRU eviction of etl.http_cache."""
+
+import os
+
+import pytest
+
+from etl import http_cache
+
+
+class FakeResponse:
+    """The parts of requests.Response that http_cache.store() reads."""
+    
+    def __init__(self, content: bytes, headers: dict = None):
+        self.content = content
+        self.headers = headers or {}
+
+
+def store(cache_dir, url: str, size: int = 1000, **headers) -> dict:
+    body = b'[' + b'0,' * (size // 2 - 1) + b'0]'
+    return http_cache.store(url, FakeResponse(body, headers), cache_dir=cache_dir)
+
+
+def set_last_used(cache_dir, url: str, timestamp: float):
+    meta_path, _ = http_cache._entry_paths(url, cache_dir)
+    os.utime(meta_path, (timestamp, timestamp))
+
+
+def cached_urls(cache_dir, urls: list) -> list:
+    return [url for url in urls if http_cache.get_entry(url, cache_dir)]
+
+
+def test_store_and_read_back(tmp_path):
+    cache_dir = str(tmp_path)
+    entry = store(cache_dir, 'http://stub/a', ETag='"v1"')
+    
+    assert entry['etag'] == '"v1"'
+    assert http_cache.get_entry('http://stub/a', cache_dir) == entry
+    assert http_cache.cached_payload(entry, cache_dir) == [0] * 500
+    assert http_cache.conditional_headers(entry) == {'If-None-Match': '"v1"'}
+
+
+def test_revalidate_refreshes_entry(tmp_path):
+    cache_dir = str(tmp_path)
+    entry = store(cache_dir, 'http://stub/a', ETag='"v1"')
+    entry['stored_at'] -= http_cache.API_CACHE_TTL_SEC + 1
+    assert not http_cache.is_fresh(entry)
+    
+    http_cache.revalidate(entry, cache_dir)
+    
+    assert http_cache.is_fresh(http_cache.get_entry('http://stub/a', cache_dir))
+
+
+def test_revalidated_entry_without_validators_is_not_parsed_again(tmp_path):
+    cache_dir = str(tmp_path)
+    entry = store(cache_dir, 'http://stub/a')
+    assert http_cache.cached_payload(entry, cache_dir) == [0] * 500
+    
+    # A re-parse would see the rewritten body
+    _, body_path = http_cache._entry_paths('http://stub/a', cache_dir)
+    with open(body_path, 'wb') as fh:
+        fh.write(b'[1]')
+    entry = http_cache.revalidate(entry, cache_dir)
+    
+    assert http_cache.cached_payload(entry, cache_dir) == [0] * 500
+
+
+def test_memo_keeps_only_the_latest_body_per_url(tmp_path):
+    cache_dir = str(tmp_path)
+    http_cache.clear(cache_dir)
+    for version in range(3):
+        entry = store(cache_dir, 'http://stub/a', size=10 + 2 * version, ETag=f'"v{version}"')
+        assert http_cache.cached_payload(entry, cache_dir) == [0] * (5 + version)
+    
+    assert list(http_cache._decoded) == ['http://stub/a']
+    assert http_cache._decoded['http://stub/a'][0] == '"v2"'
+
+
+def test_evicted_entry_is_a_cache_miss(tmp_path):
+    cache_dir = str(tmp_path)
+    entry = store(cache_dir, 'http://stub/a')
+    http_cache.cached_payload(entry, cache_dir)
+    
+    http_cache.evict(max_mb=0, cache_dir=cache_dir)
+    
+    assert 'http://stub/a' not in http_cache._decoded
+    with pytest.raises(FileNotFoundError):
+        http_cache.cached_payload(entry, cache_dir)
+
+
+def test_evicts_least_recently_used_entries(tmp_path):
+    cache_dir = str(tmp_path)
+    urls = ['http://stub/a', 'http://stub/b', 'http://stub/c']
+    for i, url in enumerate(urls):
+        store(cache_dir, url)
+        set_last_used(cache_dir, url, 1_000_000 + i)
+    
+    # Reading 'a' makes it the most recently used entry
+    http_cache.cached_payload(http_cache.get_entry(urls[0], cache_dir), cache_dir)
+    
+    entry_bytes = sum(
+        os.path.getsize(path) for path in http_cache._entry_paths(urls[0], cache_dir)
+    )
+    evicted = http_cache.evict(max_mb=2.5 * entry_bytes / (1024 * 1024), cache_dir=cache_dir)
+    
+    assert evicted == 1
+    assert cached_urls(cache_dir, urls) == ['http://stub/a', 'http://stub/c']
+
+
+def test_store_evicts_beyond_max_size(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path)
+    urls = [f"http://stub/{i}" for i in range(4)]
+    for i, url in enumerate(urls[:3]):
+        store(cache_dir, url, size=200_000)
+        set_last_used(cache_dir, url, 1_000_000 + i)
+    
+    evict = http_cache.evict
+    monkeypatch.setattr(
+        http_cache, 'evict', lambda cache_dir: evict(max_mb=0.5, cache_dir=cache_dir)
+    )
+    store(cache_dir, urls[3], size=200_000)
+    
+    # 4 x ~200 KB against a 0.5 MB budget: the two oldest entries go
+    assert cached_urls(cache_dir, urls) == urls[2:]
+
+
+def test_clear_drops_everything(tmp_path):
+    cache_dir = str(tmp_path)
+    store(cache_dir, 'http://stub/a')
+    
+    http_cache.clear(cache_dir)
+    
+    assert os.listdir(cache_dir) == []
+    assert http_cache.get_entry('http://stub/a', cache_dir) is None